@@ -0,0 +1,244 @@
+"""
+Fixtures and command line options for the benchmark suite.
+
+Benchmarks reuse the fixtures of the test suite, so they run headless in the
+same way tests do. Run them with:
+
+    python -m pytest benchmarks --benchmark-json=results.json
+
+and compare against a previous run with:
+
+    python -m pytest benchmarks --benchmark-compare=baseline.json
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import tilia.constants as constants_module
+from benchmarks.synthetic import SessionSizes, get_duration
+
+# Fixtures are imported explicitly, as `pytest_plugins`
+# can only be declared in the top-level conftest.
+from tests.conftest import (  # noqa: F401
+    qapplication,
+    tilia,
+    tilia_state,
+    tls,
+    tluis,
+    qtui,
+    cleanup_requests,
+    use_test_settings,
+    use_test_logger,
+    user_actions,
+)
+from tests.timelines.beat.fixtures import beat_tl, beat_tlui  # noqa: F401
+from tests.timelines.harmony.fixtures import harmony_tl, harmony_tlui  # noqa: F401
+from tests.timelines.hierarchy.fixtures import (  # noqa: F401
+    hierarchy_tl,
+    hierarchy_tlui,
+)
+from tests.timelines.marker.fixtures import marker_tl, marker_tlui  # noqa: F401
+from tests.timelines.score.fixtures import score_tl, score_tlui  # noqa: F401
+
+DEFAULT_SCALE = 0.05
+DEFAULT_MAX_REGRESSION = 1.5
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-scale",
+        type=float,
+        default=DEFAULT_SCALE,
+        help=(
+            "Fraction of the full synthetic session sizes to use "
+            f"(default: {DEFAULT_SCALE}). Use 1 for full-size sessions "
+            f"({SessionSizes().to_dict()})."
+        ),
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Path where benchmark results will be written as JSON.",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        default=None,
+        help="Path to a JSON file with results of a previous run to compare against.",
+    )
+    group.addoption(
+        "--benchmark-max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help=(
+            "Maximum ratio between current and baseline times before a "
+            f"benchmark is considered a regression (default: {DEFAULT_MAX_REGRESSION})."
+        ),
+    )
+
+
+class BenchmarkRecorder:
+    def __init__(self, scale: float, sizes: SessionSizes):
+        self.scale = scale
+        self.sizes = sizes
+        self.results: dict[str, dict] = {}
+
+    @contextmanager
+    def __call__(self, name: str, n: int = 1):
+        """Times the body of the `with` statement and records it under `name`."""
+        self._validate_name(name)
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        self.results[name] = {"seconds": elapsed, "n": n}
+
+    @contextmanager
+    def memory(self, name: str, n: int = 1):
+        """
+        Records, under `name`, the memory allocated by the body of the `with`
+        statement that is still held when it ends. Only Python allocations
+        are traced, so memory held by Qt objects is not included.
+        """
+        self._validate_name(name)
+        tracemalloc.start()
+        try:
+            yield
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.results[name] = {"bytes": allocated, "n": n}
+
+    def _validate_name(self, name: str) -> None:
+        if name in self.results:
+            raise ValueError(f"Benchmark '{name}' was already recorded.")
+
+    def to_dict(self) -> dict:
+        return {
+            "meta": {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "tilia_version": constants_module.VERSION,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "scale": self.scale,
+                "sizes": self.sizes.to_dict(),
+            },
+            "results": self.results,
+        }
+
+
+def compare(current: dict, baseline: dict, max_regression: float) -> list[dict]:
+    """
+    Returns a row for each benchmark present in both `current` and
+    `baseline`, with the ratio between the current and the baseline time,
+    or memory, for memory benchmarks.
+    """
+    rows = []
+    for name, result in sorted(current["results"].items()):
+        if name not in baseline["results"]:
+            continue
+        metric = get_metric(result)
+        previous = baseline["results"][name][metric]
+        ratio = result[metric] / previous if previous else float("inf")
+        rows.append(
+            {
+                "name": name,
+                "metric": metric,
+                "baseline": previous,
+                "current": result[metric],
+                "ratio": ratio,
+                "is_regression": ratio > max_regression,
+            }
+        )
+    return rows
+
+
+def get_metric(result: dict) -> str:
+    return "bytes" if "bytes" in result else "seconds"
+
+
+def format_result(value: float, metric: str) -> str:
+    if metric == "bytes":
+        return f"{value / 2**20:.2f}MiB"
+    return f"{value:.4f}s"
+
+
+def load_baseline(path: str, scale: float) -> dict:
+    baseline = json.loads(Path(path).read_text(encoding="utf-8"))
+    if baseline["meta"]["scale"] != scale:
+        raise pytest.UsageError(
+            f"Can't compare with '{path}': it was recorded with scale "
+            f"{baseline['meta']['scale']}, but current scale is {scale}."
+        )
+    return baseline
+
+
+def pytest_configure(config):
+    scale = config.getoption("--benchmark-scale")
+    config._benchmark_recorder = BenchmarkRecorder(scale, SessionSizes().scaled(scale))
+    config._benchmark_baseline = None
+    if path := config.getoption("--benchmark-compare"):
+        config._benchmark_baseline = load_baseline(path, scale)
+    config._benchmark_comparison = []
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    recorder: BenchmarkRecorder = config._benchmark_recorder
+    data = recorder.to_dict()
+
+    if path := config.getoption("--benchmark-json"):
+        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    if baseline := config._benchmark_baseline:
+        rows = compare(data, baseline, config.getoption("--benchmark-max-regression"))
+        config._benchmark_comparison = rows
+        if any(row["is_regression"] for row in rows):
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    recorder: BenchmarkRecorder = config._benchmark_recorder
+    if not recorder.results:
+        return
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"scale={recorder.scale} sizes={recorder.sizes.to_dict()}"
+    )
+    comparison = {row["name"]: row for row in config._benchmark_comparison}
+    for name, result in sorted(recorder.results.items()):
+        metric = get_metric(result)
+        line = (
+            f"{name:<45} {format_result(result[metric], metric):>11}  n={result['n']}"
+        )
+        if row := comparison.get(name):
+            baseline = format_result(row["baseline"], metric)
+            line += f"  baseline={baseline}  x{row['ratio']:.2f}"
+            if row["is_regression"]:
+                line += "  REGRESSION"
+        terminalreporter.write_line(line)
+
+
+@pytest.fixture
+def benchmark(request) -> BenchmarkRecorder:
+    return request.config._benchmark_recorder
+
+
+@pytest.fixture
+def sizes(benchmark) -> SessionSizes:
+    return benchmark.sizes
+
+
+@pytest.fixture
+def long_media(tilia_state, sizes):  # noqa: F811
+    """Sets a media duration that fits the synthetic session."""
+    tilia_state.set_duration(get_duration(sizes), scale_timelines="no")
@@ -0,0 +1,235 @@
+"""
+Deterministic generators of synthetic TiLiA sessions.
+
+Every generator returns data in the same shape as the `components` dict of
+a timeline in a .tla file, so it can be passed directly to
+`Timelines.create_timeline` or written to disk as part of a file. Generators
+use a seeded `random.Random`, so a given size always produces the same data.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, fields
+
+SEED = 1234
+
+CLEF_PARAMS = {
+    "treble": {"line_number": -1, "step": 4, "octave": 4, "icon": "clef-treble.svg"},
+    "bass": {"line_number": 1, "step": 3, "octave": 3, "icon": "clef-bass.svg"},
+}
+
+
+@dataclass(frozen=True)
+class SessionSizes:
+    beats: int = 20_000
+    hierarchies: int = 5_000
+    markers: int = 10_000
+    notes: int = 30_000
+    harmonies: int = 3_000
+
+    def scaled(self, factor: float) -> SessionSizes:
+        return SessionSizes(
+            **{
+                f.name: max(1, round(getattr(self, f.name) * factor))
+                for f in fields(self)
+            }
+        )
+
+    def to_dict(self) -> dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def get_duration(sizes: SessionSizes) -> float:
+    """A media duration long enough to fit every generated component."""
+    return max(sizes.beats * 0.5, sizes.notes * 0.25, 60.0) + 1
+
+
+def _component(kind: str, **attrs) -> dict:
+    return attrs | {"kind": kind}
+
+
+def beats(n: int, interval: float = 0.5) -> dict[int, dict]:
+    rng = random.Random(SEED)
+    result = {}
+    for i in range(n):
+        jitter = rng.uniform(-0.05, 0.05) * interval
+        result[i] = _component("BEAT", time=i * interval + jitter + interval / 2)
+    return result
+
+
+def markers(n: int, duration: float) -> dict[int, dict]:
+    rng = random.Random(SEED)
+    times = sorted({round(rng.uniform(0, duration), 6) for _ in range(n * 2)})[:n]
+    return {
+        i: _component(
+            "MARKER",
+            time=time,
+            label=f"m{i}",
+            comments="",
+            color=None,
+        )
+        for i, time in enumerate(times)
+    }
+
+
+def hierarchies(n: int, duration: float, fan_out: int = 4) -> dict[int, dict]:
+    """
+    Generates about `n` nested hierarchies. Level 1 units tile the whole
+    duration and every `fan_out` consecutive units of a level are grouped
+    under a single unit one level above, until a level has a single unit.
+    """
+    rng = random.Random(SEED)
+    leaf_count = max(1, round(n * (fan_out - 1) / fan_out))
+    boundaries = sorted(rng.uniform(0, duration) for _ in range(leaf_count - 1))
+    boundaries = [0.0] + boundaries + [duration]
+    level_units = list(zip(boundaries[:-1], boundaries[1:]))
+
+    result = {}
+    level = 1
+    while True:
+        for start, end in level_units:
+            result[len(result)] = _component(
+                "HIERARCHY",
+                start=start,
+                end=end,
+                pre_start=start,
+                post_end=end,
+                level=level,
+                label=f"h{len(result)}",
+                color="",
+                formal_type=rng.choice(["", "sentence", "period"]),
+                formal_function="",
+                comments="",
+            )
+        if len(level_units) == 1:
+            break
+        level_units = [
+            (group[0][0], group[-1][1])
+            for group in (
+                level_units[i : i + fan_out]
+                for i in range(0, len(level_units), fan_out)
+            )
+        ]
+        level += 1
+
+    return result
+
+
+def harmonies(n: int, duration: float) -> dict[int, dict]:
+    rng = random.Random(SEED)
+    interval = duration / (n + 1)
+    return {
+        i: _component(
+            "HARMONY",
+            time=(i + 1) * interval,
+            step=rng.randrange(7),
+            accidental=rng.choice([-1, 0, 0, 0, 1]),
+            quality=rng.choice(["major", "minor", "dominant-seventh"]),
+            inversion=0,
+            applied_to=0,
+            level=1,
+            display_mode="chord",
+            custom_text="",
+            custom_text_font_type="analytic",
+            comments="",
+        )
+        for i in range(n)
+    }
+
+
+def score(
+    notes: int, staff_count: int = 4, note_length: float = 0.25
+) -> dict[int, dict]:
+    """
+    Generates staves, clefs and a time signature for each staff, plus `notes`
+    notes spread evenly across the staves.
+    """
+    rng = random.Random(SEED)
+    result = {}
+
+    def add(component: dict):
+        result[len(result)] = component
+
+    for staff_index in range(staff_count):
+        add(_component("STAFF", index=staff_index, line_count=5))
+        clef = CLEF_PARAMS["treble" if staff_index % 2 == 0 else "bass"]
+        add(_component("CLEF", staff_index=staff_index, time=0.0, **clef))
+        add(
+            _component(
+                "TIME_SIGNATURE",
+                staff_index=staff_index,
+                time=0.0,
+                numerator=4,
+                denominator=4,
+            )
+        )
+
+    notes_per_staff = max(1, notes // staff_count)
+    for i in range(notes):
+        staff_index = i // notes_per_staff % staff_count
+        start = (i % notes_per_staff) * note_length
+        add(
+            _component(
+                "NOTE",
+                start=start,
+                end=start + note_length,
+                step=rng.randrange(7),
+                accidental=rng.choice([-1, 0, 0, 1]),
+                octave=rng.randrange(3, 6),
+                staff_index=staff_index,
+                color=None,
+                comments="",
+                display_accidental=False,
+            )
+        )
+
+    return result
+
+
+def timeline(kind: str, components: dict, ordinal: int, **attrs) -> dict:
+    return {
+        "kind": kind,
+        "name": kind.lower(),
+        "is_visible": True,
+        "ordinal": ordinal,
+        "components": components,
+    } | attrs
+
+
+def session(sizes: SessionSizes) -> dict:
+    """Data of a .tla file with a timeline of each benchmarked kind."""
+    duration = get_duration(sizes)
+    timelines = [
+        timeline("BEAT_TIMELINE", beats(sizes.beats), 1, beat_pattern=[4], height=50),
+        timeline(
+            "HIERARCHY_TIMELINE",
+            hierarchies(sizes.hierarchies, duration),
+            2,
+            height=200,
+        ),
+        timeline("MARKER_TIMELINE", markers(sizes.markers, duration), 3, height=50),
+        timeline(
+            "HARMONY_TIMELINE",
+            harmonies(sizes.harmonies, duration),
+            4,
+            level_count=1,
+            visible_level_count=1,
+        ),
+        timeline("SCORE_TIMELINE", score(sizes.notes), 5, height=200),
+    ]
+    return {
+        "file_path": "",
+        "media_path": "",
+        "media_metadata": {"title": "Benchmark", "media length": duration},
+        "timelines": {str(i): tl for i, tl in enumerate(timelines)},
+        "app_name": "TiLiA",
+        "version": "0.0.0",
+    }
+
+
+def to_csv(components: dict[int, dict], columns: list[str]) -> str:
+    lines = [",".join(columns)]
+    for component in components.values():
+        lines.append(",".join(str(component[col]) for col in columns))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from benchmarks import synthetic
+from tests.mock import Serve
+from tilia.requests import Get, Post, post
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+@pytest.fixture
+def session_path(tmp_path, sizes):
+    path = tmp_path / "session.tla"
+    path.write_text(json.dumps(synthetic.session(sizes)), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def open_session(tilia, tls, session_path):
+    with Serve(Get.FROM_USER_SHOULD_SAVE_CHANGES, (True, False)):
+        post(Post.FILE_OPEN, session_path)
+
+
+def component_count(tls) -> int:
+    return sum(len(tl) for tl in tls if tl.component_manager is not None)
+
+
+class TestFile:
+    def test_open(self, tilia, tls, session_path, benchmark):
+        with Serve(Get.FROM_USER_SHOULD_SAVE_CHANGES, (True, False)):
+            with benchmark("file.open"):
+                post(Post.FILE_OPEN, session_path)
+
+        assert len(tls) == 6  # includes slider timeline
+
+    def test_save(self, tls, open_session, tmp_path, benchmark):
+        path = tmp_path / "saved.tla"
+        with benchmark("file.save", component_count(tls)):
+            post(Post.REQUEST_SAVE_TO_PATH, path)
+
+        assert path.exists()
+
+    def test_export_json(self, tls, open_session, tmp_path, benchmark):
+        path = tmp_path / "exported.json"
+        with benchmark("file.export_json", component_count(tls)):
+            post(Post.FILE_EXPORT, path, "json")
+
+        assert path.exists()
+
+    def test_get_app_state(self, tilia, tls, open_session, benchmark):
+        with benchmark("file.get_app_state", component_count(tls)):
+            tilia.get_app_state()
+
+
+class TestUndoRedo:
+    @pytest.mark.parametrize(
+        "kind,tl_kind",
+        [
+            ("beat", TimelineKind.BEAT_TIMELINE),
+            ("hierarchy", TimelineKind.HIERARCHY_TIMELINE),
+            ("marker", TimelineKind.MARKER_TIMELINE),
+            ("score", TimelineKind.SCORE_TIMELINE),
+        ],
+    )
+    def test_undo_redo_clear(
+        self, kind, tl_kind, tls, tilia_state, open_session, benchmark
+    ):
+        timeline = tls.get_timeline_by_attr("KIND", tl_kind)
+        count = len(timeline)
+        post(Post.APP_RECORD_STATE, "benchmark start")
+        timeline.clear()
+        post(Post.APP_RECORD_STATE, "benchmark clear")
+
+        with benchmark(f"{kind}.undo_clear", count):
+            post(Post.EDIT_UNDO)
+        assert len(timeline) == count
+
+        with benchmark(f"{kind}.redo_clear", count):
+            post(Post.EDIT_REDO)
+        assert len(timeline) == 0
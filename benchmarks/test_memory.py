@@ -0,0 +1,51 @@
+import pytest
+
+from benchmarks import synthetic
+from tilia.timelines.audiowave.components import AmplitudeBar
+from tilia.timelines.beat.components import Beat
+from tilia.timelines.marker.components import Marker
+from tilia.timelines.pdf.components import PdfMarker
+from tilia.timelines.score.components import Note
+
+
+def amplitude_bars(n: int, length: float = 0.05) -> dict[int, dict]:
+    return {
+        i: {"start": i * length, "end": (i + 1) * length, "amplitude": (i % 10) / 10}
+        for i in range(n)
+    }
+
+
+def pdf_markers(n: int) -> dict[int, dict]:
+    return {i: {"time": float(i), "page_number": i + 1} for i in range(n)}
+
+
+def notes(n: int) -> dict[int, dict]:
+    return {
+        id: data for id, data in synthetic.score(n).items() if data["kind"] == "NOTE"
+    }
+
+
+@pytest.fixture
+def components(sizes):
+    duration = synthetic.get_duration(sizes)
+    return {
+        Beat: synthetic.beats(sizes.beats),
+        Marker: synthetic.markers(sizes.markers, duration),
+        Note: notes(sizes.notes),
+        AmplitudeBar: amplitude_bars(sizes.notes),
+        PdfMarker: pdf_markers(sizes.markers),
+    }
+
+
+class TestMemory:
+    @pytest.mark.parametrize("cls", [Beat, Marker, Note, AmplitudeBar, PdfMarker])
+    def test_components(self, cls, components, benchmark):
+        """
+        Memory held by the components themselves. They are created without
+        a timeline, as they only keep a reference to it.
+        """
+        data = components[cls]
+        with benchmark.memory(f"{cls.__name__.lower()}.memory", len(data)):
+            created = [cls(None, id, **attrs) for id, attrs in data.items()]
+
+        assert len(created) == len(data)
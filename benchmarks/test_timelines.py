@@ -0,0 +1,145 @@
+import pytest
+
+from benchmarks import synthetic
+from tilia.parsers.csv.beat import beats_from_csv
+from tilia.parsers.csv.hierarchy import import_by_time as hierarchies_by_time
+from tilia.parsers.csv.marker import import_by_time as markers_by_time
+from tilia.requests import get, Get
+from tilia.timelines.component_kinds import ComponentKind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+def create_all(timeline, components: dict[int, dict]) -> None:
+    for data in components.values():
+        data = data.copy()
+        kind = ComponentKind[data.pop("kind")]
+        component, reason = timeline.create_component(kind, **data)
+        if not component:
+            raise ValueError(f"Unable to create {kind.name}: {reason}")
+
+
+@pytest.fixture
+def components(sizes):
+    duration = synthetic.get_duration(sizes)
+    return {
+        "beat": synthetic.beats(sizes.beats),
+        "hierarchy": synthetic.hierarchies(sizes.hierarchies, duration),
+        "marker": synthetic.markers(sizes.markers, duration),
+        "harmony": synthetic.harmonies(sizes.harmonies, duration),
+        "score": synthetic.score(sizes.notes),
+    }
+
+
+class TestCreate:
+    @pytest.mark.parametrize(
+        "kind", ["beat", "hierarchy", "marker", "harmony", "score"]
+    )
+    def test_create(self, kind, request, components, benchmark, long_media):
+        timeline = request.getfixturevalue(f"{kind}_tl")
+        with benchmark(f"{kind}.create", len(components[kind])):
+            create_all(timeline, components[kind])
+
+        assert len(timeline) == len(components[kind])
+
+
+class TestDeserialize:
+    @pytest.mark.parametrize(
+        "kind,tl_kind",
+        [
+            ("beat", TimelineKind.BEAT_TIMELINE),
+            ("hierarchy", TimelineKind.HIERARCHY_TIMELINE),
+            ("marker", TimelineKind.MARKER_TIMELINE),
+            ("harmony", TimelineKind.HARMONY_TIMELINE),
+            ("score", TimelineKind.SCORE_TIMELINE),
+        ],
+    )
+    def test_deserialize(self, kind, tl_kind, tls, components, benchmark, long_media):
+        with benchmark(f"{kind}.deserialize", len(components[kind])):
+            timeline = tls.create_timeline(tl_kind, components[kind])
+
+        assert len(timeline) == len(components[kind])
+
+
+class TestImportFromCSV:
+    def test_beats(self, beat_tl, components, benchmark, tmp_path, long_media):
+        path = tmp_path / "beats.csv"
+        path.write_text(synthetic.to_csv(components["beat"], ["time"]))
+
+        with benchmark("beat.import_csv", len(components["beat"])):
+            success, errors = beats_from_csv(beat_tl, path)
+
+        assert success and not errors
+
+    def test_markers(self, marker_tl, components, benchmark, tmp_path, long_media):
+        path = tmp_path / "markers.csv"
+        path.write_text(synthetic.to_csv(components["marker"], ["time", "label"]))
+
+        with benchmark("marker.import_csv", len(components["marker"])):
+            success, errors = markers_by_time(marker_tl, path)
+
+        assert success and not errors
+
+    def test_hierarchies(
+        self, hierarchy_tl, components, benchmark, tmp_path, long_media
+    ):
+        path = tmp_path / "hierarchies.csv"
+        path.write_text(
+            synthetic.to_csv(
+                components["hierarchy"], ["start", "end", "level", "label"]
+            )
+        )
+
+        with benchmark("hierarchy.import_csv", len(components["hierarchy"])):
+            success, errors = hierarchies_by_time(hierarchy_tl, path)
+
+        assert success and not errors
+
+
+class TestMetricPosition:
+    @pytest.fixture
+    def beat_tl_with_beats(self, tls, components, long_media):
+        return tls.create_timeline(
+            TimelineKind.BEAT_TIMELINE, components["beat"], beat_pattern=[4]
+        )
+
+    @pytest.fixture
+    def query_times(self, components):
+        times = [b["time"] for b in components["beat"].values()]
+        # midpoints between beats, so no lookup hits a beat exactly
+        return [(a + b) / 2 for a, b in zip(times, times[1:])]
+
+    def test_metric_position_by_time(self, beat_tl_with_beats, query_times, benchmark):
+        with benchmark("metric_position.by_time", len(query_times)):
+            for time in query_times:
+                get(Get.METRIC_POSITION, time)
+
+    def test_metric_fraction_by_time(self, beat_tl_with_beats, query_times, benchmark):
+        with benchmark("metric_position.fraction_by_time", len(query_times)):
+            for time in query_times:
+                beat_tl_with_beats.get_metric_fraction_by_time(time)
+
+    def test_time_by_measure(self, beat_tl_with_beats, benchmark):
+        measures = beat_tl_with_beats.measure_numbers
+        with benchmark("metric_position.time_by_measure", len(measures)):
+            for measure in measures:
+                beat_tl_with_beats.get_time_by_measure(measure, 0.5)
+
+
+class TestScaleCrop:
+    KINDS = [
+        ("hierarchy", TimelineKind.HIERARCHY_TIMELINE),
+        ("marker", TimelineKind.MARKER_TIMELINE),
+        ("score", TimelineKind.SCORE_TIMELINE),
+    ]
+
+    @pytest.mark.parametrize("kind,tl_kind", KINDS)
+    def test_scale(self, kind, tl_kind, tls, components, benchmark, long_media):
+        tls.create_timeline(tl_kind, components[kind])
+        with benchmark(f"{kind}.scale", len(components[kind])):
+            tls.scale_timeline_components(0.5)
+
+    @pytest.mark.parametrize("kind,tl_kind", KINDS)
+    def test_crop(self, kind, tl_kind, tls, components, benchmark, long_media):
+        tls.create_timeline(tl_kind, components[kind])
+        with benchmark(f"{kind}.crop", len(components[kind])):
+            tls.crop_timeline_components(get(Get.MEDIA_DURATION) / 2)
@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks import synthetic
+from tilia.requests import Post, post
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
+@pytest.mark.parametrize(
+    "kind,tl_kind",
+    [
+        ("beat", TimelineKind.BEAT_TIMELINE),
+        ("hierarchy", TimelineKind.HIERARCHY_TIMELINE),
+        ("marker", TimelineKind.MARKER_TIMELINE),
+        ("harmony", TimelineKind.HARMONY_TIMELINE),
+        ("score", TimelineKind.SCORE_TIMELINE),
+    ],
+)
+def test_create_elements(kind, tl_kind, tls, tluis, sizes, benchmark, long_media):
+    duration = synthetic.get_duration(sizes)
+    components = {
+        "beat": lambda: synthetic.beats(sizes.beats),
+        "hierarchy": lambda: synthetic.hierarchies(sizes.hierarchies, duration),
+        "marker": lambda: synthetic.markers(sizes.markers, duration),
+        "harmony": lambda: synthetic.harmonies(sizes.harmonies, duration),
+        "score": lambda: synthetic.score(sizes.notes),
+    }[kind]()
+
+    with benchmark(f"{kind}.ui_create", len(components)):
+        timeline = tls.create_timeline(tl_kind, components)
+
+    assert len(tluis.get_timeline_ui(timeline.id)) == len(components)
+
+
+def test_zoom(tls, tluis, sizes, benchmark, long_media):
+    duration = synthetic.get_duration(sizes)
+    tls.create_timeline(
+        TimelineKind.HIERARCHY_TIMELINE,
+        synthetic.hierarchies(sizes.hierarchies, duration),
+    )
+    tls.create_timeline(
+        TimelineKind.MARKER_TIMELINE, synthetic.markers(sizes.markers, duration)
+    )
+
+    with benchmark("ui.zoom_in_out", sizes.hierarchies + sizes.markers):
+        post(Post.VIEW_ZOOM_IN)
+        post(Post.VIEW_ZOOM_OUT)
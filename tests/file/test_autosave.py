@@ -0,0 +1,72 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tilia import dirs
+from tilia.file.autosave import AutoSaver
+from tilia.requests import Post, post, stop_listening_to_all
+
+AUTOSAVE_SETTINGS = {"interval_(seconds)": 0, "max_stored_files": 2}
+
+
+@pytest.fixture
+def autosaver(tilia, tmp_path, monkeypatch):
+    monkeypatch.setattr(dirs, "autosaves_path", tmp_path)
+    with patch("tilia.file.autosave.settings") as settings:
+        settings.get.side_effect = lambda _, setting: AUTOSAVE_SETTINGS[setting]
+        autosaver_ = AutoSaver()
+        yield autosaver_
+    stop_listening_to_all(autosaver_)
+
+
+class TestAutoSaver:
+    def test_saves_recorded_state(self, autosaver, marker_tl, tmp_path):
+        marker_tl.create_marker(0)
+        post(Post.APP_RECORD_STATE, "test")
+
+        autosaver.save_snapshot()
+
+        paths = list(tmp_path.iterdir())
+        assert len(paths) == 1
+        data = json.loads(paths[0].read_text(encoding="utf-8"))
+        timeline = data["timelines"][str(marker_tl.id)]
+        assert len(timeline["components"]) == 1
+
+    def test_does_not_save_without_new_state(self, autosaver, tmp_path):
+        autosaver.save_snapshot()
+
+        assert not list(tmp_path.iterdir())
+
+    def test_does_not_save_equal_state(self, autosaver, marker_tl, tmp_path):
+        post(Post.APP_RECORD_STATE, "test")
+        autosaver.save_snapshot()
+        post(Post.APP_RECORD_STATE, "test")
+        with patch("tilia.file.autosave.write_tilia_file_to_disk") as write_mock:
+            autosaver.save_snapshot()
+
+        write_mock.assert_not_called()
+
+    def test_deletes_older_autosaves(self, autosaver, marker_tl, tmp_path):
+        autosaver._autosave_paths = [tmp_path / "old1.tla", tmp_path / "old2.tla"]
+        for path in autosaver._autosave_paths:
+            path.write_text("")
+
+        post(Post.APP_RECORD_STATE, "test")
+        autosaver.save_snapshot()
+
+        paths = list(tmp_path.iterdir())
+        assert len(paths) == 2
+        assert tmp_path / "old1.tla" not in paths
+
+    def test_saves_state_recorded_before_clear(self, autosaver, score_tl, tmp_path):
+        score_tl.svg_data = "<svg>score</svg>"
+        post(Post.APP_RECORD_STATE, "test")
+        # discards the blob, as no timeline references it anymore
+        post(Post.APP_CLEAR)
+
+        autosaver.save_snapshot()
+
+        (path,) = tmp_path.iterdir()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["timelines"][str(score_tl.id)]["svg_data"] == "<svg>score</svg>"
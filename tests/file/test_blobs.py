@@ -0,0 +1,21 @@
+from tilia.file import blobs
+from tilia.requests import Post, post
+
+
+class TestDiscardUnreferenced:
+    def test_unreferenced_blobs_are_discarded(self):
+        kept = blobs.store("<svg>kept</svg>")
+        discarded = blobs.store("<svg>discarded</svg>")
+
+        blobs.discard_unreferenced({"0": {"svg_hash": kept}, "1": {"height": 10}})
+
+        assert blobs.load(kept) == "<svg>kept</svg>"
+        assert discarded not in blobs._blobs
+
+    def test_blobs_are_discarded_when_app_is_cleared(self, score_tl):
+        score_tl.svg_data = "<svg>score</svg>"
+        key = score_tl.svg_hash
+
+        post(Post.APP_CLEAR)
+
+        assert key not in blobs._blobs
@@ -0,0 +1,186 @@
+import json
+import os
+
+import pytest
+
+from tilia.file.corpus import Corpus, MetricPositionCalculator
+
+
+def get_beat_timeline_state(times, beats_in_measure, measure_numbers):
+    return {
+        "kind": "BEAT_TIMELINE",
+        "name": "",
+        "ordinal": 1,
+        "beat_pattern": [2],
+        "beats_in_measure": beats_in_measure,
+        "measure_numbers": measure_numbers,
+        "measures_to_force_display": [],
+        "components": {
+            str(i): {"time": time, "kind": "BEAT"} for i, time in enumerate(times)
+        },
+    }
+
+
+def get_hierarchy_timeline_state(hierarchies):
+    return {
+        "kind": "HIERARCHY_TIMELINE",
+        "name": "Form",
+        "ordinal": 2,
+        "components": {
+            str(100 + i): {"kind": "HIERARCHY", "level": 1, **attrs}
+            for i, attrs in enumerate(hierarchies)
+        },
+    }
+
+
+def write_tla(path, timelines):
+    data = {
+        "file_path": str(path),
+        "media_path": "media.mp3",
+        "media_metadata": {"title": path.stem, "media length": 10},
+        "timelines": {str(i): state for i, state in enumerate(timelines)},
+        "timelines_hash": "",
+        "app_name": "TiLiA",
+        "version": "0.0.0",
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    with Corpus(tmp_path / "corpus.sqlite") as _corpus:
+        yield _corpus
+
+
+@pytest.fixture
+def tla_dir(tmp_path):
+    path = tmp_path / "tla"
+    path.mkdir()
+    return path
+
+
+class TestMetricPositionCalculator:
+    @pytest.fixture
+    def calculator(self):
+        return MetricPositionCalculator(
+            get_beat_timeline_state([0, 1, 2, 3, 4], [2, 3], [1, 2])
+        )
+
+    @pytest.mark.parametrize(
+        "time,expected",
+        [(0, (1, 1)), (1.5, (1, 2.5)), (2, (2, 1)), (3.25, (2, 2.25)), (10, (2, 3))],
+    )
+    def test_get(self, calculator, time, expected):
+        assert calculator.get(time) == expected
+
+    def test_get_before_first_beat(self, calculator):
+        assert calculator.get(-1) == (None, None)
+
+
+class TestCorpus:
+    def test_update_indexes_directory(self, corpus, tla_dir):
+        write_tla(tla_dir / "a.tla", [])
+        write_tla(tla_dir / "b.tla", [])
+        (tla_dir / "c.txt").write_text("")
+
+        result = corpus.update([tla_dir])
+
+        assert len(result.indexed) == 2
+        _, rows = corpus.query("SELECT title FROM files ORDER BY title")
+        assert rows == [("a",), ("b",)]
+
+    def test_query_components_across_files(self, corpus, tla_dir):
+        write_tla(
+            tla_dir / "a.tla",
+            [get_hierarchy_timeline_state([{"start": 0, "end": 1, "label": "A"}])],
+        )
+        write_tla(
+            tla_dir / "b.tla",
+            [
+                get_hierarchy_timeline_state(
+                    [
+                        {"start": 0, "end": 1, "label": "A"},
+                        {"start": 1, "end": 2, "label": "B"},
+                    ]
+                )
+            ],
+        )
+        corpus.update([tla_dir])
+
+        headers, rows = corpus.query(
+            "SELECT title, COUNT(*) FROM hierarchy JOIN files ON file_id = files.id"
+            " WHERE label = ? GROUP BY title ORDER BY title",
+            ("A",),
+        )
+
+        assert headers == ["title", "COUNT(*)"]
+        assert rows == [("a", 1), ("b", 1)]
+
+    def test_metric_positions(self, corpus, tla_dir):
+        write_tla(
+            tla_dir / "a.tla",
+            [
+                get_beat_timeline_state([0, 1, 2, 3], [2, 2], [1, 2]),
+                get_hierarchy_timeline_state([{"start": 0.5, "end": 3}]),
+            ],
+        )
+        corpus.update([tla_dir])
+
+        _, rows = corpus.query(
+            "SELECT measure, beat, end_measure, end_beat FROM hierarchy"
+        )
+
+        assert rows == [(1, 1.5, 2, 2)]
+
+    def test_unchanged_files_are_not_reindexed(self, corpus, tla_dir):
+        path = write_tla(tla_dir / "a.tla", [])
+        corpus.update([tla_dir])
+
+        result = corpus.update([tla_dir])
+        assert result.unchanged == [str(path.resolve())]
+
+        # touching a file doesn't change its contents
+        os.utime(path, (0, 0))
+        result = corpus.update([tla_dir])
+        assert result.unchanged == [str(path.resolve())]
+
+    def test_changed_files_are_reindexed(self, corpus, tla_dir):
+        path = write_tla(
+            tla_dir / "a.tla",
+            [get_hierarchy_timeline_state([{"start": 0, "end": 1, "label": "A"}])],
+        )
+        corpus.update([tla_dir])
+
+        write_tla(
+            path,
+            [get_hierarchy_timeline_state([{"start": 0, "end": 1, "label": "B"}])],
+        )
+        os.utime(path, (1, 1))
+        result = corpus.update([tla_dir])
+
+        assert result.indexed == [str(path.resolve())]
+        assert corpus.query("SELECT label FROM hierarchy")[1] == [("B",)]
+        assert corpus.query("SELECT COUNT(*) FROM files")[1] == [(1,)]
+
+    def test_deleted_files_are_removed(self, corpus, tla_dir):
+        path = write_tla(
+            tla_dir / "a.tla",
+            [get_hierarchy_timeline_state([{"start": 0, "end": 1}])],
+        )
+        corpus.update([tla_dir])
+
+        path.unlink()
+        result = corpus.update([tla_dir])
+
+        assert result.removed == [str(path.resolve())]
+        assert corpus.query("SELECT COUNT(*) FROM hierarchy")[1] == [(0,)]
+        assert corpus.query("SELECT COUNT(*) FROM files")[1] == [(0,)]
+
+    def test_invalid_file_is_reported(self, corpus, tla_dir):
+        (tla_dir / "a.tla").write_text("{}")
+
+        result = corpus.update([tla_dir])
+
+        assert len(result.errors) == 1
+        assert corpus.query("SELECT COUNT(*) FROM files")[1] == [(0,)]
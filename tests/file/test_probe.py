@@ -0,0 +1,108 @@
+import os
+from pathlib import Path
+
+import pypdf
+import pytest
+
+from tilia import dirs
+from tilia.file import probe
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(dirs, "probe_cache_path", None)
+    monkeypatch.setattr(probe, "_entries", {})
+
+
+def write_pdf(path, page_count):
+    writer = pypdf.PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(width=100, height=100)
+    writer.write(path)
+    return str(path)
+
+
+def fail_to_read(*_, **__):
+    raise AssertionError("File should not be read.")
+
+
+class TestPdfPageCount:
+    def test_get(self, tmp_path):
+        assert probe.get_pdf_page_count(write_pdf(tmp_path / "a.pdf", 2)) == 2
+
+    def test_pdf_is_read_once(self, tmp_path, monkeypatch):
+        path = write_pdf(tmp_path / "a.pdf", 2)
+        probe.get_pdf_page_count(path)
+
+        monkeypatch.setattr(pypdf, "PdfReader", fail_to_read)
+        assert probe.get_pdf_page_count(path) == 2
+
+    def test_changed_pdf_is_read_again(self, tmp_path):
+        path = write_pdf(tmp_path / "a.pdf", 2)
+        probe.get_pdf_page_count(path)
+
+        write_pdf(path, 3)
+        assert probe.get_pdf_page_count(path) == 3
+
+    def test_missing_pdf(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            probe.get_pdf_page_count(str(tmp_path / "a.pdf"))
+
+
+class TestMediaDuration:
+    def test_set_and_get(self, tmp_path):
+        path = tmp_path / "a.mp3"
+        path.write_bytes(b"media")
+        probe.set_media_duration(str(path), 10.5)
+
+        assert probe.get_media_duration(str(path)) == 10.5
+
+    def test_get_after_media_changed(self, tmp_path):
+        path = tmp_path / "a.mp3"
+        path.write_bytes(b"media")
+        probe.set_media_duration(str(path), 10.5)
+
+        path.write_bytes(b"other media")
+        assert probe.get_media_duration(str(path)) is None
+
+    def test_get_url(self):
+        url = "https://www.youtube.com/watch?v=123"
+        probe.set_media_duration(url, 10.5)
+
+        assert probe.get_media_duration(url) is None
+
+
+class TestMovedPath:
+    def test_set_and_get(self, tmp_path):
+        moved_path = tmp_path / "new" / "a.pdf"
+        moved_path.parent.mkdir()
+        moved_path.write_bytes(b"")
+        args = ("old/a.pdf", Path("old/a.tla"), Path(tmp_path, "new", "a.tla"))
+        probe.set_moved_path(*args, str(moved_path))
+
+        assert probe.get_moved_path(*args) == str(moved_path)
+
+        os.remove(moved_path)
+        assert probe.get_moved_path(*args) == ""
+
+
+def test_cache_is_kept_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(dirs, "probe_cache_path", tmp_path / "probe_cache.json")
+    path = write_pdf(tmp_path / "a.pdf", 2)
+    probe.get_pdf_page_count(path)
+
+    # as if in a new session
+    monkeypatch.setattr(probe, "_entries", None)
+    monkeypatch.setattr(pypdf, "PdfReader", fail_to_read)
+
+    assert probe.get_pdf_page_count(path) == 2
+
+
+def test_oldest_entries_are_deleted(tmp_path, monkeypatch):
+    monkeypatch.setattr(probe, "MAX_ENTRIES", 2)
+    paths = [tmp_path / f"{i}.mp3" for i in range(3)]
+    for i, path in enumerate(paths):
+        path.write_bytes(b"media")
+        probe.set_media_duration(str(path), i)
+
+    assert [probe.get_media_duration(str(path)) for path in paths] == [None, 1, 2]
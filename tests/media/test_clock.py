@@ -0,0 +1,58 @@
+import pytest
+
+from tilia.media.player.clock import PlaybackClock
+
+
+class FakeNow:
+    def __init__(self):
+        self.value = 0.0
+
+    def __call__(self):
+        return self.value
+
+
+@pytest.fixture
+def now():
+    return FakeNow()
+
+
+@pytest.fixture
+def clock(now):
+    return PlaybackClock(now)
+
+
+def test_time_is_synced_time_before_sync(clock):
+    assert clock.get_time() == 0.0
+    assert clock.needs_sync(0.1)
+
+
+def test_time_is_interpolated_between_syncs(clock, now):
+    clock.sync(10.0)
+    now.value = 0.05
+
+    assert clock.get_time() == pytest.approx(10.05)
+    assert not clock.needs_sync(0.1)
+
+
+def test_time_is_interpolated_with_playback_rate(clock, now):
+    clock.rate = 2.0
+    clock.sync(10.0)
+    now.value = 0.05
+
+    assert clock.get_time() == pytest.approx(10.1)
+
+
+def test_needs_sync_after_interval(clock, now):
+    clock.sync(10.0)
+    now.value = 0.1
+
+    assert clock.needs_sync(0.1)
+
+
+def test_reset(clock, now):
+    clock.sync(10.0)
+    clock.reset()
+    now.value = 0.05
+
+    assert clock.get_time() == 10.0
+    assert clock.needs_sync(0.1)
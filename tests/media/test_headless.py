@@ -0,0 +1,18 @@
+import pytest
+
+from tilia.media.player.headless import get_media_duration
+
+
+def test_get_media_duration_of_wav(resources):
+    assert get_media_duration(resources / "example.wav") == pytest.approx(9.95, 0.01)
+
+
+def test_get_media_duration_of_inexistent_file(tmp_path):
+    assert get_media_duration(tmp_path / "inexistent.wav") is None
+
+
+def test_get_media_duration_of_invalid_file(tmp_path):
+    path = tmp_path / "not_media.wav"
+    path.write_text("not media")
+
+    assert get_media_duration(path) is None
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+from tilia.parsers.score import svg_cache
+
+
+def test_store_and_load(tmp_path):
+    with patch("tilia.dirs.svg_cache_path", tmp_path):
+        key = svg_cache.get_key("<score-partwise/>")
+        svg_cache.store(key, "<svg/>", {1.0: 10.0})
+
+        assert svg_cache.load(key) == ("<svg/>", {"1.0": 10.0})
+
+
+def test_load_missing_entry(tmp_path):
+    with patch("tilia.dirs.svg_cache_path", tmp_path):
+        assert svg_cache.load(svg_cache.get_key("<score-partwise/>")) is None
+
+
+def test_cache_is_disabled_without_cache_dir():
+    with patch("tilia.dirs.svg_cache_path", None):
+        key = svg_cache.get_key("<score-partwise/>")
+        svg_cache.store(key, "<svg/>", {})
+
+        assert svg_cache.load(key) is None
+
+
+def test_key_depends_on_musicxml():
+    assert svg_cache.get_key("<score-partwise/>") != svg_cache.get_key(
+        "<score-partwise></score-partwise>"
+    )
+
+
+def test_older_entries_are_deleted(tmp_path):
+    with patch("tilia.dirs.svg_cache_path", tmp_path), patch.object(
+        svg_cache, "MAX_ENTRIES", 2
+    ):
+        for i in range(3):
+            svg_cache.store(str(i), "<svg/>", {})
+
+        assert len(list(tmp_path.iterdir())) == 2
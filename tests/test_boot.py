@@ -58,3 +58,10 @@ class TestGetSetupParser:
 
         with pytest.raises(argparse.ArgumentError):
             setup_parser()
+
+    def test_setup_parser_command(self):
+        sys.argv = ["main.py", "batch", "corpus", "--jobs", "4"]
+
+        args = setup_parser()
+
+        assert args.command == ["batch", "corpus", "--jobs", "4"]
@@ -1,18 +1,24 @@
 import json
 import pytest
-from PIL import Image
+from PIL import Image, ImageChops
 
 from tests.conftest import parametrize_component
 from tests.constants import EXAMPLE_MEDIA_PATH
 from tests.mock import Serve, patch_ask_for_string_dialog, patch_file_dialog
 from tests.utils import get_tmp_file_with_dummy_timeline
+from tilia.file.export import write_csv
+from tilia.parsers.csv.beat import beats_from_csv
+from tilia.parsers.csv.hierarchy import import_by_time as hierarchies_by_time
+from tilia.parsers.csv.marker import import_by_time as markers_by_time
 from tilia.requests import post, Post, Get, get
 from tilia.settings import settings
 from tilia.timelines.base.timeline import TimelineFlag
+from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.harmony.timeline import HarmonyTimeline
 from tilia.timelines.timeline_kinds import TimelineKind
 from tilia.ui.actions import TiliaAction
 from tilia.ui.dialogs.resize_rect import ResizeRect
+import tilia.ui.image_export
 
 
 class TestExportJSON:
@@ -144,6 +150,105 @@ class TestExportJSON:
                 comp_value = list(comp_value)  # JSON converts tuples to lists
             assert comp_value == exported_component[attr]
 
+    def test_exported_metric_positions_are_correct(
+        self, tilia, beat_tl, marker_tl, hierarchy_tl, user_actions, tmp_path
+    ):
+        beat_tl.set_data("beat_pattern", [3])
+        for i in range(10):
+            beat_tl.create_beat(i)
+        for time in [0, 2.4, 4.6, 9.5]:
+            marker_tl.create_marker(time)
+        hierarchy_tl.create_hierarchy(1.2, 7.7, 1)
+
+        data = self._trigger_export_action(user_actions, tmp_path / "test.json")
+
+        for tl_data, tl in zip(data["timelines"], [beat_tl, marker_tl, hierarchy_tl]):
+            for exported, component in zip(tl_data["components"], tl):
+                for attr in component.get_export_attributes():
+                    value = getattr(component, attr)
+                    if isinstance(value, tuple):
+                        value = list(value)
+                    assert exported[attr] == value
+
+    def test_beats_metric_positions_are_from_their_own_timeline(
+        self, tilia, tls, beat_tl, user_actions, tmp_path
+    ):
+        other_beat_tl = tls.create_timeline(
+            TimelineKind.BEAT_TIMELINE, beat_pattern=[3]
+        )
+        for i in range(5):
+            beat_tl.create_beat(i)
+            other_beat_tl.create_component(ComponentKind.BEAT, i)
+
+        data = self._trigger_export_action(user_actions, tmp_path / "test.json")
+
+        exported = [
+            (c["measure"], c["beat"]) for c in data["timelines"][1]["components"]
+        ]
+        assert exported == [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2)]
+
+
+class TestExportCSV:
+    @staticmethod
+    def _get_components_data(timeline):
+        return [{attr: c.get_data(attr) for attr in c.SERIALIZABLE} for c in timeline]
+
+    def test_markers(self, marker_tl, tmp_path):
+        marker_tl.create_marker(1, label="a", comments="with, comma")
+        marker_tl.create_marker(2.5, label="b")
+        expected = self._get_components_data(marker_tl)
+        path = tmp_path / "markers.csv"
+
+        write_csv(path, marker_tl)
+        marker_tl.clear()
+        success, errors = markers_by_time(marker_tl, path)
+
+        assert success and not errors
+        assert self._get_components_data(marker_tl) == expected
+
+    def test_hierarchies(self, hierarchy_tl, tmp_path):
+        hierarchy_tl.create_hierarchy(0, 10, 1, label="whole")
+        hierarchy_tl.create_hierarchy(0, 4, 2, pre_start=-1, comments="a")
+        hierarchy_tl.create_hierarchy(4, 10, 2, post_end=12)
+        expected = self._get_components_data(hierarchy_tl)
+        path = tmp_path / "hierarchies.csv"
+
+        write_csv(path, hierarchy_tl)
+        hierarchy_tl.clear()
+        success, errors = hierarchies_by_time(hierarchy_tl, path)
+
+        assert success and not errors
+        assert self._get_components_data(hierarchy_tl) == expected
+
+    def test_beats(self, tls, beat_tl, tmp_path):
+        beat_tl.set_data("beat_pattern", [3, 2])
+        for i in range(12):
+            beat_tl.create_beat(i)
+        beat_tl.set_measure_number(2, 10)
+        expected = self._get_components_data(beat_tl)
+        beats_in_measure = beat_tl.beats_in_measure
+        measure_numbers = beat_tl.measure_numbers
+        path = tmp_path / "beats.csv"
+
+        write_csv(path, beat_tl)
+        imported_tl = tls.create_timeline(TimelineKind.BEAT_TIMELINE)
+        success, errors = beats_from_csv(imported_tl, path)
+
+        assert success and not errors
+        assert self._get_components_data(imported_tl) == expected
+        assert imported_tl.beats_in_measure == beats_in_measure
+        assert imported_tl.measure_numbers == measure_numbers
+
+    def test_empty_timeline(self, marker_tl, tmp_path):
+        path = tmp_path / "markers.csv"
+        write_csv(path, marker_tl)
+
+        assert path.read_text() == ""
+
+    def test_not_exportable_timeline_raises_error(self, harmony_tl, tmp_path):
+        with pytest.raises(ValueError):
+            write_csv(tmp_path / "harmonies.csv", harmony_tl)
+
 
 class TestExportImage:
     def _get_sample_file(self, tmp_path):
@@ -170,7 +275,7 @@ class TestExportImage:
 
         with Image.open(image_path) as img:
             assert img.size[0] == new_width
-            assert img.size[1] == original_height
+            assert img.size[1] == round(original_height * scale_factor)
 
         assert scene.sceneRect().width() == original_width
         assert scene.sceneRect().height() == original_height
@@ -188,3 +293,38 @@ class TestExportImage:
             user_actions.trigger(TiliaAction.FILE_EXPORT_IMG)
 
         assert not image_path.exists()
+
+    def _export(self, user_actions, monkeypatch, path, width):
+        monkeypatch.setattr(ResizeRect, "new_size", lambda *_: [True, width])
+        with Serve(Get.FROM_USER_EXPORT_PATH, (True, path)):
+            user_actions.trigger(TiliaAction.FILE_EXPORT_IMG)
+
+    def test_png_is_written_in_strips(self, qtui, monkeypatch, tmp_path, user_actions):
+        with patch_file_dialog(True, [self._get_sample_file(tmp_path)]):
+            user_actions.trigger(TiliaAction.FILE_OPEN)
+        width = get(Get.MAIN_WINDOW).centralWidget().scene().sceneRect().width() * 2
+        self._export(user_actions, monkeypatch, tmp_path / "whole.bmp", width)
+
+        # a few rows per strip
+        monkeypatch.setattr(
+            tilia.ui.image_export, "MAX_STRIP_BYTES", int(width) * 4 * 7
+        )
+        self._export(user_actions, monkeypatch, tmp_path / "strips.png", width)
+
+        with Image.open(tmp_path / "whole.bmp") as whole:
+            with Image.open(tmp_path / "strips.png") as strips:
+                assert strips.size == whole.size
+                # dash patterns may start at a different phase in each strip
+                difference = ImageChops.difference(strips.convert("RGB"), whole)
+                different_count = sum(1 for p in difference.getdata() if any(p))
+                assert different_count < 0.001 * whole.width * whole.height
+
+    @pytest.mark.parametrize("extension", ["svg", "pdf"])
+    def test_vector_export(self, qtui, monkeypatch, tmp_path, user_actions, extension):
+        path = tmp_path / f"tl_image.{extension}"
+        with patch_file_dialog(True, [self._get_sample_file(tmp_path)]):
+            user_actions.trigger(TiliaAction.FILE_OPEN)
+
+        self._export(user_actions, monkeypatch, path, 1000)
+
+        assert path.stat().st_size > 0
@@ -0,0 +1,31 @@
+from tilia.settings import JsonSettings
+
+
+class TestJsonSettings:
+    def test_value_is_persisted(self, tmp_path):
+        path = tmp_path / "settings.json"
+        JsonSettings(path).setValue("general/window_width", 300)
+
+        assert JsonSettings(path).value("general/window_width") == 300
+
+    def test_value_in_group(self, tmp_path):
+        settings = JsonSettings(tmp_path / "settings.json")
+        settings.beginGroup("editable")
+        settings.setValue("window_width", 300)
+        settings.endGroup()
+
+        assert settings.value("editable/window_width") == 300
+
+    def test_default_is_returned_if_value_is_missing(self, tmp_path):
+        assert JsonSettings(tmp_path / "settings.json").value("missing", 1) == 1
+
+    def test_remove_group(self, tmp_path):
+        settings = JsonSettings(tmp_path / "settings.json")
+        settings.setValue("editable/window_width", 300)
+        settings.setValue("private/recent_files", [])
+        settings.beginGroup("editable")
+        settings.remove("")
+        settings.endGroup()
+
+        assert settings.value("editable/window_width") is None
+        assert settings.value("private/recent_files") == []
@@ -416,3 +416,29 @@ class TestBeatTimeline:
         assert not beat_tl[1].get_data("is_first_in_measure")
         assert beat_tl[2].get_data("is_first_in_measure")
         assert not beat_tl[3].get_data("is_first_in_measure")
+
+    def test_scale(self, beat_tl):
+        beat_tl.beat_pattern = [2]
+        for time in range(4):
+            beat_tl.create_beat(time)
+
+        beat_tl.scale(2)
+
+        assert [beat.get_data("time") for beat in beat_tl] == [0, 2, 4, 6]
+        assert [beat.get_data("is_first_in_measure") for beat in beat_tl] == [
+            True,
+            False,
+            True,
+            False,
+        ]
+        assert beat_tl.get_time_by_measure(2) == [4]
+
+    def test_crop(self, beat_tl):
+        beat_tl.beat_pattern = [2]
+        for time in range(5):
+            beat_tl.create_beat(time)
+
+        beat_tl.crop(2.5)
+
+        assert [beat.get_data("time") for beat in beat_tl] == [0, 1, 2]
+        assert beat_tl[2].get_data("is_first_in_measure")
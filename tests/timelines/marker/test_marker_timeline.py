@@ -1,3 +1,9 @@
+from unittest.mock import Mock
+
+from tilia.requests import listen, Post, stop_listening_to_all
+from tilia.timelines.timeline_kinds import TimelineKind
+
+
 class TestMarkerTimeline:
     # TEST CREATE
     def test_create_marker(self, marker_tl):
@@ -5,6 +11,30 @@ class TestMarkerTimeline:
 
         assert len(marker_tl) == 1
 
+    def test_marker_attributes_are_slotted(self, marker_tl):
+        marker, _ = marker_tl.create_marker(0, label="label")
+
+        assert not hasattr(marker, "__dict__")
+        assert marker.get_instance_attrs() == {
+            "timeline": marker_tl,
+            "id": marker.id,
+            "_hash": None,
+            "time": 0,
+            "label": "label",
+            "color": None,
+            "comments": "",
+        }
+
+    def test_hash_is_computed_on_demand(self, marker_tl):
+        marker, _ = marker_tl.create_marker(0, label="label")
+        assert marker._hash is None
+
+        prev_hash = marker.hash
+        marker.set_data("label", "other")
+
+        assert marker._hash is None
+        assert marker.hash != prev_hash
+
 
 class TestMarkerTimelineComponentManager:
     # TEST CLEAR
@@ -17,6 +47,20 @@ class TestMarkerTimelineComponentManager:
 
         assert not marker_tl.component_manager._components
 
+    def test_clear_posts_single_event(self, marker_tl):
+        markers = [marker_tl.create_marker(i)[0] for i in range(3)]
+        listener = Mock()
+        listen(listener, Post.TIMELINE_COMPONENTS_DELETED, listener)
+
+        marker_tl.component_manager.clear()
+
+        listener.assert_called_once_with(
+            TimelineKind.MARKER_TIMELINE,
+            marker_tl.id,
+            [marker.id for marker in markers],
+        )
+        stop_listening_to_all(listener)
+
     # TEST SERIALIZE
     # noinspection PyUnresolvedReferences
     def test_serialize_components(self, marker_tl):
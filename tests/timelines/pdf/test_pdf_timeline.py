@@ -80,3 +80,13 @@ class TestPageNumber:
         tilia_state.current_time = 30
         user_actions.trigger(TiliaAction.PDF_MARKER_ADD)
         assert pdf_tl[-1].get_data("page_number") == 2
+
+    def test_get_next_page_numbers(self, pdf_tl):
+        pdf_tl.page_total = 3
+        pdf_tl.create_pdf_marker(0, page_number=1)
+        pdf_tl.create_pdf_marker(10, page_number=2)
+        pdf_tl.create_pdf_marker(20, page_number=3)
+
+        assert pdf_tl.get_next_page_numbers(5, 2) == [2, 3]
+        assert pdf_tl.get_next_page_numbers(10, 2) == [3]
+        assert pdf_tl.get_next_page_numbers(20, 2) == []
@@ -1,5 +1,8 @@
+import json
+
 import pytest
 
+from tilia.requests import Post, post
 from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.score.components import Clef
 
@@ -68,6 +71,17 @@ def test_crop_segmentlike_components(score_tl, tilia_state):
     assert c4 not in score_tl
 
 
+def test_crop_keeps_notes_in_order(score_tl, tilia_state):
+    tilia_state.duration = 100
+    # ordered by end before cropping, and by pitch after
+    n1, _ = score_tl.create_component(ComponentKind.NOTE, 0, 80, 1, 0, 3, 0)
+    n2, _ = score_tl.create_component(ComponentKind.NOTE, 0, 90, 0, 0, 3, 0)
+
+    score_tl.crop(50)
+
+    assert score_tl.components == [n2, n1]
+
+
 def test_scale_segmentlike_components(score_tl, tilia_state):
     tilia_state.duration = 100
     n, _ = score_tl.create_component(ComponentKind.NOTE, 10, 100, 0, 0, 3, 0)
@@ -129,3 +143,36 @@ def test_crop_staff(score_tl, tilia_state):
     score_tl.crop(50)
 
     assert s in score_tl
+
+
+class TestSvgData:
+    SVG = "<svg></svg>"
+
+    def test_state_references_svg_by_hash(self, score_tl):
+        score_tl.set_data("svg_data", self.SVG)
+
+        state = score_tl.get_state()
+        assert "svg_data" not in state
+        assert state["svg_hash"]
+        assert score_tl.svg_data == self.SVG
+
+    def test_svg_data_is_written_to_file(self, tls, score_tl, tilia, tmp_path):
+        score_tl.set_data("svg_data", self.SVG)
+        path = tmp_path / "test.tla"
+
+        post(Post.REQUEST_SAVE_TO_PATH, path)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        timeline = data["timelines"][str(score_tl.id)]
+        assert timeline["svg_data"] == self.SVG
+        assert "svg_hash" not in timeline
+
+    def test_svg_data_is_restored_on_undo(self, tls, score_tl, tilia):
+        score_tl.set_data("svg_data", self.SVG)
+        post(Post.APP_RECORD_STATE, "test")
+        score_tl.set_data("svg_data", "<svg><g/></svg>")
+        post(Post.APP_RECORD_STATE, "test")
+
+        post(Post.EDIT_UNDO)
+
+        assert score_tl.svg_data == self.SVG
@@ -1,6 +1,8 @@
 import itertools
 import random
 
+from tilia.timelines.component_kinds import ComponentKind
+
 
 class TestComponentOrder:
     def test_components_stay_sorted_after_setting_ordering_attr(
@@ -14,3 +16,33 @@ class TestComponentOrder:
 
         for c1, c2 in itertools.pairwise(marker_tl):
             assert c1 < c2 or c1.time == c2.time
+
+
+class TestComponentIndexes:
+    def test_get_components_by_indexed_attr(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 1, 1, label="a")
+        hierarchy_tl.create_hierarchy(1, 2, 1, label="b")
+        hierarchy_tl.create_hierarchy(0, 2, 2, label="a")
+
+        assert hierarchy_tl.get_components_by_attr("label", "a") == [
+            hierarchy_tl[0],
+            hierarchy_tl[2],
+        ]
+        assert hierarchy_tl.get_component_by_attr("level", 2) == hierarchy_tl[2]
+
+    def test_index_is_updated_on_set_data(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 1, 1, label="a")
+        hierarchy_tl[0].set_data("label", "b")
+
+        assert hierarchy_tl.get_components_by_attr("label", "a") == []
+        assert hierarchy_tl.get_components_by_attr("label", "b") == [hierarchy_tl[0]]
+
+    def test_index_is_updated_on_delete(self, hierarchy_tl):
+        hierarchy_tl.create_hierarchy(0, 1, 1, label="a")
+        hierarchy_tl.create_hierarchy(1, 2, 1, label="a")
+        hierarchy_tl.delete_components([hierarchy_tl[0]])
+
+        assert hierarchy_tl.get_components_by_attr("label", "a") == [hierarchy_tl[0]]
+        assert hierarchy_tl.component_manager.get_existing_values_for_attr(
+            "level", ComponentKind.HIERARCHY
+        ) == {1}
@@ -0,0 +1,109 @@
+import json
+
+from tilia.ui.cli.batch import get_jobs
+
+
+def write_script(path, contents):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(contents, encoding="utf-8")
+    return path
+
+
+class TestGetJobs:
+    def test_directories_are_searched_for_scripts_and_tla_files(self, tmp_path):
+        write_script(tmp_path / "a" / "script.txt", "")
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "file.tla").write_text("")
+        (tmp_path / "b" / "other.txt").write_text("")
+
+        jobs = get_jobs([str(tmp_path)], [])
+
+        assert [job.path for job in jobs] == [
+            str(tmp_path / "a" / "script.txt"),
+            str(tmp_path / "b" / "file.tla"),
+        ]
+
+    def test_script(self, tmp_path):
+        path = write_script(tmp_path / "script.txt", "")
+        (job,) = get_jobs([str(path)], ["export out.json"])
+        assert job.commands == [f'script "{path}"']
+
+    def test_tla_file_placeholders(self, tmp_path):
+        path = tmp_path / "file.tla"
+        (job,) = get_jobs([str(path)], ['export "{dir}/{stem}.json"', "save {path}"])
+        assert job.commands == [
+            f'open "{path}"',
+            f'export "{tmp_path}/file.json"',
+            f"save {path}",
+        ]
+
+
+class TestBatch:
+    def test_results_are_reported(self, cli, tmp_path, tilia_errors):
+        good = write_script(
+            tmp_path / "good" / "script.txt",
+            "metadata set-media-length 100\n"
+            "timelines add marker --name test\n"
+            f'save "{tmp_path / "good" / "out.tla"}"',
+        )
+        bad = write_script(tmp_path / "bad" / "script.txt", "timelines add nonsense")
+        report = tmp_path / "report.json"
+
+        failed = cli.parse_and_run(
+            f'batch "{good}" "{bad}" --jobs 2 --report "{report}"'
+        )
+
+        assert failed
+        tilia_errors.assert_no_error()
+        assert (tmp_path / "good" / "out.tla").exists()
+        results = json.loads(report.read_text())
+        assert [result["path"] for result in results] == [str(good), str(bad)]
+        assert results[0]["success"]
+        assert not results[1]["success"]
+        assert "nonsense" in results[1]["errors"][0]
+
+    def test_tla_files(self, cli, tmp_path, tilia_errors):
+        tla_path = tmp_path / "file.tla"
+        write_script(
+            tmp_path / "script.txt",
+            f'metadata set-media-length 100\nsave "{tla_path}"',
+        )
+        cli.parse_and_run(f'batch "{tmp_path / "script.txt"}" --jobs 1')
+        export_script = write_script(
+            tmp_path / "export.txt", 'export "{dir}/{stem}.json"'
+        )
+
+        failed = cli.parse_and_run(
+            f'batch "{tla_path}" --script "{export_script}" --jobs 1'
+        )
+
+        assert not failed
+        tilia_errors.assert_no_error()
+        assert (tmp_path / "file.json").exists()
+
+    def test_invalid_number_of_jobs(self, cli, tmp_path, tilia_errors):
+        path = write_script(tmp_path / "script.txt", "")
+        cli.parse_and_run(f'batch "{path}" --jobs 0')
+        tilia_errors.assert_error()
+
+    def test_repeated_paths_are_all_reported(self, cli, tmp_path):
+        path = write_script(tmp_path / "script.txt", "metadata set-media-length 100")
+        report = tmp_path / "report.json"
+
+        cli.parse_and_run(f'batch "{path}" "{path}" --jobs 2 --report "{report}"')
+
+        results = json.loads(report.read_text())
+        assert [result["path"] for result in results] == [str(path), str(path)]
+
+    def test_invalid_arguments_are_reported(self, cli, tmp_path):
+        path = write_script(
+            tmp_path / "script.txt", "timelines add hierarchy --bogus-flag 1"
+        )
+        report = tmp_path / "report.json"
+
+        failed = cli.parse_and_run(f'batch "{path}" --jobs 1 --report "{report}"')
+
+        assert failed
+        (result,) = json.loads(report.read_text())
+        assert not result["success"]
+        assert "--bogus-flag" in result["errors"][0]
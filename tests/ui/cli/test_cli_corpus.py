@@ -0,0 +1,38 @@
+import json
+
+
+def write_tla(path):
+    data = {
+        "file_path": str(path),
+        "media_path": "",
+        "media_metadata": {},
+        "timelines": {
+            "0": {
+                "kind": "HIERARCHY_TIMELINE",
+                "components": {
+                    "1": {"kind": "HIERARCHY", "start": 0, "end": 1, "label": "Intro"}
+                },
+            }
+        },
+        "app_name": "TiLiA",
+        "version": "0.0.0",
+    }
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_index_and_query(cli, tmp_path, capsys):
+    write_tla(tmp_path / "a.tla")
+    db_path = tmp_path / "corpus.sqlite"
+
+    cli.parse_and_run(f'corpus index "{tmp_path}" --db "{db_path}"')
+    assert "Indexed 1 file(s)" in capsys.readouterr().out
+
+    cli.parse_and_run(f'corpus query "SELECT label FROM hierarchy" --db "{db_path}"')
+    assert "Intro" in capsys.readouterr().out
+
+
+def test_query_error(cli, tmp_path, tilia_errors):
+    cli.parse_and_run(
+        f'corpus query "SELECT * FROM nothing" --db "{tmp_path / "corpus.sqlite"}"'
+    )
+    tilia_errors.assert_in_error_title("Corpus query")
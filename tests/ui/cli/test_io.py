@@ -25,3 +25,7 @@ class TestInput:
     def test_ask_yes_or_no(self, user_input, expected):
         with patch("builtins.input", return_value=user_input):
             assert ask_yes_or_no("Some prompt") == expected
+
+    def test_ask_yes_or_no_without_input(self):
+        with patch("builtins.input", side_effect=EOFError):
+            assert not ask_yes_or_no("Some prompt")
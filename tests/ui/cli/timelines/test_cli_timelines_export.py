@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+
+class TestExportTimeline:
+    def test_markers(self, cli, marker_tl, tmp_path):
+        marker_tl.create_marker(1, label="a")
+        marker_tl.create_marker(2, label="b")
+        path = tmp_path / "markers.csv"
+
+        cli.parse_and_run(f"timelines export --target-ordinal 1 --file {path}")
+
+        lines = path.read_text().splitlines()
+        assert lines[0].startswith("time,")
+        assert len(lines) == 3
+
+    def test_existing_file_is_not_overwritten_if_user_refuses(
+        self, cli, marker_tl, tmp_path
+    ):
+        path = tmp_path / "markers.csv"
+        path.write_text("existing")
+
+        with patch("builtins.input", return_value="n"):
+            cli.parse_and_run(f"timelines export --target-ordinal 1 --file {path}")
+
+        assert path.read_text() == "existing"
+
+    def test_not_exportable_timeline(self, cli, harmony_tl, tilia_errors, tmp_path):
+        path = tmp_path / "harmonies.csv"
+
+        cli.parse_and_run(f"timelines export --target-ordinal 1 --file {path}")
+
+        tilia_errors.assert_error()
+        assert not path.exists()
@@ -0,0 +1,30 @@
+import pytest
+from PyQt6.QtGui import QFont, QFontMetrics
+
+from tilia.ui.text_layout import get_cropped_text, get_prefix_widths, get_text_width
+
+
+@pytest.fixture
+def font(qapplication):
+    return QFont("Arial", 10)
+
+
+def test_prefix_widths_are_increasing(font):
+    widths = get_prefix_widths(font, "label")
+    assert len(widths) == len("label")
+    assert list(widths) == sorted(widths)
+
+
+def test_text_width(font):
+    assert get_text_width(font, "label") == pytest.approx(
+        QFontMetrics(font).horizontalAdvance("label"), abs=1
+    )
+    assert get_text_width(font, "") == 0
+
+
+def test_cropped_text(font):
+    widths = get_prefix_widths(font, "label")
+    assert get_cropped_text(font, "label", widths[2]) == "lab"
+    assert get_cropped_text(font, "label", widths[2] - 0.1) == "la"
+    assert get_cropped_text(font, "label", 0) == ""
+    assert get_cropped_text(font, "label", widths[-1]) == "label"
@@ -190,6 +190,34 @@ class TestActions:
         assert len(tlui) == 2
 
 
+class TestHandleNavigation:
+    def test_previous_and_next_handle_x(self, tlui):
+        tlui.create_hierarchy(0, 10, 1)
+        tlui.create_hierarchy(10, 20, 1)
+        x = tlui[1].start_x
+
+        assert tlui.get_previous_handle_x_by_x(x) == tlui[0].start_x
+        assert tlui.get_next_handle_x_by_x(x) == tlui[1].end_x
+        assert tlui.get_previous_handle_x_by_x(tlui[0].start_x) is None
+        assert tlui.get_next_handle_x_by_x(tlui[1].end_x) is None
+
+    def test_handle_x_after_set_data(self, tlui):
+        tlui.create_hierarchy(0, 10, 1)
+        tlui.create_hierarchy(10, 20, 1)
+        tlui[1].set_data("end", 15)
+
+        assert tlui.get_next_handle_x_by_x(tlui[1].start_x) == tlui[1].end_x
+
+    def test_handle_x_after_delete(self, tlui):
+        tlui.create_hierarchy(0, 10, 1)
+        tlui.create_hierarchy(10, 20, 1)
+        end_x = tlui[0].end_x
+        tlui.timeline.delete_components([tlui[1].tl_component])
+
+        assert tlui.get_next_handle_x_by_x(tlui[0].start_x) == end_x
+        assert tlui.get_next_handle_x_by_x(end_x) is None
+
+
 class TestCopyPaste:
     def test_paste(self, tlui, user_actions):
         tlui.create_hierarchy(0, 1, 1, label="paste test")
@@ -78,6 +78,50 @@ class TestHierarchyUI:
         assert hierarchy_tlui[0].dragged
         assert hierarchy_tlui[0].end_x == time_x_converter.get_x_by_time(time_to_drag)
 
+    def test_drag_snaps_to_beat(self, tlui, beat_tlui, tilia_state):
+        beat_tlui.create_beat(tilia_state.duration / 2)
+        tlui.create_hierarchy(0, tilia_state.duration, 1)
+        tlui._trigger_left_click_side_effects(tlui[0], tlui[0].start_handle)
+        beat_x = time_x_converter.get_x_by_time(tilia_state.duration / 2)
+        post(Post.TIMELINE_VIEW_LEFT_BUTTON_DRAG, beat_x + 2, 0)
+        assert tlui[0].get_data("start") == tilia_state.duration / 2
+
+    def test_decorations_are_not_created_for_undecorated_unit(self, tlui):
+        tlui.create_hierarchy(0.1, 1, 1, pre_start=0)
+
+        assert tlui[0].comments_icon is None
+        assert tlui[0].loop_icon is None
+        assert tlui[0].frame_handles == {}
+
+    def test_frame_handles_are_not_created_on_update_position(self, tlui):
+        tlui.create_hierarchy(0.1, 1, 1, pre_start=0, post_end=1.1)
+        item_count = len(tlui.scene.items())
+
+        tlui[0].update_position()
+
+        assert tlui[0].frame_handles == {}
+        assert len(tlui.scene.items()) == item_count
+
+    def test_comments_icon_is_created_and_removed_with_comments(self, tlui):
+        tlui.create_hierarchy(0, 1, 1)
+        tlui[0].set_data("comments", "some comment")
+        assert tlui[0].comments_icon in tlui.scene.items()
+
+        icon = tlui[0].comments_icon
+        tlui[0].set_data("comments", "")
+        assert tlui[0].comments_icon is None
+        assert icon not in tlui.scene.items()
+
+    def test_frame_handles_are_removed_on_deselect(self, tlui):
+        tlui.create_hierarchy(0.1, 1, 1, pre_start=0)
+        tlui.select_element(tlui[0])
+        handle = tlui[0].pre_start_handle
+
+        tlui.deselect_element(tlui[0])
+
+        assert tlui[0].frame_handles == {}
+        assert handle not in tlui.scene.items()
+
 
 class TestPreStartIndicator:
     def test_has_pre_start_when_element_has_pre_start(self, tlui):
@@ -61,6 +61,21 @@ class TestCreateDelete:
             user_actions.trigger(TiliaAction.TIMELINE_ELEMENT_DELETE)
             assert len(marker_tlui) == 0
 
+    def test_clear_with_inspected_elements(
+        self, qtui, marker_tlui, user_actions, tilia_state
+    ):
+        for i in range(3):
+            tilia_state.current_time = i
+            user_actions.trigger(TiliaAction.MARKER_ADD)
+        post(Post.WINDOW_OPEN, WindowKind.INSPECT)
+        marker_tlui.select_all_elements()
+
+        marker_tlui.timeline.clear()
+
+        assert len(marker_tlui) == 0
+        assert not marker_tlui.selected_elements
+        post(Post.WINDOW_CLOSE, WindowKind.INSPECT)
+
 
 class TestSetResetColor:
     TEST_COLOR = "#000000"
@@ -258,6 +273,7 @@ class TestSelect:
         drag_mouse_in_timeline_view(0, 0)
 
         assert not marker_tlui.selected_elements
+        post(Post.WINDOW_CLOSE, WindowKind.INSPECT)
 
 
 class TestDrag:
@@ -51,6 +51,57 @@ def test_create_key_signature(score_tlui, fifths):
     assert score_tlui[0]
 
 
+def test_get_clef_by_time(score_tlui):
+    score_tlui.create_component(
+        ComponentKind.CLEF, 0, 0, shorthand=Clef.Shorthand.TREBLE
+    )
+    score_tlui.create_component(
+        ComponentKind.CLEF, 0, 10, shorthand=Clef.Shorthand.BASS
+    )
+    score_tlui.create_component(ComponentKind.CLEF, 1, 5, shorthand=Clef.Shorthand.ALTO)
+    treble, alto, bass = sorted(score_tlui, key=lambda e: e.get_data("time"))
+
+    assert score_tlui.get_clef_by_time(5, 0) == treble
+    assert score_tlui.get_clef_by_time(10, 0) == bass
+    assert score_tlui.get_clef_by_time(0, 1) is None
+    assert score_tlui.get_clef_by_time(5, 1) == alto
+
+
+def test_symbols_at_same_time_and_staff_are_grouped(score_tlui):
+    score_tlui.create_component(
+        ComponentKind.CLEF, 0, 0, shorthand=Clef.Shorthand.TREBLE
+    )
+    score_tlui.create_component(ComponentKind.TIME_SIGNATURE, 0, 0, 4, 4)
+    score_tlui.create_component(ComponentKind.KEY_SIGNATURE, 0, 0, 0)
+    score_tlui.create_component(ComponentKind.KEY_SIGNATURE, 0, 10, 0)
+
+    group = score_tlui.overlapping_elements[(0, 0)]
+    assert [e.kind for e in group] == [
+        ComponentKind.CLEF,
+        ComponentKind.KEY_SIGNATURE,
+        ComponentKind.TIME_SIGNATURE,
+    ]
+    assert list(score_tlui.overlapping_elements) == [(0, 0)]
+
+
+def test_cropped_symbols_are_removed_from_staff_symbols(score_tlui, tls):
+    score_tlui.create_component(
+        ComponentKind.CLEF, 0, 0, shorthand=Clef.Shorthand.TREBLE
+    )
+    score_tlui.create_component(
+        ComponentKind.CLEF, 0, 10, shorthand=Clef.Shorthand.BASS
+    )
+    score_tlui.create_component(ComponentKind.KEY_SIGNATURE, 0, 10, 0)
+    (treble,) = [e for e in score_tlui if e.get_data("time") == 0]
+
+    tls.crop_timeline_components(5)
+
+    assert score_tlui.get_clef_by_time(7, 0) == treble
+    assert score_tlui.overlapping_elements == {}
+    score_tlui.create_component(ComponentKind.CLEF, 0, 3, shorthand=Clef.Shorthand.ALTO)
+    assert len(score_tlui.staff_symbols[ComponentKind.CLEF][0]) == 2
+
+
 def _check_attrs(tmp_path, user_actions, items_per_attr):
     @reloadable(tmp_path / "file.tla", user_actions)
     def check_attrs() -> None:
@@ -291,3 +342,33 @@ def test_symbol_staff_collision(qtui, tmp_path, user_actions):
     )
 
     assert staff_top_y_sans_symbols < staff_top_y_with_symbols
+
+
+class TestSvgViewerPositions:
+    @pytest.fixture
+    def viewer(self, qtui, beat_tl, score_tlui):
+        for time in range(5):
+            beat_tl.create_beat(time)
+        viewer = score_tlui.svg_view
+        viewer._set_beat_x_position({"1.0": 0, "1.5": 100, "2.0": 300})
+        return viewer
+
+    @pytest.mark.parametrize(
+        "time,x", [(0, 0), (0.5, 25), (1, 50), (3, 200), (3.5, 250), (10, 300)]
+    )
+    def test_scene_x_from_time(self, viewer, time, x):
+        assert viewer._get_scene_x_from_time(time) == pytest.approx(x)
+
+    def test_scene_x_from_time_after_beat_moved(self, viewer, beat_tl):
+        assert viewer._get_scene_x_from_time(1.5) == pytest.approx(75)
+        beat_tl.set_component_data(beat_tl[1].id, "time", 1.5)
+        assert viewer._get_scene_x_from_time(1.5) == pytest.approx(50)
+
+    def test_scene_x_from_time_after_timelines_scaled(self, viewer, tls):
+        assert viewer._get_scene_x_from_time(2) == pytest.approx(100)
+        tls.scale_timeline_components(2)
+        assert viewer._get_scene_x_from_time(2) == pytest.approx(50)
+
+    @pytest.mark.parametrize("x,time", [(0, 0), (25, 0.5), (200, 3), (300, 4)])
+    def test_time_from_scene_x(self, viewer, x, time):
+        assert viewer._get_time_from_scene_x({0: x})[0] == [pytest.approx(time)]
@@ -255,6 +255,68 @@ def test_zooming_updates_playback_line_position(tls, tluis):
     )
 
 
+@pytest.fixture
+def playback_area_width(tluis):
+    # the converter is shared by all tests, so its width may be outdated
+    time_x_converter.setup()
+    width = time_x_converter.playback_area_width
+    yield width
+    post(Post.PLAYBACK_AREA_SET_WIDTH, width)
+
+
+def test_zooming_repositions_elements_out_of_view_lazily(
+    tluis, marker_tlui, tilia_state, playback_area_width
+):
+    def get_x(marker_ui):
+        return marker_ui.body.polygon().boundingRect().center().x()
+
+    marker_tlui.create_marker(0)
+    marker_tlui.create_marker(tilia_state.duration)
+    with (
+        patch.object(tluis.view, "isVisible", return_value=True),
+        patch.object(tluis, "get_visible_time_range", return_value=(0, 1)),
+    ):
+        post(Post.PLAYBACK_AREA_SET_WIDTH, playback_area_width * 2)
+
+    in_view, out_of_view = marker_tlui
+    assert get_x(in_view) == pytest.approx(time_x_converter.get_x_by_time(0))
+    assert get_x(out_of_view) != pytest.approx(
+        time_x_converter.get_x_by_time(tilia_state.duration)
+    )
+
+    marker_tlui.update_outdated_element_positions()
+    assert get_x(out_of_view) == pytest.approx(
+        time_x_converter.get_x_by_time(tilia_state.duration)
+    )
+
+
+def test_scrolling_repositions_elements_scrolled_into_view(
+    tluis, marker_tlui, tilia_state, playback_area_width
+):
+    def get_x(marker_ui):
+        return marker_ui.body.polygon().boundingRect().center().x()
+
+    middle = tilia_state.duration / 2
+    for time in [0, middle, tilia_state.duration]:
+        marker_tlui.create_marker(time)
+    with (
+        patch.object(tluis.view, "isVisible", return_value=True),
+        patch.object(tluis, "get_visible_time_range", return_value=(0, 1)),
+    ):
+        post(Post.PLAYBACK_AREA_SET_WIDTH, playback_area_width * 2)
+
+    with patch.object(
+        tluis, "get_visible_time_range", return_value=(middle - 1, middle + 1)
+    ):
+        tluis.on_horizontal_scroll(None)
+
+    _, in_view, out_of_view = marker_tlui
+    assert get_x(in_view) == pytest.approx(time_x_converter.get_x_by_time(middle))
+    assert get_x(out_of_view) != pytest.approx(
+        time_x_converter.get_x_by_time(tilia_state.duration)
+    )
+
+
 class TestSeek:
     def test_playback_line_follows_slider_drag_if_media_is_not_playing(
         self, marker_tlui, slider_tlui
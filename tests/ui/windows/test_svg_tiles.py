@@ -0,0 +1,66 @@
+import pytest
+from PyQt6.QtCore import QDeadlineTimer, QThread
+
+from tilia.ui.windows.svg_tiles import MAX_TILE_COUNT, SvgTileCache, get_tile_rect
+
+SVG = b"""<svg xmlns="http://www.w3.org/2000/svg" width="2000" height="300">
+<rect x="0" y="0" width="2000" height="300" fill="black"/>
+</svg>"""
+
+
+@pytest.fixture
+def cache(qapplication):
+    _cache = SvgTileCache()
+    _cache.load(SVG)
+    _cache.set_scale(1.0)
+    yield _cache
+    _cache.stop()
+
+
+def wait_for_tiles(qapplication, cache):
+    deadline = QDeadlineTimer(5000)
+    while cache.pending and not deadline.hasExpired():
+        qapplication.processEvents()
+        QThread.msleep(1)
+
+
+def test_tile_is_rendered_and_cached(qapplication, cache):
+    ready = []
+    cache.tile_ready.connect(ready.append)
+
+    assert cache.get(0, 0) is None
+    wait_for_tiles(qapplication, cache)
+
+    assert ready == [get_tile_rect(1.0, 0, 0)]
+    pixmap = cache.get(0, 0)
+    assert pixmap is not None
+    assert pixmap.toImage().pixelColor(10, 10).black() == 255
+
+
+def test_tiles_are_evicted_least_recently_used_first(qapplication, cache):
+    for col in range(MAX_TILE_COUNT + 1):
+        cache.get(col, 0)
+    wait_for_tiles(qapplication, cache)
+
+    assert len(cache.tiles) == MAX_TILE_COUNT
+    assert (cache.generation, 1.0, 0, 0) not in cache.tiles
+
+
+def test_load_discards_tiles(qapplication, cache):
+    cache.get(0, 0)
+    wait_for_tiles(qapplication, cache)
+
+    cache.load(SVG)
+
+    assert not cache.tiles
+    assert cache.get(0, 0) is None
+
+
+def test_changing_scale_keeps_tiles_as_fallback(qapplication, cache):
+    cache.get(0, 0)
+    wait_for_tiles(qapplication, cache)
+
+    cache.set_scale(2.0)
+
+    assert cache.get(0, 0) is None
+    assert len(cache.get_fallbacks(get_tile_rect(2.0, 0, 0))) == 1
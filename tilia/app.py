@@ -1,6 +1,5 @@
 from __future__ import annotations
 import itertools
-import json
 import re
 import traceback
 from pathlib import Path
@@ -10,6 +9,7 @@ import tilia.errors
 import tilia.constants
 import tilia.dirs
 from tilia.exceptions import NoReplyToRequest
+from tilia.file import blobs, probe
 from tilia.file.tilia_file import TiliaFile
 from tilia.media.loader import load_media
 from tilia.utils import get_tilia_class_string
@@ -17,6 +17,7 @@ from tilia.requests import get, post, serve, listen, Get, Post
 from tilia.timelines.collection.collection import Timelines
 from tilia.timelines.timeline_kinds import TimelineKind
 from tilia.undo_manager import PauseUndoManager
+from tilia.file.export import write_json
 from tilia.file.file_manager import open_tla
 from tilia.settings import settings
 
@@ -54,7 +55,7 @@ class App:
 
     def _setup_requests(self):
         LISTENS = {
-            (Post.APP_CLEAR, self.on_clear),
+            (Post.APP_CLEAR, self.on_app_clear),
             (Post.APP_CLOSE, self.on_close),
             (Post.APP_FILE_LOAD, self.on_file_load),
             (Post.APP_MEDIA_LOAD, self.load_media),
@@ -134,6 +135,8 @@ class App:
 
         self.file_manager.file = file
         self.update_recent_files()
+        # the previous file's state is no longer needed to recover from errors
+        self._discard_unused_blobs()
 
     def update_recent_files(self):
         try:
@@ -162,8 +165,7 @@ class App:
 
         match export_type:
             case "json":
-                with open(path.__str__(), "w") as f:
-                    json.dump(self.get_export_data(), f, indent=2)
+                write_json(path, self.get_export_data(stream=True))
             case "img":
                 try:
                     get(Get.MAIN_WINDOW).on_export(path.__str__())
@@ -202,6 +204,14 @@ class App:
 
         self.player = player
 
+        if (
+            success
+            and not initial_duration
+            and (cached_duration := probe.get_media_duration(path))
+        ):
+            # so timelines don't wait for the player to read the duration
+            self.set_file_media_duration(cached_duration)
+
         if success and record:
             post(Post.PLAYER_CANCEL_LOOP)
             post(Post.APP_RECORD_STATE, "media load")
@@ -223,6 +233,8 @@ class App:
         except Exception:
             self.recover_to_state(backup)
             tilia.errors.display(tilia.errors.UNDO_FAILED, traceback.format_exc())
+        else:
+            post(Post.APP_STATE_RECORDED, state)
 
     def recover_to_state(self, state: dict) -> None:
         """
@@ -237,12 +249,15 @@ class App:
         self._restore_app_state(state)
 
     def on_record_state(self, action, no_repeat=False, repeat_identifier=""):
+        state = self.get_app_state()
         self.undo_manager.record(
-            self.get_app_state(),
+            state,
             action,
             no_repeat=no_repeat,
             repeat_identifier=repeat_identifier,
         )
+        # states are snapshots, so they can be read by other threads
+        post(Post.APP_STATE_RECORDED, state)
 
     def get_id(self) -> int:
         """
@@ -342,11 +357,25 @@ class App:
         For relocating a path when moving pdf/media linked to the current tla file.
         Returns a path as str if found, else "".
         """
-        if not path or (old_path := Path(path)).exists():
+        if not path or Path(path).exists():
             return path
         if not (self.old_file_path and self.cur_file_path):
             return ""
 
+        if moved_path := probe.get_moved_path(
+            path, self.old_file_path, self.cur_file_path
+        ):
+            return moved_path
+
+        if moved_path := self._find_moved_path(path):
+            probe.set_moved_path(
+                path, self.old_file_path, self.cur_file_path, moved_path
+            )
+        return moved_path
+
+    def _find_moved_path(self, path: str) -> str:
+        old_path = Path(path)
+
         # check to make sure both paths exist and are different
         if (
             not (self.old_file_path and self.cur_file_path)
@@ -396,9 +425,20 @@ class App:
         self.undo_manager.clear()
         post(Post.REQUEST_CLEAR_UI)
 
+    def on_app_clear(self) -> None:
+        self.on_clear()
+        self._discard_unused_blobs()
+
+    def _discard_unused_blobs(self) -> None:
+        # undo history is cleared along with the file, so only the
+        # current timelines can still reference blobs
+        blobs.discard_unreferenced(self.get_timelines_state()[0])
+
     def reset_undo_manager(self):
+        state = self.get_app_state()
         self.undo_manager.clear()
-        self.undo_manager.record(self.get_app_state(), "file start")
+        self.undo_manager.record(state, "file start")
+        post(Post.APP_STATE_RECORDED, state)
 
     def restore_player_state(self, media_path: str, duration: float) -> None:
         if self.player.media_path == media_path:
@@ -427,9 +467,9 @@ class App:
         }
         return params
 
-    def get_export_data(self):
+    def get_export_data(self, stream: bool = False):
         return {
-            "timelines": self.timelines.get_export_data(),
+            "timelines": self.timelines.get_export_data(stream),
             "media_metadata": dict(self.file_manager.file.media_metadata),
             "media_path": get(Get.MEDIA_PATH),
         }
@@ -4,7 +4,6 @@ import sys
 import traceback
 
 import dotenv
-from PyQt6.QtWidgets import QApplication
 
 from tilia.app import App
 from tilia.clipboard import Clipboard
@@ -12,9 +11,7 @@ from tilia.dirs import PROJECT_ROOT, setup_dirs
 from tilia.file.file_manager import FileManager
 from tilia.file.autosave import AutoSaver
 from tilia.log import logger
-from tilia.media.player import QtAudioPlayer
 from tilia.ui.cli.ui import CLI
-from tilia.ui.qtui import QtUI, TiliaMainWindow
 from tilia.undo_manager import UndoManager
 
 app = None
@@ -40,12 +37,22 @@ def boot():
     if not success:
         print(f"Could not load environment variables from {dotenv_path}")
     args = setup_parser()
+    cwd = os.getcwd()
     setup_dirs()
     logger.setup()
-    q_application = QApplication(sys.argv)
     global app, ui
-    app = setup_logic()
-    ui = setup_ui(q_application, args.user_interface)
+    if args.user_interface == "cli" or args.command:
+        # the CLI doesn't need PyQt, which takes a while to import
+        from tilia.media.player.headless import HeadlessPlayer
+
+        app = setup_logic(player=HeadlessPlayer())
+        ui = CLI(headless=True)
+    else:
+        from PyQt6.QtWidgets import QApplication
+
+        q_application = QApplication(sys.argv)
+        app = setup_logic()
+        ui = setup_ui(q_application)
     logger.debug("INITIALISED")
     if os.environ.get("ENVIRONMENT") == "dev":
         import icecream
@@ -57,6 +64,11 @@ def boot():
     else:
         app.setup_file()
 
+    if args.command:
+        # e.g. `tilia batch corpus --jobs 8` runs a single CLI command and exits
+        os.chdir(cwd)  # so relative paths in the command work as expected
+        sys.exit(int(ui.run(args.command)))
+
     ui.launch()
 
 
@@ -64,14 +76,20 @@ def setup_parser():
     parser = argparse.ArgumentParser(exit_on_error=False)
     parser.add_argument("--file", nargs="?", default="")
     parser.add_argument("--user-interface", "-i", choices=["qt", "cli"], default="qt")
+    parser.add_argument(
+        "command", nargs=argparse.REMAINDER, help="CLI command to run and exit."
+    )
     return parser.parse_args()
 
 
-def setup_logic(autosaver=True):
+def setup_logic(autosaver=True, player=None):
     file_manager = FileManager()
     clipboard = Clipboard()
     undo_manager = UndoManager()
-    player = QtAudioPlayer()
+    if player is None:
+        from tilia.media.player import QtAudioPlayer
+
+        player = QtAudioPlayer()
 
     _app = App(
         file_manager=file_manager,
@@ -81,17 +99,15 @@ def setup_logic(autosaver=True):
     )
 
     if autosaver:
-        AutoSaver(_app.get_app_state)
+        AutoSaver()
 
     return _app
 
 
-def setup_ui(q_application: QApplication, interface: str):
-    if interface == "qt":
-        mw = TiliaMainWindow()
-        return QtUI(q_application, mw)
-    elif interface == "cli":
-        return CLI()
+def setup_ui(q_application):
+    from tilia.ui.qtui import QtUI, TiliaMainWindow
+
+    return QtUI(q_application, TiliaMainWindow())
 
 
 def get_initial_file(file: str):
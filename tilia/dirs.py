@@ -8,6 +8,9 @@ from tilia.utils import open_with_os
 
 autosaves_path = Path()
 logs_path = Path()
+# caches are only kept on disk once data dirs are set up
+svg_cache_path: Path | None = None
+probe_cache_path: Path | None = None
 _SITE_DATA_DIR = Path(platformdirs.site_data_dir(tilia.constants.APP_NAME))
 _USER_DATA_DIR = Path(
     platformdirs.user_data_dir(tilia.constants.APP_NAME, roaming=True)
@@ -39,12 +42,17 @@ def setup_logs_path(data_dir):
         create_logs_dir(data_dir)
 
 
+def setup_svg_cache_path(data_dir):
+    if not os.path.exists(svg_cache_path):
+        create_svg_cache_dir(data_dir)
+
+
 def setup_dirs() -> None:
     os.chdir(os.path.dirname(__file__))
 
     data_dir = setup_data_dir()
 
-    global autosaves_path, logs_path
+    global autosaves_path, logs_path, svg_cache_path, probe_cache_path
 
     autosaves_path = Path(data_dir, "autosaves")
     setup_autosaves_path(data_dir)
@@ -52,6 +60,11 @@ def setup_dirs() -> None:
     logs_path = Path(data_dir, "logs")
     setup_logs_path(data_dir)
 
+    svg_cache_path = Path(data_dir, "svg_cache")
+    setup_svg_cache_path(data_dir)
+
+    probe_cache_path = Path(data_dir, "probe_cache.json")
+
 
 def create_data_dir() -> Path:
     try:
@@ -72,5 +85,9 @@ def create_logs_dir(data_dir: Path):
     os.mkdir(Path(data_dir, "logs"))
 
 
+def create_svg_cache_dir(data_dir: Path):
+    os.mkdir(Path(data_dir, "svg_cache"))
+
+
 def open_autosaves_dir():
     open_with_os(autosaves_path)
@@ -9,6 +9,12 @@ class TiliaExit(TiliaException):
     pass
 
 
+class CLICommandFailed(TiliaException):
+    """Raised by CLI commands that fail after reporting why to the user."""
+
+    pass
+
+
 class UserCancelledDialog(TiliaException):
     pass
 
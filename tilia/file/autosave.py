@@ -2,22 +2,32 @@ import os
 import time
 from datetime import datetime
 from pathlib import Path
-from threading import Thread
-from typing import Callable
+from threading import Lock, Thread
 
 import tilia.constants
 from tilia import dirs
+from tilia.file import blobs
 from tilia.log import logger
 from tilia.settings import settings
 from .common import are_tilia_data_equal, write_tilia_file_to_disk
 from .tilia_file import TiliaFile
-from tilia.requests import get, Get
+from tilia.requests import listen, Post
 
 
 class AutoSaver:
-    def __init__(self, get_app_state: Callable[[], dict]):
-        self.get_app_state = get_app_state
+    """
+    Periodically saves the app state in a background thread.
+
+    The saved states are the snapshots the App records on the main thread
+    after every change, so the thread never reads timelines while they are
+    being modified. It only serializes and writes the latest snapshot.
+    """
+
+    def __init__(self):
         self._last_autosave_data = None
+        self._snapshot: dict | None = None
+        self._snapshot_lock = Lock()
+        self._autosave_paths = get_autosaves_paths()
         self._autosave_exception_list: list[Exception] = []
         self._autosave_thread = Thread(
             target=self._auto_save_loop,
@@ -25,67 +35,76 @@ class AutoSaver:
             daemon=True,
         )
 
+        listen(self, Post.APP_STATE_RECORDED, self.on_app_state_recorded)
+
         if settings.get("auto-save", "interval_(seconds)"):
             self._autosave_thread.start()
 
+    def on_app_state_recorded(self, state: dict) -> None:
+        # blobs are resolved now, as they may be discarded before the snapshot
+        # is saved (e.g. when the app is cleared)
+        snapshot = state | {"timelines": blobs.expand_timelines(state["timelines"])}
+        with self._snapshot_lock:
+            self._snapshot = snapshot
+
     def _auto_save_loop(self, *_) -> None:
         while True:
             try:
                 time.sleep(settings.get("auto-save", "interval_(seconds)"))
-                if self.needs_auto_save():
-                    data = self.get_app_state()
-                    autosave(data)
-                    self._last_autosave_data = data
+                self.save_snapshot()
             except Exception as excp:
                 self._autosave_exception_list.append(excp)
                 _raise_save_loop_exception(excp)
 
-    def needs_auto_save(self):
+    def save_snapshot(self) -> None:
+        """Autosaves the latest snapshot, if it wasn't saved yet."""
+        with self._snapshot_lock:
+            data, self._snapshot = self._snapshot, None
+
+        if data and self.needs_auto_save(data):
+            self.autosave(data)
+            self._last_autosave_data = data
+
+    def needs_auto_save(self, data: dict) -> bool:
         if not self._last_autosave_data:
             return True
 
-        return not are_tilia_data_equal(self._last_autosave_data, self.get_app_state())
+        return not are_tilia_data_equal(self._last_autosave_data, data)
 
+    def autosave(self, data: dict) -> None:
+        autosave_path = get_autosave_path(data["media_metadata"].get("title", ""))
+        write_tilia_file_to_disk(TiliaFile(**data), autosave_path, compact=True)
+        logger.debug(f"Autosave: {autosave_path}")
 
-def _raise_save_loop_exception(excp: Exception):
-    raise excp
+        if autosave_path not in self._autosave_paths:
+            self._autosave_paths.append(autosave_path)
+        self.delete_older_autosaves()
+
+    def delete_older_autosaves(self) -> None:
+        max_stored_files = settings.get("auto-save", "max_stored_files")
+        while len(self._autosave_paths) > max_stored_files:
+            try:
+                os.remove(self._autosave_paths.pop(0))
+            except FileNotFoundError:
+                pass
 
 
-def autosave(data: dict):
-    make_room_for_new_autosave()
-    autosave_path = get_autosave_path()
-    write_tilia_file_to_disk(TiliaFile(**data), autosave_path)
-    logger.debug(f"Autosave: {autosave_path}")
+def _raise_save_loop_exception(excp: Exception):
+    raise excp
 
 
-def get_autosave_path():
-    return Path(dirs.autosaves_path, get_autosave_filename())
+def get_autosave_path(title: str) -> Path:
+    return Path(dirs.autosaves_path, get_autosave_filename(title))
 
 
-def get_autosave_filename():
-    title = get(Get.MEDIA_TITLE)
+def get_autosave_filename(title: str) -> str:
     date = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     return f"{date}_{title}.{tilia.constants.FILE_EXTENSION}"
 
 
-def get_autosaves_paths() -> list[str]:
-    return [
-        str(Path(dirs.autosaves_path, file)) for file in os.listdir(dirs.autosaves_path)
-    ]
-
-
-def delete_older_autosaves(amount: int):
-    paths_by_creation_date = sorted(
-        get_autosaves_paths(),
-        key=lambda x: os.path.getctime(x),
+def get_autosaves_paths() -> list[Path]:
+    """Returns the paths of existing autosaves, from oldest to newest."""
+    return sorted(
+        (Path(dirs.autosaves_path, file) for file in os.listdir(dirs.autosaves_path)),
+        key=os.path.getctime,
     )
-    for path in paths_by_creation_date[:amount]:
-        os.remove(path)
-
-
-def make_room_for_new_autosave() -> None:
-    if (
-        remaining_autosaves := len(get_autosaves_paths())
-        - settings.get("auto-save", "max_stored_files")
-    ) >= 0:
-        delete_older_autosaves(remaining_autosaves + 1)
@@ -0,0 +1,58 @@
+"""
+Content-addressed storage for large timeline data, like a score's SVG.
+
+Timeline states reference blobs by hash, so undo snapshots, autosave
+comparisons and timeline hashes carry only the hash instead of the blob.
+Blobs are held once in memory and written in full only when a file is
+written to disk. Blobs no longer referenced are dropped when the app is
+cleared or another file is opened.
+"""
+
+from __future__ import annotations
+
+from tilia.timelines.hash_timelines import hash_function
+
+# attributes of timeline states that hold a blob hash,
+# mapped to the attribute that holds the blob in .tla files
+HASH_ATTR_TO_DATA_ATTR = {"svg_hash": "svg_data"}
+
+_blobs: dict[str, str] = {}
+
+
+def store(data: str) -> str:
+    """Stores `data`, if needed, and returns the hash that references it."""
+    if not data:
+        return ""
+    key = hash_function(data)
+    _blobs.setdefault(key, data)
+    return key
+
+
+def load(key: str) -> str:
+    return _blobs[key] if key else ""
+
+
+def discard_unreferenced(timelines: dict[str, dict]) -> None:
+    """Drops the blobs that are not referenced by the timeline states in `timelines`."""
+    referenced = {
+        state[attr]
+        for state in timelines.values()
+        for attr in HASH_ATTR_TO_DATA_ATTR.keys() & state.keys()
+    }
+    for key in _blobs.keys() - referenced:
+        del _blobs[key]
+
+
+def expand_timelines(timelines: dict[str, dict]) -> dict[str, dict]:
+    """
+    Returns a copy of `timelines` where blob hashes are replaced by
+    their blobs. Timeline states without blobs are not copied.
+    """
+    result = {}
+    for id, state in timelines.items():
+        if hash_attrs := HASH_ATTR_TO_DATA_ATTR.keys() & state.keys():
+            state = state.copy()
+            for attr in hash_attrs:
+                state[HASH_ATTR_TO_DATA_ATTR[attr]] = load(state.pop(attr))
+        result[id] = state
+    return result
@@ -4,6 +4,7 @@ import json
 import os
 from pathlib import Path
 
+from tilia.file import blobs
 from tilia.file.tilia_file import TiliaFile
 
 JSON_CONFIG = {"indent": 2}
@@ -26,9 +27,17 @@ def are_tilia_data_equal(data1: dict, data2: dict) -> bool:
     return True
 
 
-def write_tilia_file_to_disk(file: TiliaFile, path: str | Path):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(file.__dict__, f, **JSON_CONFIG)
+def write_tilia_file_to_disk(file: TiliaFile, path: str | Path, compact=False):
+    """
+    Writes to a temporary file that then replaces `path`, so `path` is never
+    left partially written. If `compact` is True, whitespace is omitted.
+    """
+    data = file.__dict__ | {"timelines": blobs.expand_timelines(file.timelines)}
+    config = {"separators": (",", ":")} if compact else JSON_CONFIG
+    temp_path = Path(f"{path}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **config)
+    os.replace(temp_path, path)
 
 
 def validate_save_path(path: Path):
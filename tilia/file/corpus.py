@@ -0,0 +1,314 @@
+"""
+SQLite index of the components of many .tla files, so they can be
+queried together without opening each file in the app.
+
+Files are read as JSON. Each component kind gets its own table, with a
+column for each serializable attribute, plus the measure and beat of the
+component's time (or start and end), computed from the file's first beat
+timeline. Files are only re-indexed when their contents change.
+
+Example:
+
+    with Corpus("corpus.sqlite") as corpus:
+        corpus.update(["path/to/tla/files"])
+        headers, rows = corpus.query(
+            "SELECT path, label FROM hierarchy JOIN files ON file_id = files.id"
+            " WHERE formal_type = ?",
+            ("sentence",),
+        )
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+from tilia.file.tilia_file import validate_tla_data
+from tilia.timelines.component_kinds import ComponentKind, get_component_class_by_kind
+from tilia.timelines.timeline_kinds import TimelineKind
+
+# columns of every component table, besides the serializable attributes
+BASE_COLUMNS = ["file_id", "timeline_id", "id"]
+METRIC_COLUMNS = ["measure", "beat", "end_measure", "end_beat"]
+
+
+class UpdateResult(NamedTuple):
+    indexed: list[str]
+    unchanged: list[str]
+    removed: list[str]
+    errors: list[tuple[str, str]]
+
+
+def get_table_name(kind: ComponentKind) -> str:
+    return kind.name.lower()
+
+
+def get_attribute_columns(kind: ComponentKind) -> list[str]:
+    return [
+        attr
+        for attr in get_component_class_by_kind(kind).SERIALIZABLE
+        if attr not in BASE_COLUMNS + METRIC_COLUMNS
+    ]
+
+
+def get_tla_paths(paths: Iterable[str | Path]) -> list[Path]:
+    """Returns `paths`, with directories replaced by the .tla files in them."""
+    result = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            result += sorted(path.rglob("*.tla"))
+        else:
+            result.append(path)
+    return [path.resolve() for path in result]
+
+
+def get_file_hash(path: Path) -> str:
+    return hashlib.md5(path.read_bytes()).hexdigest()
+
+
+class MetricPositionCalculator:
+    """Converts times to (measure number, beat) using a beat timeline's state."""
+
+    def __init__(self, beat_timeline_state: dict):
+        self.times = sorted(
+            c["time"] for c in beat_timeline_state["components"].values()
+        )
+        self.measure_numbers = beat_timeline_state["measure_numbers"]
+        self.measure_start_indices = list(
+            itertools.accumulate(beat_timeline_state["beats_in_measure"], initial=0)
+        )[:-1]
+
+    def get(self, time: float) -> tuple[int | None, float | None]:
+        """Beat is 1-based, with the fraction of the way to the next beat."""
+        beat_index = bisect.bisect_right(self.times, time) - 1
+        if beat_index < 0 or not self.measure_start_indices:
+            return None, None
+
+        measure_index = bisect.bisect_right(self.measure_start_indices, beat_index) - 1
+        if measure_index >= len(self.measure_numbers):
+            return None, None
+
+        beat = beat_index - self.measure_start_indices[measure_index] + 1
+        if beat_index + 1 < len(self.times):
+            beat_time = self.times[beat_index]
+            next_beat_time = self.times[beat_index + 1]
+            beat += (time - beat_time) / (next_beat_time - beat_time)
+
+        return self.measure_numbers[measure_index], beat
+
+
+def get_metric_position_calculator(
+    timelines: dict[str, dict],
+) -> MetricPositionCalculator | None:
+    """Uses the first beat timeline, as the app does when computing measures."""
+    beat_timelines = [
+        state
+        for state in timelines.values()
+        if state.get("kind") == TimelineKind.BEAT_TIMELINE.name
+    ]
+    if not beat_timelines:
+        return None
+    state = min(beat_timelines, key=lambda s: s.get("ordinal") or 0)
+    try:
+        return MetricPositionCalculator(state)
+    except (KeyError, TypeError):
+        return None
+
+
+def to_sql_value(value: Any) -> Any:
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return json.dumps(value)
+
+
+class Corpus:
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self.connection = sqlite3.connect(self.db_path)
+        self._setup_tables()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _setup_tables(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "id INTEGER PRIMARY KEY, path TEXT UNIQUE, mtime REAL, hash TEXT,"
+                " media_path TEXT, title TEXT, duration REAL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS timelines ("
+                "file_id INTEGER, id INTEGER, kind TEXT, name TEXT, ordinal INTEGER)"
+            )
+            for kind in ComponentKind:
+                columns = BASE_COLUMNS + get_attribute_columns(kind) + METRIC_COLUMNS
+                # quoted, as some attributes (e.g. "index", "end") are SQL keywords
+                columns_sql = ", ".join(f'"{column}"' for column in columns)
+                table = get_table_name(kind)
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ({columns_sql})"
+                )
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_file_id ON {table} (file_id)"
+                )
+
+    @property
+    def _tables_with_file_id(self) -> list[str]:
+        return ["timelines"] + [get_table_name(kind) for kind in ComponentKind]
+
+    def update(self, paths: Iterable[str | Path]) -> UpdateResult:
+        """
+        Indexes the .tla files in `paths` whose contents changed since they
+        were last indexed. Files that no longer exist are removed from the index.
+        """
+        result = UpdateResult([], [], [], [])
+        known = {
+            path: (id, mtime, hash)
+            for id, path, mtime, hash in self.connection.execute(
+                "SELECT id, path, mtime, hash FROM files"
+            )
+        }
+
+        for path in get_tla_paths(paths):
+            try:
+                mtime = os.path.getmtime(path)
+                if str(path) in known:
+                    id, prev_mtime, prev_hash = known[str(path)]
+                    if mtime == prev_mtime:
+                        result.unchanged.append(str(path))
+                        continue
+                    file_hash = get_file_hash(path)
+                    if file_hash == prev_hash:
+                        self._set_mtime(id, mtime)
+                        result.unchanged.append(str(path))
+                        continue
+                else:
+                    file_hash = get_file_hash(path)
+
+                self._index_file(path, mtime, file_hash)
+                result.indexed.append(str(path))
+            except (OSError, ValueError, KeyError, TypeError) as err:
+                result.errors.append((str(path), str(err)))
+
+        for path, (id, _, _) in known.items():
+            if not os.path.exists(path):
+                self._remove_file(id)
+                result.removed.append(path)
+
+        return result
+
+    def _set_mtime(self, id: int, mtime: float) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE files SET mtime = ? WHERE id = ?", (mtime, id)
+            )
+
+    def _remove_file(self, id: int) -> None:
+        with self.connection:
+            self._delete_file_rows(id)
+            self.connection.execute("DELETE FROM files WHERE id = ?", (id,))
+
+    def _delete_file_rows(self, id: int) -> None:
+        for table in self._tables_with_file_id:
+            self.connection.execute(f"DELETE FROM {table} WHERE file_id = ?", (id,))
+
+    def _index_file(self, path: Path, mtime: float, file_hash: str) -> None:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        valid, reason = validate_tla_data(data)
+        if not valid:
+            raise ValueError(reason)
+
+        metadata = data["media_metadata"]
+        # a file is indexed in a single transaction, so it is never half-indexed
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO files (path, mtime, hash, media_path, title, duration)"
+                " VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (path) DO UPDATE SET"
+                " mtime = excluded.mtime, hash = excluded.hash,"
+                " media_path = excluded.media_path, title = excluded.title,"
+                " duration = excluded.duration",
+                (
+                    str(path),
+                    mtime,
+                    file_hash,
+                    data["media_path"],
+                    metadata.get("title"),
+                    metadata.get("media length"),
+                ),
+            )
+            (file_id,) = self.connection.execute(
+                "SELECT id FROM files WHERE path = ?", (str(path),)
+            ).fetchone()
+            self._delete_file_rows(file_id)
+            self._insert_timelines(file_id, data["timelines"])
+
+    def _insert_timelines(self, file_id: int, timelines: dict[str, dict]) -> None:
+        metric_positions = get_metric_position_calculator(timelines)
+        kind_to_rows: dict[ComponentKind, list[tuple]] = {}
+        for timeline_id, state in timelines.items():
+            self.connection.execute(
+                "INSERT INTO timelines VALUES (?, ?, ?, ?, ?)",
+                (
+                    file_id,
+                    int(timeline_id),
+                    state.get("kind"),
+                    state.get("name"),
+                    state.get("ordinal"),
+                ),
+            )
+            for id, component in state.get("components", {}).items():
+                kind = ComponentKind[component["kind"]]
+                row = self._get_component_row(
+                    file_id, int(timeline_id), int(id), kind, component
+                )
+                kind_to_rows.setdefault(kind, []).append(
+                    row + self._get_metric_row(component, metric_positions)
+                )
+
+        for kind, rows in kind_to_rows.items():
+            placeholders = ", ".join("?" * len(rows[0]))
+            self.connection.executemany(
+                f"INSERT INTO {get_table_name(kind)} VALUES ({placeholders})", rows
+            )
+
+    @staticmethod
+    def _get_component_row(
+        file_id: int, timeline_id: int, id: int, kind: ComponentKind, component: dict
+    ) -> tuple:
+        return (file_id, timeline_id, id) + tuple(
+            to_sql_value(component.get(attr)) for attr in get_attribute_columns(kind)
+        )
+
+    @staticmethod
+    def _get_metric_row(
+        component: dict, metric_positions: MetricPositionCalculator | None
+    ) -> tuple:
+        if not metric_positions:
+            return None, None, None, None
+        start = component.get("time", component.get("start"))
+        end = component.get("end")
+        start_position = (
+            metric_positions.get(start) if start is not None else (None, None)
+        )
+        end_position = metric_positions.get(end) if end is not None else (None, None)
+        return start_position + end_position
+
+    def query(self, sql: str, parameters: Iterable = ()) -> tuple[list[str], list]:
+        """Runs `sql` and returns the column names and the rows of the result."""
+        cursor = self.connection.execute(sql, tuple(parameters))
+        headers = [column[0] for column in cursor.description or []]
+        return headers, cursor.fetchall()
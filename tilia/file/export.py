@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterator, TextIO, TYPE_CHECKING
+
+from tilia.timelines.timeline_kinds import TimelineKind
+
+if TYPE_CHECKING:
+    from tilia.timelines.base.timeline import Timeline
+    from tilia.timelines.beat.timeline import BeatTimeline
+
+INDENT = "  "
+
+# timeline kinds whose csv exports can be read by the csv importers
+CSV_EXPORTABLE_KINDS = [
+    TimelineKind.BEAT_TIMELINE,
+    TimelineKind.MARKER_TIMELINE,
+    TimelineKind.HIERARCHY_TIMELINE,
+    TimelineKind.PDF_TIMELINE,
+]
+
+
+def write_json(path: str | Path, data: Any) -> None:
+    """
+    Writes `data` to `path` as indented JSON. Iterators in `data` are
+    written item by item, so their items never need to be in memory at once.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        _write_json_value(file, data, 0)
+
+
+def _write_json_value(file: TextIO, value: Any, level: int) -> None:
+    if isinstance(value, dict):
+        items = ((json.dumps(str(key)) + ": ", item) for key, item in value.items())
+        _write_json_items(file, items, "{", "}", level)
+    elif isinstance(value, (list, tuple, Iterator)):
+        _write_json_items(file, (("", item) for item in value), "[", "]", level)
+    else:
+        file.write(json.dumps(value))
+
+
+def _write_json_items(file: TextIO, items, start: str, end: str, level: int):
+    file.write(start)
+    is_empty = True
+    for prefix, value in items:
+        file.write(("\n" if is_empty else ",\n") + INDENT * (level + 1) + prefix)
+        _write_json_value(file, value, level + 1)
+        is_empty = False
+    if not is_empty:
+        file.write("\n" + INDENT * level)
+    file.write(end)
+
+
+def write_csv(path: str | Path, timeline: Timeline) -> None:
+    """
+    Writes the components of `timeline` to `path`, one column per attribute.
+    The file can be imported back with the importers in `tilia.parsers.csv`.
+    """
+    if timeline.KIND not in CSV_EXPORTABLE_KINDS:
+        raise ValueError(f"Can't export {timeline} to csv.")
+
+    if timeline.KIND == TimelineKind.BEAT_TIMELINE:
+        rows = _get_beat_csv_rows(timeline)
+    else:
+        rows = _get_csv_rows(timeline)
+
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        for row in rows:
+            writer.writerow(row)
+
+
+def _format_csv_value(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _get_csv_rows(timeline: Timeline) -> Iterator[list[str]]:
+    data = timeline.get_export_data(stream=True)["components"]
+    first = next(data, None)
+    if first is None:
+        return
+
+    # tuples, like hierarchies' length in measures, don't fit in a cell
+    columns = [
+        attr
+        for attr, value in first.items()
+        if attr != "kind" and not isinstance(value, tuple)
+    ]
+    yield columns
+    yield [_format_csv_value(first[attr]) for attr in columns]
+    for component_data in data:
+        yield [_format_csv_value(component_data[attr]) for attr in columns]
+
+
+def _get_beat_csv_rows(timeline: BeatTimeline) -> Iterator[list[str]]:
+    """
+    Measure numbers are written only where they can't be inferred by the
+    importer, that is, where they are not the previous number plus one or
+    their display is forced.
+    """
+    yield ["time", "is_first_in_measure", "measure"]
+
+    measure_index = -1
+    expected_number = 1
+    for beat in timeline.components:
+        measure = ""
+        if timeline.is_first_in_measure(beat):
+            measure_index += 1
+            number = timeline.measure_numbers[measure_index]
+            if (
+                number != expected_number
+                or measure_index in timeline.measures_to_force_display
+            ):
+                measure = str(number)
+            expected_number = number + 1
+
+        yield [str(beat.time), str(timeline.is_first_in_measure(beat)), measure]
@@ -0,0 +1,119 @@
+"""
+Cache of what is found out by reading the files a .tla file links to:
+the number of pages of PDFs, the duration of media and where files that
+were moved along with the .tla file were found.
+
+Page counts and durations are keyed by the path, size and modification
+time of the file, so they are read again when the file changes. Entries
+are kept in memory and, once data dirs are set up, in a JSON file, so
+they are also reused when files are opened in later sessions.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pypdf
+
+from tilia import dirs
+
+MAX_ENTRIES = 1000
+
+_entries: dict[str, Any] | None = None
+
+
+def _get_file_key(kind: str, path: str | Path) -> str | None:
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return json.dumps([kind, os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+
+
+def _get_entries() -> dict[str, Any]:
+    global _entries
+    if _entries is None:
+        _entries = {}
+        if dirs.probe_cache_path:
+            try:
+                with open(dirs.probe_cache_path, encoding="utf-8") as f:
+                    _entries = json.load(f)
+            except (OSError, ValueError):
+                pass
+    return _entries
+
+
+def _get(key: str | None) -> Any:
+    return _get_entries().get(key) if key else None
+
+
+def _set(key: str | None, value: Any) -> None:
+    if not key:
+        return
+    entries = _get_entries()
+    entries.pop(key, None)
+    entries[key] = value
+    # entries are kept in insertion order, so the oldest are deleted first
+    for old_key in list(entries)[:-MAX_ENTRIES]:
+        del entries[old_key]
+    _save()
+
+
+def _save() -> None:
+    if not dirs.probe_cache_path:
+        return
+    try:
+        with open(dirs.probe_cache_path, "w", encoding="utf-8") as f:
+            json.dump(_entries, f)
+    except OSError:
+        pass
+
+
+def clear() -> None:
+    global _entries
+    _entries = {}
+    _save()
+
+
+def get_pdf_page_count(path: str) -> int:
+    """Raises the errors raised by pypdf if the PDF has to be read and can't be."""
+    key = _get_file_key("pdf_page_count", path)
+    if (page_count := _get(key)) is not None:
+        return page_count
+
+    page_count = len(pypdf.PdfReader(path).pages)
+    _set(key, page_count)
+    return page_count
+
+
+def get_media_duration(path: str) -> float | None:
+    """Returns the duration found when the media was last loaded, if any."""
+    return _get(_get_file_key("media_duration", path))
+
+
+def set_media_duration(path: str, duration: float) -> None:
+    _set(_get_file_key("media_duration", path), duration)
+
+
+def _get_moved_path_key(path: str, old_file_path: Path, cur_file_path: Path) -> str:
+    return json.dumps(["moved_path", path, str(old_file_path), str(cur_file_path)])
+
+
+def get_moved_path(path: str, old_file_path: Path, cur_file_path: Path) -> str:
+    """
+    Returns where `path` was found after the .tla file was moved from
+    `old_file_path` to `cur_file_path`, if it was found and still exists.
+    """
+    moved_path = _get(_get_moved_path_key(path, old_file_path, cur_file_path))
+    if moved_path and os.path.exists(moved_path):
+        return moved_path
+    return ""
+
+
+def set_moved_path(
+    path: str, old_file_path: Path, cur_file_path: Path, moved_path: str
+) -> None:
+    _set(_get_moved_path_key(path, old_file_path, cur_file_path), moved_path)
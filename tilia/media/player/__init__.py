@@ -1,4 +1,19 @@
 from .base import Player
-from .youtube import YouTubePlayer
-from .qtaudio import QtAudioPlayer
-from .qtvideo import QtVideoPlayer
+
+
+def __getattr__(name):
+    # Qt based players are imported on demand, so the
+    # package can be used without PyQt (e.g. by the CLI)
+    if name == "YouTubePlayer":
+        from .youtube import YouTubePlayer
+
+        return YouTubePlayer
+    elif name == "QtAudioPlayer":
+        from .qtaudio import QtAudioPlayer
+
+        return QtAudioPlayer
+    elif name == "QtVideoPlayer":
+        from .qtvideo import QtVideoPlayer
+
+        return QtVideoPlayer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,10 +6,14 @@ from abc import ABC, abstractmethod
 from enum import Enum, auto
 from pathlib import Path
 
-from PyQt6.QtCore import QTimer
+try:
+    from PyQt6.QtCore import QTimer, Qt
+except ImportError:  # running headless, without PyQt
+    QTimer = None
 
 import tilia.errors
 from tilia.media import exporter
+from tilia.media.player.clock import PlaybackClock
 from tilia.utils import get_tilia_class_string
 from tilia.requests import (
     listen,
@@ -30,7 +34,10 @@ class MediaTimeChangeReason(Enum):
 
 
 class Player(ABC):
+    # the engine is polled every UPDATE_INTERVAL ms, and the time
+    # is interpolated between polls, every FRAME_INTERVAL ms
     UPDATE_INTERVAL = 100
+    FRAME_INTERVAL = 16
     E = UPDATE_INTERVAL / 500
     MEDIA_TYPE = None
 
@@ -48,8 +55,12 @@ class Player(ABC):
         self.is_looping = False
         self.loop_start = 0
         self.loop_end = 0
-        self.qtimer = QTimer()
-        self.qtimer.timeout.connect(self._play_loop)
+        self.clock = PlaybackClock()
+        self.qtimer = None
+        if QTimer:
+            self.qtimer = QTimer()
+            self.qtimer.setTimerType(Qt.TimerType.PreciseTimer)
+            self.qtimer.timeout.connect(self._play_loop)
 
     def __str__(self):
         return get_tilia_class_string(self)
@@ -197,6 +208,7 @@ class Player(ABC):
 
     def on_playback_rate_try(self, playback_rate: float) -> None:
         self._engine_try_playback_rate(playback_rate)
+        self.clock.rate = playback_rate
 
     def on_seek(self, time: float, if_paused: bool = False) -> None:
         if if_paused and self.is_playing:
@@ -208,6 +220,7 @@ class Player(ABC):
             self._engine_seek(time)
 
         self.current_time = time
+        self.clock.sync(time)
 
         post(
             Post.PLAYER_CURRENT_TIME_CHANGED,
@@ -246,13 +259,25 @@ class Player(ABC):
         )
 
     def start_play_loop(self):
-        self.qtimer.start(self.UPDATE_INTERVAL)
+        self.clock.reset()
+        if self.qtimer:
+            self.qtimer.start(self.FRAME_INTERVAL)
 
     def stop_play_loop(self):
-        self.qtimer.stop()
+        if self.qtimer:
+            self.qtimer.stop()
 
     def _play_loop(self) -> None:
-        self.current_time = self._engine_get_current_time() - self.playback_start
+        if self.clock.needs_sync(self.UPDATE_INTERVAL / 1000):
+            self.clock.sync(self._engine_get_current_time() - self.playback_start)
+
+        time = self.clock.get_time()
+        if self.current_time - self.E < time < self.current_time:
+            # the engine reported a time slightly behind the interpolated one,
+            # so the playhead waits for it instead of moving back
+            time = self.current_time
+
+        self.current_time = time
         if self.check_not_loop_back(self.current_time):
             post(
                 Post.PLAYER_CURRENT_TIME_CHANGED,
@@ -295,49 +320,64 @@ class Player(ABC):
             self.load_media(media_path)
 
     @abstractmethod
-    def _engine_pause(self) -> None: ...
+    def _engine_pause(self) -> None:
+        ...
 
     @abstractmethod
-    def _engine_unpause(self) -> None: ...
+    def _engine_unpause(self) -> None:
+        ...
 
     @abstractmethod
-    def _engine_get_current_time(self) -> float: ...
+    def _engine_get_current_time(self) -> float:
+        ...
 
     @abstractmethod
-    def _engine_stop(self): ...
+    def _engine_stop(self):
+        ...
 
     @abstractmethod
-    def _engine_seek(self, time: float) -> None: ...
+    def _engine_seek(self, time: float) -> None:
+        ...
 
     @abstractmethod
-    def _engine_unload_media(self) -> None: ...
+    def _engine_unload_media(self) -> None:
+        ...
 
     @abstractmethod
-    def _engine_load_media(self, media_path: str) -> None: ...
+    def _engine_load_media(self, media_path: str) -> None:
+        ...
 
     @abstractmethod
-    def _engine_play(self) -> None: ...
+    def _engine_play(self) -> None:
+        ...
 
     @abstractmethod
-    def _engine_get_media_duration(self) -> float: ...
+    def _engine_get_media_duration(self) -> float:
+        ...
 
     @abstractmethod
-    def _engine_exit(self) -> float: ...
+    def _engine_exit(self) -> float:
+        ...
 
     @abstractmethod
-    def _engine_set_volume(self, volume: int) -> None: ...
+    def _engine_set_volume(self, volume: int) -> None:
+        ...
 
     @abstractmethod
-    def _engine_set_mute(self, is_muted: bool) -> None: ...
+    def _engine_set_mute(self, is_muted: bool) -> None:
+        ...
 
     @abstractmethod
-    def _engine_try_playback_rate(self, playback_rate: float) -> None: ...
+    def _engine_try_playback_rate(self, playback_rate: float) -> None:
+        ...
 
     @abstractmethod
-    def _engine_set_playback_rate(self, playback_rate: float) -> None: ...
+    def _engine_set_playback_rate(self, playback_rate: float) -> None:
+        ...
 
     @abstractmethod
-    def _engine_loop(self, is_looping: bool) -> None: ...
+    def _engine_loop(self, is_looping: bool) -> None:
+        ...
 
     def __repr__(self):
         return f"{type(self)}-{id(self)}"
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+class PlaybackClock:
+    """
+    Estimates the playback time between polls of a player's engine.
+    Engines report their time coarsely, so the time of the last poll is
+    extrapolated with a monotonic clock and the playback rate.
+    """
+
+    def __init__(self, get_now: Callable[[], float] = time.monotonic):
+        self.get_now = get_now
+        self.rate = 1.0
+        self._media_time = 0.0
+        self._synced_at: float | None = None
+
+    def sync(self, media_time: float) -> None:
+        self._media_time = media_time
+        self._synced_at = self.get_now()
+
+    def reset(self) -> None:
+        self._synced_at = None
+
+    def needs_sync(self, interval: float) -> bool:
+        """Returns True if the last sync was more than `interval` seconds ago."""
+        return self._synced_at is None or self.get_now() - self._synced_at >= interval
+
+    def get_time(self) -> float:
+        if self._synced_at is None:
+            return self._media_time
+        return self._media_time + (self.get_now() - self._synced_at) * self.rate
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+
+import pydub.utils
+
+from .base import Player
+
+
+def get_media_duration(path: str | Path) -> float | None:
+    """
+    Returns the duration of the media at `path`, in seconds,
+    or None if it could not be determined.
+    """
+    if Path(path).suffix.lower() == ".wav":
+        try:
+            with wave.open(str(path)) as file:
+                return file.getnframes() / file.getframerate()
+        except (OSError, EOFError, wave.Error):
+            pass
+
+    try:
+        # requires ffprobe
+        return float(pydub.utils.mediainfo(str(path))["duration"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+class HeadlessPlayer(Player):
+    """
+    Player that doesn't play anything. Used when running without PyQt,
+    where it only reads the duration of the loaded media.
+    """
+
+    MEDIA_TYPE = ""
+
+    def __init__(self):
+        super().__init__()
+        self._position = 0.0
+        self._loaded_duration = 0.0
+
+    def on_media_load_done(self, path, start, end):
+        super().on_media_load_done(path, start, end)
+        self.on_media_duration_available(self._loaded_duration)
+
+    def _engine_load_media(self, media_path: str) -> bool:
+        duration = get_media_duration(media_path)
+        if duration is None:
+            return False
+        self._loaded_duration = duration
+        return True
+
+    def _engine_get_current_time(self) -> float:
+        return self._position
+
+    def _engine_seek(self, time: float) -> None:
+        self._position = time
+
+    def _engine_stop(self) -> None:
+        self._position = 0.0
+
+    def _engine_unload_media(self) -> None:
+        self._position = 0.0
+        self._loaded_duration = 0.0
+
+    def _engine_get_media_duration(self) -> float:
+        return self._loaded_duration
+
+    def _engine_play(self) -> None:
+        ...
+
+    def _engine_pause(self) -> None:
+        ...
+
+    def _engine_unpause(self) -> None:
+        ...
+
+    def _engine_exit(self) -> None:
+        ...
+
+    def _engine_set_volume(self, volume: int) -> None:
+        ...
+
+    def _engine_set_mute(self, is_muted: bool) -> None:
+        ...
+
+    def _engine_try_playback_rate(self, playback_rate: float) -> None:
+        ...
+
+    def _engine_set_playback_rate(self, playback_rate: float) -> None:
+        ...
+
+    def _engine_loop(self, is_looping: bool) -> None:
+        ...
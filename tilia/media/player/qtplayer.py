@@ -7,6 +7,7 @@ from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QAudio
 
 from .base import Player
 
+from tilia.file import probe
 from tilia.requests import Post, post
 from tilia.ui.player import PlayerStatus
 
@@ -29,6 +30,8 @@ class QtPlayer(Player):
         post(Post.PLAYER_UPDATE_CONTROLS, PlayerStatus.PLAYER_ENABLED)
 
     def on_media_duration_available(self, duration):
+        if duration and (path := self.player.source().toLocalFile()):
+            probe.set_media_duration(path, duration / 1000)
         super().on_media_duration_available(duration / 1000)
 
     def _engine_load_media(self, media_path: str) -> bool:
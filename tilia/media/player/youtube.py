@@ -83,6 +83,8 @@ class UrlRequestInterceptor(QWebEngineUrlRequestInterceptor):
 class YouTubePlayer(Player):
     MEDIA_TYPE = "youtube"
     PATH_TO_HTML = Path(__file__).parent / "youtube.html"
+    # times are requested from the page asynchronously, on every tick
+    FRAME_INTERVAL = Player.UPDATE_INTERVAL
 
     def __init__(self):
         super().__init__()
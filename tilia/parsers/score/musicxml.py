@@ -8,7 +8,6 @@ from bisect import bisect
 from lxml import etree
 
 from tilia.requests import Get, get, Post, post
-from tilia.parsers.score.musicxml_to_svg import musicxml_to_svg
 from tilia.timelines.beat.timeline import BeatTimeline
 from tilia.timelines.score.components import Note
 from tilia.timelines.score.timeline import ScoreTimeline
@@ -490,7 +489,6 @@ def notes_from_musicXML(
 
     reader_kwargs = reader_kwargs or {}
 
-    svg_converter = musicxml_to_svg(score_tl.id)
     with TiliaMXLReader(path, file_kwargs, reader_kwargs) as file:
         parser = etree.XMLParser(remove_blank_text=True)
         tree = etree.parse(file, parser=parser, **reader_kwargs).getroot()
@@ -518,7 +516,12 @@ def notes_from_musicXML(
     for part in tree.findall("part"):
         _parse_part(part, part.get("id"))
     post(Post.SCORE_TIMELINE_COMPONENTS_DESERIALIZED, score_tl.id)
-    svg_converter.to_svg(str(etree.tostring(tree, xml_declaration=True), "utf-8"))
+    # rendering is left to the UI, as it needs a web engine
+    post(
+        Post.SCORE_TIMELINE_SVG_CREATE,
+        score_tl.id,
+        str(etree.tostring(tree, xml_declaration=True), "utf-8"),
+    )
 
     return True, errors
 
@@ -25,6 +25,11 @@ class SvgWebEngineTracker(QObject):
         self.page = page
         self.on_svg_loaded = on_svg_loaded
         self.display_error = display_error
+        self.musicxml = ""
+
+    @pyqtSlot(result=str)
+    def get_musicxml(self) -> str:
+        return self.musicxml
 
     @pyqtSlot(str)
     def set_svg(self, svg: str) -> None:
@@ -70,8 +75,12 @@ class musicxml_to_svg(QWebEngineView):
         self.deleteLater()
 
     def to_svg(self, data: str) -> None:
+        # the page fetches the score through the web channel,
+        # so it doesn't have to be inlined in a script
+        self.shared_object.musicxml = data
+
         def convert():
-            self.page().runJavaScript(f"loadSVG(`{data}`)")
+            self.page().runJavaScript("loadSVGFromBackend()")
 
         if self.is_engine_loaded:
             convert()
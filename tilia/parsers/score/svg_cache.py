@@ -0,0 +1,79 @@
+"""
+Disk cache of scores rendered to SVG.
+
+Rendering a score needs a web engine and a full layout of the score,
+so rendered SVGs are stored along with their beat positions, keyed by
+a digest of the partwise MusicXML and of the page that renders it.
+Importing a score that was already rendered then skips rendering.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from tilia import dirs
+from tilia.requests import get, Get
+from tilia.timelines.hash_timelines import hash_function
+
+MAX_ENTRIES = 50
+RENDERER_PATH = Path(__file__).parent / "svg_maker.html"
+
+
+def get_key(musicxml: str) -> str:
+    return hash_function(RENDERER_PATH.read_text(encoding="utf-8") + musicxml)
+
+
+def _get_path(key: str) -> Path | None:
+    if not dirs.svg_cache_path:
+        return None
+    return Path(dirs.svg_cache_path, f"{key}.json")
+
+
+def load(key: str) -> tuple[str, dict[Any, float]] | None:
+    """Returns the SVG and beat positions rendered for `key`, if they are cached."""
+    if not (path := _get_path(key)) or not path.exists():
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+        # so entries that are used are the last to be deleted
+        os.utime(path)
+        return entry["svg"], entry["viewer_beat_x"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def set_timeline_svg(timeline_id: int, key: str) -> bool:
+    """
+    Sets the SVG cached for `key` on the score timeline with `timeline_id`.
+    Returns False if there is no SVG cached for `key`.
+    """
+    if not (cached := load(key)):
+        return False
+
+    svg, viewer_beat_x = cached
+    timelines = get(Get.TIMELINE_COLLECTION)
+    # beat positions are set first, so the viewer doesn't compute them
+    timelines.set_timeline_data(timeline_id, "viewer_beat_x", viewer_beat_x)
+    timelines.set_timeline_data(timeline_id, "svg_data", svg)
+    return True
+
+
+def store(key: str, svg: str, viewer_beat_x: dict[float, float]) -> None:
+    if not (path := _get_path(key)):
+        return
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"svg": svg, "viewer_beat_x": viewer_beat_x}, f)
+        _delete_older_entries()
+    except OSError:
+        pass
+
+
+def _delete_older_entries() -> None:
+    paths = sorted(Path(dirs.svg_cache_path).glob("*.json"), key=os.path.getmtime)
+    for path in paths[:-MAX_ENTRIES]:
+        path.unlink(missing_ok=True)
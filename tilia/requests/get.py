@@ -45,6 +45,7 @@ class Get(Enum):
     MEDIA_TITLE = auto()
     MEDIA_TYPE = auto()
     METRIC_POSITION = auto()
+    METRIC_POSITIONS = auto()
     PLAYBACK_AREA_WIDTH = auto()
     PLAYER_CLASS = auto()
     RIGHT_MARGIN_X = auto()
@@ -14,6 +14,7 @@ class Post(Enum):
     APP_MEDIA_LOAD = auto()
     APP_RECORD_STATE = auto()
     APP_SETUP_FILE = auto()
+    APP_STATE_RECORDED = auto()
     APP_STATE_RECOVER = auto()
     APP_STATE_RESTORE = auto()
     BEAT_ADD = auto()
@@ -117,6 +118,7 @@ class Post(Enum):
     REQUEST_SAVE_TO_PATH = auto()
     SCORE_TIMELINE_CLEAR_DONE = auto()
     SCORE_TIMELINE_COMPONENTS_DESERIALIZED = auto()
+    SCORE_TIMELINE_SVG_CREATE = auto()
     SELECTION_BOX_DESELECT_ITEM = auto()
     SELECTION_BOX_SELECT_ITEM = auto()
     SETTINGS_UPDATED = auto()
@@ -126,10 +128,12 @@ class Post(Enum):
     TIMELINES_AUTO_SCROLL_UPDATE = auto()
     TIMELINES_CLEAR = auto()
     TIMELINES_CROP_DONE = auto()
+    TIMELINES_SCALE_DONE = auto()
     TIMELINE_ADD = auto()
     TIMELINE_CLEAR_FROM_MANAGE_TIMELINES = auto()
     TIMELINE_COMPONENT_CREATED = auto()
     TIMELINE_COMPONENT_DELETED = auto()
+    TIMELINE_COMPONENTS_DELETED = auto()
     TIMELINE_COMPONENT_DESELECTED = auto()
     TIMELINE_COMPONENT_SELECTED = auto()
     TIMELINE_COMPONENT_SET_DATA_DONE = auto()
@@ -1,11 +1,70 @@
-from PyQt6.QtCore import QSettings, QObject
+import json
 from pathlib import Path
 
+import platformdirs
+
 import tilia.constants
 from tilia.ui.enums import ScrollType
 
+try:
+    from PyQt6.QtCore import QSettings
+except ImportError:  # running headless, without PyQt
+    QSettings = None
+
+
+class JsonSettings:
+    """
+    Lightweight stand-in for the parts of QSettings used by SettingsManager.
+    Used when running without PyQt. Settings are stored as a flat
+    JSON object, keyed by "group/setting" paths.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._group = ""
+        try:
+            self._values = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._values = {}
+
+    def _get_key(self, key: str) -> str:
+        return "/".join(part for part in (self._group, key) if part)
+
+    def value(self, key: str, default=None):
+        return self._values.get(self._get_key(key), default)
+
+    def setValue(self, key: str, value) -> None:
+        key = self._get_key(key)
+        if self._values.get(key) == value:
+            return
+        self._values[key] = value
+        self._write()
+
+    def beginGroup(self, group: str) -> None:
+        self._group = group
+
+    def endGroup(self) -> None:
+        self._group = ""
+
+    def remove(self, key: str) -> None:
+        prefix = self._get_key(key)
+        self._values = {
+            k: v
+            for k, v in self._values.items()
+            if prefix and k != prefix and not k.startswith(prefix + "/")
+        }
+        self._write()
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # values that are not JSON types, like enums, are stored as strings
+        # and replaced by their defaults when read
+        self.path.write_text(
+            json.dumps(self._values, indent=2, default=str), encoding="utf-8"
+        )
+
 
-class SettingsManager(QObject):
+class SettingsManager:
 
     DEFAULT_SETTINGS = {
         "general": {
@@ -89,7 +148,15 @@ class SettingsManager(QObject):
     }
 
     def __init__(self):
-        self._settings = QSettings(tilia.constants.APP_NAME, "Desktop Settings")
+        if QSettings:
+            self._settings = QSettings(tilia.constants.APP_NAME, "Desktop Settings")
+        else:
+            self._settings = JsonSettings(
+                Path(
+                    platformdirs.user_config_dir(tilia.constants.APP_NAME),
+                    "settings.json",
+                )
+            )
         self._files_updated_callbacks = set()
         self._cache = {}
         self._check_all_default_settings_present()
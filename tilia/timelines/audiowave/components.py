@@ -16,6 +16,8 @@ from tilia.timelines.base.component import SegmentLikeTimelineComponent
 
 
 class AmplitudeBar(SegmentLikeTimelineComponent):
+    __slots__ = ("start", "end", "amplitude")
+
     SERIALIZABLE = ["start", "end", "amplitude"]
     ORDERING_ATTRS = ("start",)
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterator
+
+_MISSING = object()
+
+
+class AttributeIndex:
+    """
+    Hash index from the values of an attribute to the objects
+    (e.g. timeline components) that have them, so objects can be
+    looked up by value without scanning all of them.
+    Objects that don't have the attribute are not indexed.
+    Values must be hashable.
+    """
+
+    def __init__(self, attr: str):
+        self.attr = attr
+        self._value_to_objects: dict[Hashable, set] = {}
+        self._object_to_value: dict[Any, Hashable] = {}
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._value_to_objects)
+
+    def add(self, obj: Any) -> None:
+        """Indexes `obj` by the current value of the attribute, replacing the old one."""
+        self.discard(obj)
+        value = getattr(obj, self.attr, _MISSING)
+        if value is _MISSING:
+            return
+        self._object_to_value[obj] = value
+        self._value_to_objects.setdefault(value, set()).add(obj)
+
+    def discard(self, obj: Any) -> None:
+        value = self._object_to_value.pop(obj, _MISSING)
+        if value is _MISSING:
+            return
+        objects = self._value_to_objects[value]
+        objects.discard(obj)
+        if not objects:
+            del self._value_to_objects[value]
+
+    def get(self, value: Hashable) -> set:
+        """Returns the objects whose attribute equals `value`. Must not be modified."""
+        return self._value_to_objects.get(value, set())
+
+    def items(self):
+        return self._value_to_objects.items()
+
+    def clear(self) -> None:
+        self._value_to_objects = {}
+        self._object_to_value = {}
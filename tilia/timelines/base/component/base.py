@@ -11,6 +11,10 @@ from tilia.utils import get_tilia_class_string
 
 
 class TimelineComponent(ABC):
+    # Subclasses with many instances, like beats and notes, declare their
+    # attributes in __slots__ to save memory. Others keep a __dict__.
+    __slots__ = ("timeline", "id", "_hash")
+
     SERIALIZABLE = []
     ORDERING_ATTRS = tuple()
 
@@ -22,7 +26,7 @@ class TimelineComponent(ABC):
     def __init__(self, timeline: Timeline, id: int, *args, **kwargs):
         self.timeline = timeline
         self.id = id
-        self.update_hash()
+        self._hash = None
 
     def __str__(self):
         return get_tilia_class_string(self)
@@ -30,6 +34,15 @@ class TimelineComponent(ABC):
     def __lt__(self, other):
         return self.ordinal < other.ordinal
 
+    def get_instance_attrs(self) -> dict[str, Any]:
+        """Returns instance attributes, whether they are in __slots__ or not."""
+        attrs = {}
+        for cls in reversed(type(self).__mro__):
+            for attr in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, attr):
+                    attrs[attr] = getattr(self, attr)
+        return attrs | getattr(self, "__dict__", {})
+
     @classmethod
     def frontend_name(cls):
         return cls.__name__.lower()
@@ -44,8 +57,16 @@ class TimelineComponent(ABC):
             string_to_hash += "|" + str(getattr(self, attr))
         return hash_function(string_to_hash)
 
-    def update_hash(self):
-        self.hash = self.to_hash()
+    @property
+    def hash(self) -> str:
+        # Hashes are only read when recording or comparing states, so they
+        # are computed on demand instead of after every change.
+        if self._hash is None:
+            self._hash = self.to_hash()
+        return self._hash
+
+    def invalidate_hash(self):
+        self._hash = None
 
     def validate_set_data(self, attr, value):
         if not hasattr(self, attr):
@@ -65,7 +86,8 @@ class TimelineComponent(ABC):
         setattr(self, attr, value)
         if attr in self.ORDERING_ATTRS:
             self.timeline.update_component_order(self)
-        self.update_hash()
+        self.timeline.update_component_index(self, attr)
+        self.invalidate_hash()
         return value, True
 
     def get_data(self, attr: str):
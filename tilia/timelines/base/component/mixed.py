@@ -6,23 +6,32 @@ from tilia.timelines.base.timeline import TimelineComponentManager
 
 
 def scale_mixed(cm: TimelineComponentManager, factor: float) -> None:
-    for component in list(cm).copy():
+    # Scaling keeps components in order, so attributes are set directly,
+    # without validating or reordering after each of them
+    for component in cm:
         if isinstance(component, PointLikeTimelineComponent):
-            component.set_data("time", component.get_data("time") * factor)
+            component.time = component.get_data("time") * factor
         elif isinstance(component, SegmentLikeTimelineComponent):
-            component.set_data("start", component.get_data("start") * factor)
-            component.set_data("end", component.get_data("end") * factor)
+            component.start = component.get_data("start") * factor
+            component.end = component.get_data("end") * factor
+        else:
+            continue
+        component.invalidate_hash()
 
 
 def crop_mixed(cm: TimelineComponentManager, length: float) -> None:
-    for component in list(cm).copy():
+    to_delete = []
+    for component in cm:
         if isinstance(component, PointLikeTimelineComponent):
             if component.get_data("time") > length:
-                cm.delete_component(component)
+                to_delete.append(component)
         elif isinstance(component, SegmentLikeTimelineComponent):
-            start = component.get_data("start")
-            end = component.get_data("end")
-            if start >= length:
-                cm.delete_component(component)
-            elif end > length:
-                component.set_data("end", length)
+            if component.get_data("start") >= length:
+                to_delete.append(component)
+            elif component.get_data("end") > length:
+                component.end = length
+                component.invalidate_hash()
+
+    cm.timeline.delete_components(to_delete)
+    # components with the same start might now be tied on their end
+    cm.sort_components()
@@ -12,6 +12,8 @@ from tilia.ui.format import format_media_time
 
 
 class PointLikeTimelineComponent(TimelineComponent):
+    __slots__ = ()
+
     @property
     def metric_position(self) -> MetricPosition | None:
         return get(Get.METRIC_POSITION, self.get_data("time"))
@@ -67,12 +69,14 @@ class PointLikeTimelineComponent(TimelineComponent):
 
 
 def scale_pointlike(cm: TimelineComponentManager, factor: float) -> None:
-    # Order might change when setting time, so we need a copy
-    for component in list(cm).copy():
-        component.set_data("time", component.get_data("time") * factor)
+    # Scaling keeps components in order, so times are set directly,
+    # without validating or reordering after each of them
+    for component in cm:
+        component.time = component.get_data("time") * factor
+        component.invalidate_hash()
 
 
 def crop_pointlike(cm: TimelineComponentManager, length: float) -> None:
-    for component in list(cm).copy():
-        if component.get_data("time") > length:
-            cm.delete_component(component)
+    cm.timeline.delete_components(
+        [component for component in cm if component.get_data("time") > length]
+    )
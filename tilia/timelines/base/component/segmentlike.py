@@ -13,6 +13,8 @@ T = TypeVar("T")
 
 
 class SegmentLikeTimelineComponent(TimelineComponent):
+    __slots__ = ()
+
     start: float
     end: float
 
@@ -125,18 +127,23 @@ class SegmentLikeTimelineComponent(TimelineComponent):
 
 
 def scale_segmentlike(cm: TimelineComponentManager, factor: float) -> None:
+    # Scaling keeps components in order, so attributes are set directly,
+    # without validating or reordering after each of them
     for component in cm:
-        # attributes need to be set directly
-        # to override validation
         component.start = component.get_data("start") * factor
         component.end = component.get_data("end") * factor
+        component.invalidate_hash()
 
 
 def crop_segmentlike(cm: TimelineComponentManager, length: float) -> None:
-    for component in list(cm).copy():
-        start = component.get_data("start")
-        end = component.get_data("end")
-        if start >= length:
-            cm.delete_component(component)
-        elif end > length:
-            component.set_data("end", length)
+    to_delete = []
+    for component in cm:
+        if component.get_data("start") >= length:
+            to_delete.append(component)
+        elif component.get_data("end") > length:
+            component.end = length
+            component.invalidate_hash()
+
+    cm.timeline.delete_components(to_delete)
+    # components with the same start might now be tied on their end
+    cm.sort_components()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from tilia.requests import get, Get
+from tilia.timelines.component_kinds import ComponentKind
 
 if TYPE_CHECKING:
     from tilia.timelines.base.component import TimelineComponent
@@ -29,3 +32,68 @@ def get_export_attributes_extended(cls: type[TimelineComponent]) -> list[str]:
         "length",
         "length_in_measures",
     ]
+
+
+# export attributes that are read from the metric position at another attribute
+METRIC_EXPORT_ATTRIBUTES = {
+    "measure": ("time", "measure"),
+    "beat": ("time", "beat"),
+    "start_measure": ("start", "measure"),
+    "start_beat": ("start", "beat"),
+    "end_measure": ("end", "measure"),
+    "end_beat": ("end", "beat"),
+}
+
+# components positioned by their own beat timeline, instead of the one
+# used for measure calculation
+OWN_METRIC_POSITION_KINDS = {ComponentKind.BEAT}
+
+
+def get_components_export_data(
+    components: Iterable[TimelineComponent],
+) -> Iterator[dict[str, Any]]:
+    """
+    Yields the export data of each component. Metric positions for all
+    components are computed upfront, in a single request, instead of once
+    for each metric attribute of each component.
+    """
+    components = list(components)
+    cls_to_attrs = {
+        cls: cls.get_export_attributes() for cls in {type(c) for c in components}
+    }
+
+    times = set()
+    for component in components:
+        if component.KIND in OWN_METRIC_POSITION_KINDS:
+            continue
+        for attr in cls_to_attrs[type(component)]:
+            if attr in METRIC_EXPORT_ATTRIBUTES:
+                times.add(getattr(component, METRIC_EXPORT_ATTRIBUTES[attr][0], None))
+            elif attr == "length_in_measures":
+                times |= {component.get_data("start"), component.get_data("end")}
+    times.discard(None)
+    time_to_position = dict(zip(times, get(Get.METRIC_POSITIONS, times)))
+    time_to_position[None] = None
+
+    for component in components:
+        data = {}
+        for attr in cls_to_attrs[type(component)]:
+            if attr in METRIC_EXPORT_ATTRIBUTES:
+                time_attr, position_attr = METRIC_EXPORT_ATTRIBUTES[attr]
+                if component.KIND in OWN_METRIC_POSITION_KINDS:
+                    position = component.metric_position
+                else:
+                    position = time_to_position[getattr(component, time_attr, None)]
+                data[attr] = getattr(position, position_attr) if position else None
+            elif attr == "length_in_measures":
+                start = time_to_position[component.get_data("start")]
+                end = time_to_position[component.get_data("end")]
+                if start:
+                    length = end - start
+                    data[attr] = length.measures, length.beats
+                else:
+                    data[attr] = None
+            else:
+                data[attr] = getattr(component, attr)
+        data["kind"] = component.KIND.name
+        yield data
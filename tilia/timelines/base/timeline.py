@@ -20,6 +20,8 @@ from .validators import (
     validate_boolean,
     validate_positive_integer,
 )
+from .attribute_index import AttributeIndex
+from .export import get_components_export_data
 from ..hash_timelines import hash_function
 from ...requests import get, Get, post, Post, stop_listening_to_all
 
@@ -165,9 +167,13 @@ class Timeline(ABC, Generic[TC]):
         return self.component_manager.get_component(id)
 
     def get_component_by_attr(self, attr: str, value: Any) -> TC:
+        if self.component_manager.is_indexed(attr):
+            return min(self.component_manager.get_indexed(attr, value), default=None)
         return next((c for c in self if c.get_data(attr) == value), None)
 
     def get_components_by_attr(self, attr: str, value: Any) -> list[TC]:
+        if self.component_manager.is_indexed(attr):
+            return sorted(self.component_manager.get_indexed(attr, value))
         return [c for c in self if c.get_data(attr) == value]
 
     def get_next_component(self, component: TC) -> TC | None:
@@ -190,9 +196,7 @@ class Timeline(ABC, Generic[TC]):
 
     def delete_components(self, components: list[TC]) -> None:
         self._validate_delete_components(components)
-
-        for component in components:
-            self.component_manager.delete_component(component)
+        self.component_manager.delete_components(components)
 
     def _validate_delete_components(self, components: list[TC]) -> None:
         pass
@@ -237,28 +241,34 @@ class Timeline(ABC, Generic[TC]):
 
         return state
 
-    def get_export_data(self) -> dict[str, Any]:
+    def get_export_data(self, stream: bool = False) -> dict[str, Any]:
+        """
+        If `stream` is True, components are returned as an iterator,
+        so they can be written as they are computed.
+        """
         result = self._get_base_state()
         result.pop("hash")
         for attr in self.NOT_EXPORTABLE_ATTRS:
             result.pop(attr)
 
-        result["components"] = []
-        for component in self.component_manager:
-            data = {
-                attr: getattr(component, attr)
-                for attr in component.get_export_attributes()
-            }
-            data["kind"] = component.KIND.name
-            result["components"].append(data)
+        components = get_components_export_data(self.component_manager)
+        result["components"] = components if stream else list(components)
 
         return result
 
     def update_component_order(self, component: TC):
         self.component_manager.update_component_order(component)
 
+    def update_component_index(self, component: TC, attr: str):
+        self.component_manager.update_component_index(component, attr)
+
 
 class TimelineComponentManager(Generic[T, TC]):
+    # Attributes whose values are kept in hash indexes, so queries by them
+    # don't scan all components. Components are always indexed by KIND.
+    # Indexed attributes must be hashable and only change through set_data.
+    INDEXED_ATTRS: tuple[str, ...] = ()
+
     def __init__(
         self,
         timeline: T,
@@ -269,6 +279,9 @@ class TimelineComponentManager(Generic[T, TC]):
 
         self._components: list[TC] = []
         self.id_to_component: dict[int, TC] = {}
+        self._indexes: dict[str, AttributeIndex] = {
+            attr: AttributeIndex(attr) for attr in ("KIND", *self.INDEXED_ATTRS)
+        }
 
     def __iter__(self):
         return iter(self._components)
@@ -331,15 +344,37 @@ class TimelineComponentManager(Generic[T, TC]):
     def get_component_by_attribute(
         self, attr_name: str, value: Any, kind: ComponentKind
     ):
+        if self.is_indexed(attr_name):
+            return next(iter(self._get_indexed_of_kind(attr_name, value, kind)), None)
         cmp_set = self._get_component_set_by_kind(kind)
         return self._get_component_from_set_by_attribute(cmp_set, attr_name, value)
 
     def get_components_by_attribute(
         self, attr_name: str, value: Any, kind: ComponentKind
     ) -> list:
+        if self.is_indexed(attr_name):
+            return list(self._get_indexed_of_kind(attr_name, value, kind))
         cmp_set = self._get_component_set_by_kind(kind)
         return self._get_components_from_set_by_attribute(cmp_set, attr_name, value)
 
+    def is_indexed(self, attr_name: str) -> bool:
+        return attr_name in self._indexes
+
+    def get_indexed(self, attr_name: str, value: Any) -> set[TC]:
+        """
+        Returns components whose `attr_name` equals `value`.
+        `attr_name` must be indexed. The returned set must not be modified.
+        """
+        return self._indexes[attr_name].get(value)
+
+    def _get_indexed_of_kind(
+        self, attr_name: str, value: Any, kind: ComponentKind
+    ) -> set[TC]:
+        components = self.get_indexed(attr_name, value)
+        if kind == "all":
+            return components
+        return components & self._get_component_set_by_kind(kind)
+
     def get_components_by_condition(
         self, condition: Callable[[TC], bool], kind: ComponentKind
     ) -> list:
@@ -367,31 +402,41 @@ class TimelineComponentManager(Generic[T, TC]):
             return self._components[component_idx - 1]
 
     def get_previous_component_by_time(self, time: float) -> TC | None:
-        times = [cmp.get_data("time") for cmp in self]
-        component_idx = bisect.bisect_right(times, time)
+        component_idx = self._bisect_components_by_time(time)
         if component_idx == 0:
             return None
         else:
             return self._components[component_idx - 1]
 
     def get_next_component_by_time(self, time: float) -> TC | None:
-        times = [cmp.get_data("time") for cmp in self]
-        component_idx = bisect.bisect_right(times, time)
+        component_idx = self._bisect_components_by_time(time)
         if component_idx == len(self._components):
             return None
         else:
             return self._components[component_idx]
 
+    def _bisect_components_by_time(self, time: float) -> int:
+        # Expects components to be sorted by time
+        return bisect.bisect_right(
+            self._components, time, key=lambda cmp: cmp.get_data("time")
+        )
+
     def get_existing_values_for_attr(self, attr_name: str, kind: ComponentKind) -> set:
         cmp_set = self._get_component_set_by_kind(kind)
+        if self.is_indexed(attr_name) and kind != "all":
+            return {
+                value
+                for value, components in self._indexes[attr_name].items()
+                if not components.isdisjoint(cmp_set)
+            }
         return set([getattr(cmp, attr_name) for cmp in cmp_set])
 
     def _get_component_set_by_kind(self, kind: ComponentKind) -> Set[TC]:
         if kind == "all":
             return set(self._components)
-        cmp_class = self._get_component_class_by_kind(kind)
+        self._validate_component_kind(kind)
 
-        return {cmp for cmp in self._components if isinstance(cmp, cmp_class)}
+        return set(self._indexes["KIND"].get(kind))
 
     def _get_component_class_by_kind(
         self, kind: ComponentKind
@@ -418,11 +463,15 @@ class TimelineComponentManager(Generic[T, TC]):
     def _add_to_components(self, component: TC) -> None:
         bisect.insort_left(self._components, component)
         self.id_to_component[component.id] = component
+        for index in self._indexes.values():
+            index.add(component)
 
     def _remove_from_components_set(self, component: TC) -> None:
         try:
             self._components.remove(component)
             self.id_to_component.pop(component.id)
+            for index in self._indexes.values():
+                index.discard(component)
         except KeyError:
             raise KeyError(
                 f"Can't remove component '{component}' from {self}: not in"
@@ -433,6 +482,17 @@ class TimelineComponentManager(Generic[T, TC]):
         self._components.remove(component)
         bisect.insort_left(self._components, component)
 
+    def update_component_index(self, component: TC, attr: str):
+        if index := self._indexes.get(attr):
+            index.add(component)
+
+    def sort_components(self):
+        """
+        Reorders all components at once, after they were changed without
+        calling update_component_order. Linear if they are nearly sorted.
+        """
+        self._components.sort()
+
     def delete_component(self, component: TC) -> None:
         stop_listening_to_all(component)
         self._remove_from_components_set(component)
@@ -443,9 +503,32 @@ class TimelineComponentManager(Generic[T, TC]):
             component.id,
         )
 
+    def delete_components(self, components: list[TC]) -> None:
+        """
+        Deletes `components` in a single pass and posts a single
+        TIMELINE_COMPONENTS_DELETED for all of them.
+        """
+        if not components:
+            return
+
+        ids = set()
+        for component in components:
+            stop_listening_to_all(component)
+            self.id_to_component.pop(component.id)
+            for index in self._indexes.values():
+                index.discard(component)
+            ids.add(component.id)
+        self._components[:] = [c for c in self._components if c.id not in ids]
+
+        post(
+            Post.TIMELINE_COMPONENTS_DELETED,
+            self.timeline.KIND,
+            self.timeline.id,
+            [component.id for component in components],
+        )
+
     def clear(self):
-        for component in self._components.copy():
-            self.delete_component(component)
+        self.delete_components(self._components.copy())
 
     def hash_components(self):
         str_to_hash = ""
@@ -1,7 +1,11 @@
 import math
+import re
 from typing import Any
 
-from PyQt6.QtGui import QColor
+try:
+    from PyQt6.QtGui import QColor
+except ImportError:  # running headless, without PyQt
+    QColor = None
 
 
 def validate_time(value):
@@ -19,7 +23,12 @@ def validate_bool(value):
 def validate_color(value):
     if value is None:
         return True
-    return QColor(value).isValid()
+    if QColor:
+        return QColor(value).isValid()
+    # accepts the same hex formats as QColor, and any name
+    return isinstance(value, str) and bool(
+        re.fullmatch(r"#([0-9a-fA-F]{3}){1,4}|#[0-9a-fA-F]{8}|[a-zA-Z]+", value)
+    )
 
 
 def validate_read_only(_):
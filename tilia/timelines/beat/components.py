@@ -13,6 +13,8 @@ from tilia.timelines.base.component import PointLikeTimelineComponent
 
 
 class Beat(PointLikeTimelineComponent):
+    __slots__ = ("time", "comments", "is_first_in_measure", "_cached_metric_position")
+
     SERIALIZABLE = ["time"]
     ORDERING_ATTRS = ("time",)
     KIND = ComponentKind.BEAT
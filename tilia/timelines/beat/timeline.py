@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import functools
 import itertools
 import math
 from enum import Enum
@@ -23,8 +22,6 @@ class BeatTLComponentManager(TimelineComponentManager):
     def __init__(self, timeline: BeatTimeline):
         super().__init__(timeline, [ComponentKind.BEAT])
         self.timeline = cast(BeatTimeline, self.timeline)
-        self.scale = functools.partial(scale_pointlike, self)
-        self.crop = functools.partial(crop_pointlike, self)
         self.compute_is_first_in_measure = True
         self.compute_metric_fraction_dict = True
 
@@ -128,17 +125,12 @@ class BeatTLComponentManager(TimelineComponentManager):
             )
 
     def scale(self, factor: float) -> None:
-        for beat in self._components:
-            self.timeline.set_component_data(beat.id, "time", beat.time * factor)
+        # beats keep their order, so measures are unchanged
+        scale_pointlike(self, factor)
+        self.timeline.update_metric_fraction_dicts()
 
     def crop(self, length: float) -> None:
-        for beat in self._components.copy():
-            if beat.time > length:
-                self.delete_component(beat)
-
-    def clear(self):
-        for component in self._components.copy():
-            self.delete_component(component, update_is_first_in_measure=False)
+        crop_pointlike(self, length)
 
     def deserialize_components(self, serialized_components: dict[int, dict[str]]):
         # Storing these attributes so we can restore them below.
@@ -628,11 +620,7 @@ class BeatTimeline(Timeline):
         self._validate_delete_components(components)
 
         self.clear_cached_metric_positions()
-
-        for component in list(reversed(components)):
-            self.component_manager.delete_component(
-                component, update_is_first_in_measure=False
-            )
+        self.component_manager.delete_components(components)
 
         if not self.is_empty:
             self.component_manager.update_is_first_in_measure_of_subsequent_beats(0)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 from bisect import bisect
 
 from tilia.exceptions import TimelineValidationError
@@ -54,6 +54,7 @@ class Timelines:
             (Get.TIMELINE_BY_ATTR, self.get_timeline_by_attr),
             (Get.TIMELINES_BY_ATTR, self.get_timelines_by_attr),
             (Get.METRIC_POSITION, self.get_metric_position),
+            (Get.METRIC_POSITIONS, self.get_metric_positions),
         }
 
         for request, callback in SERVES:
@@ -196,12 +197,13 @@ class Timelines:
                 " self._timelines."
             )
 
-    def get_export_data(self):
-        return [
-            tl.get_export_data()
+    def get_export_data(self, stream: bool = False):
+        timelines = (
+            tl.get_export_data(stream)
             for tl in self
             if TimelineFlag.NOT_EXPORTABLE not in tl.FLAGS
-        ]
+        )
+        return timelines if stream else list(timelines)
 
     def serialize_timelines(self):
         state = {tl.id: tl.get_state() for tl in self}
@@ -292,6 +294,7 @@ class Timelines:
     def scale_timeline_components(self, factor: float) -> None:
         for tl in [tl for tl in self if hasattr(tl, "scale")]:
             tl.scale(factor)
+        post(Post.TIMELINES_SCALE_DONE)
 
     def crop_timeline_components(self, new_length: float) -> None:
         for tl in [tl for tl in self if hasattr(tl, "crop")]:
@@ -302,26 +305,44 @@ class Timelines:
         return sorted(self.get_timelines_by_attr("KIND", TimelineKind.BEAT_TIMELINE))[0]
 
     def get_metric_position(self, time: float) -> MetricPosition | None:
+        return self.get_metric_positions([time])[0]
+
+    def get_metric_positions(
+        self, times: Iterable[float]
+    ) -> list[MetricPosition | None]:
+        """
+        Returns the metric positions of the beats closest to `times`.
+        Beat times are collected once, so this is much faster than
+        calling `get_metric_position` for each time.
+        """
+        times = list(times)
         if not self.get_timelines_by_attr("KIND", TimelineKind.BEAT_TIMELINE):
-            return None
+            return [None] * len(times)
         tl = self.get_beat_timeline_for_measure_calculation()
         beats = tl.components
         if not beats:
-            return None
-        times = [beat.get_data("time") for beat in beats]
-
-        time_idx = bisect(times, time)  # returns the index where the time would go
+            return [None] * len(times)
+        beat_times = [beat.get_data("time") for beat in beats]
+
+        result = []
+        for time in times:
+            # returns the index where the time would go
+            time_idx = bisect(beat_times, time)
+
+            if time_idx == 0:
+                closest_beat = beats[0]  # time is before first beat, get first beat
+            elif time_idx == len(beats):
+                closest_beat = beats[-1]  # time is after last beat, get last beat
+            elif abs(time - beat_times[time_idx - 1]) <= abs(
+                time - beat_times[time_idx]
+            ):
+                closest_beat = beats[time_idx - 1]  # previous beat is closer
+            else:
+                closest_beat = beats[time_idx]  # next beat is closer
 
-        if time_idx == 0:
-            closest_beat = beats[0]  # time is before first beat, get first beat
-        elif time_idx == len(beats):
-            closest_beat = beats[-1]  # time is after last beat, get last beat
-        elif abs(time - times[time_idx - 1]) <= abs(time - times[time_idx]):
-            closest_beat = beats[time_idx - 1]  # previous beat is closer
-        else:
-            closest_beat = beats[time_idx]  # next beat is closer
+            result.append(closest_beat.metric_position)
 
-        return closest_beat.metric_position
+        return result
 
     def clear(self):
         for timeline in self._timelines.copy():
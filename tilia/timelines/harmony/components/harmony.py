@@ -99,7 +99,7 @@ class Harmony(PointLikeTimelineComponent):
         return f"Harmony({self.step, self.accidental, self.quality, self.inversion}) at {self.time}"
 
     def __repr__(self):
-        return str(dict(self.__dict__.items()))
+        return str(self.get_instance_attrs())
 
     @classmethod
     def from_string(
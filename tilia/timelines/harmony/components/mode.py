@@ -64,7 +64,7 @@ class Mode(PointLikeTimelineComponent):
         return f"Mode({self.step, self.accidental, self.type}) at {self.time}"
 
     def __repr__(self):
-        return str(dict(self.__dict__.items()))
+        return str(self.get_instance_attrs())
 
     @property
     def key(self):
@@ -89,6 +89,16 @@ class HarmonyTLComponentManager(TimelineComponentManager):
         if component.KIND == ComponentKind.MODE and not self.is_deserializing:
             self._update_harmony_applied_to_on_mode_deletion(component)
 
+    def delete_components(self, components: list[TC]) -> None:
+        # modes update the harmonies in their region when deleted,
+        # so they are deleted one at a time, after harmonies
+        modes = [c for c in components if c.KIND == ComponentKind.MODE]
+        super().delete_components(
+            [c for c in components if c.KIND != ComponentKind.MODE]
+        )
+        for mode in modes:
+            self.delete_component(mode)
+
     def _get_next_mode_time(self, mode: Mode):
         next_modes = self.get_components_by_condition(
             lambda c: c.get_data("time") > mode.get_data("time"), ComponentKind.MODE
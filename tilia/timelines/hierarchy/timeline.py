@@ -19,6 +19,8 @@ from ...ui.format import format_media_time
 
 
 class HierarchyTLComponentManager(TimelineComponentManager):
+    INDEXED_ATTRS = ("level", "label", "formal_type")
+
     def __init__(self, timeline: HierarchyTimeline):
         super().__init__(timeline, [ComponentKind.HIERARCHY])
         self.scale = functools.partial(scale_segmentlike, self)
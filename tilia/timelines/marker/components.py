@@ -20,6 +20,8 @@ from tilia.timelines.base.component import PointLikeTimelineComponent
 
 
 class Marker(PointLikeTimelineComponent):
+    __slots__ = ("time", "label", "color", "comments")
+
     SERIALIZABLE = ["time", "comments", "label", "color"]
     ORDERING_ATTRS = ("time",)
 
@@ -56,4 +58,4 @@ class Marker(PointLikeTimelineComponent):
         return f"Marker({self.time})"
 
     def __repr__(self):
-        return str(dict(self.__dict__.items()))
+        return str(self.get_instance_attrs())
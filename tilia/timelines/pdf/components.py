@@ -15,6 +15,8 @@ from tilia.timelines.base.component import PointLikeTimelineComponent
 
 
 class PdfMarker(PointLikeTimelineComponent):
+    __slots__ = ("time", "page_number")
+
     SERIALIZABLE = ["time", "page_number"]
     ORDERING_ATTRS = ("time",)
 
@@ -45,7 +47,7 @@ class PdfMarker(PointLikeTimelineComponent):
         return f"PdfMarker({self.time})"
 
     def __repr__(self):
-        return str(dict(self.__dict__.items()))
+        return str(self.get_instance_attrs())
 
     @classmethod
     def frontend_name(cls):
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import functools
 
-import pypdf
-
+from tilia.file import probe
 from tilia.requests import get, Get
 from tilia.settings import settings
 from tilia.timelines.base.component.pointlike import scale_pointlike, crop_pointlike
@@ -24,6 +23,10 @@ class PdfTLComponentManager(TimelineComponentManager):
     def _validate_component_creation(self, _, time, *args, **kwargs):
         return PdfMarker.validate_creation(time, {c.get_data("time") for c in self})
 
+    def get_next_page_numbers(self, time: float, count: int) -> list[int]:
+        idx = self._bisect_components_by_time(time)
+        return [c.get_data("page_number") for c in self._components[idx : idx + count]]
+
 
 class PdfTimeline(Timeline):
     KIND = TimelineKind.PDF_TIMELINE
@@ -55,7 +58,7 @@ class PdfTimeline(Timeline):
         self.is_pdf_valid = False
         if checked_path := get(Get.VERIFIED_PATH, value):
             try:
-                self.page_total = len(pypdf.PdfReader(checked_path).pages)
+                self.page_total = probe.get_pdf_page_count(checked_path)
                 self.is_pdf_valid = True
                 self._path = checked_path
             except FileNotFoundError:
@@ -70,3 +73,7 @@ class PdfTimeline(Timeline):
     def get_previous_page_number(self, time: float) -> int:
         previous_component = self.get_previous_component_by_time(time)
         return previous_component.get_data("page_number") if previous_component else 0
+
+    def get_next_page_numbers(self, time: float, count: int) -> list[int]:
+        """Returns the page numbers of the `count` markers after `time`."""
+        return self.component_manager.get_next_page_numbers(time, count)
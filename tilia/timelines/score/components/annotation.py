@@ -93,7 +93,7 @@ class ScoreAnnotation(PointLikeTimelineComponent):
         self._viewer_id = viewer_id
         self._text = text
         self._font_size = font_size
-        self.update_hash()
+        self.invalidate_hash()
 
     def get_viewer_data(self) -> dict:
         return {
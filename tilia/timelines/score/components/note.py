@@ -23,6 +23,21 @@ def octave_to_pc(octave: int) -> int:
 
 
 class Note(SegmentLikeTimelineComponent):
+    __slots__ = (
+        "start",
+        "end",
+        "step",
+        "accidental",
+        "display_accidental",
+        "octave",
+        "staff_index",
+        "tie_type",
+        "label",
+        "color",
+        "comments",
+        "_ordinal",
+    )
+
     SERIALIZABLE = [
         "start",
         "end",
@@ -87,7 +102,7 @@ class Note(SegmentLikeTimelineComponent):
         self.label = label
         self.color = color
         self.comments = comments
-        # assumes start, end, octave, step, accidental and staff_index
+        # assumes octave, step, accidental and staff_index
         # won't change after instantiation
         self._ordinal = (start, end, octave, step, accidental, staff_index)
 
@@ -97,10 +112,13 @@ class Note(SegmentLikeTimelineComponent):
         return f"Note({self.start, self.end, self.pitch, self.staff_index})"
 
     def __repr__(self):
-        return str(dict(self.__dict__.items()))
+        return str(self.get_instance_attrs())
 
     @property
     def ordinal(self):
+        # start and end change when the timeline is scaled or cropped
+        if self._ordinal[0] != self.start or self._ordinal[1] != self.end:
+            self._ordinal = (self.start, self.end) + self._ordinal[2:]
         return self._ordinal
 
     @property
@@ -3,6 +3,7 @@ from __future__ import annotations
 import functools
 from typing import Any
 
+from tilia.file import blobs
 from tilia.requests import post, Post
 from tilia.timelines.base.component import (
     PointLikeTimelineComponent,
@@ -16,6 +17,8 @@ from tilia.timelines.base.timeline import Timeline, TimelineComponentManager
 
 
 class ScoreTLComponentManager(TimelineComponentManager):
+    INDEXED_ATTRS = ("staff_index", "index")
+
     def __init__(self, timeline: ScoreTimeline):
         super().__init__(
             timeline,
@@ -63,15 +66,16 @@ class ScoreTimeline(Timeline):
         "is_visible",
         "name",
         "ordinal",
-        "svg_data",
+        "svg_hash",
         "viewer_beat_x",
     ]
-    NOT_EXPORTABLE_ATTRS = ["svg_data", "viewer_beat_x"]
+    NOT_EXPORTABLE_ATTRS = ["svg_hash", "viewer_beat_x"]
     COMPONENT_MANAGER_CLASS = ScoreTLComponentManager
 
     def __init__(
         self,
         svg_data: str = "",
+        svg_hash: str = "",
         viewer_beat_x: dict[float, float] = {},
         **kwargs,
     ):
@@ -79,18 +83,20 @@ class ScoreTimeline(Timeline):
 
         self.validators = self.validators | {
             "svg_data": validate_string,
+            "svg_hash": validate_string,
             "viewer_beat_x": validate_pre_validated,
         }
         self._viewer_beat_x = viewer_beat_x
-        self.svg_data = svg_data
+        # svg data is stored out of the timeline state, which only references it
+        self.svg_hash = svg_hash or blobs.store(svg_data)
 
     @property
     def svg_data(self):
-        return self._svg_data
+        return blobs.load(self.svg_hash)
 
     @svg_data.setter
     def svg_data(self, svg_data):
-        self._svg_data = svg_data
+        self.svg_hash = blobs.store(svg_data)
 
     @property
     def viewer_beat_x(self):
@@ -102,7 +108,7 @@ class ScoreTimeline(Timeline):
             self._viewer_beat_x = x_pos
 
     def save_svg_data(self, svg_data):
-        self._svg_data = svg_data
+        self.svg_hash = blobs.store(svg_data)
 
     @property
     def staff_count(self):
@@ -0,0 +1,258 @@
+"""
+Runs CLI scripts or .tla files in parallel, each worker process with its own
+headless App, and reports the results of all of them together.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io as _io
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
+
+from colorama import Fore
+
+from tilia.exceptions import CLICommandFailed
+from tilia.requests import listen, post, Post
+from tilia.ui.cli import io
+
+# placeholders that are replaced in the commands run on each .tla file
+SCRIPT_PLACEHOLDERS = ["{path}", "{dir}", "{stem}"]
+
+
+class BatchJob(NamedTuple):
+    path: str
+    commands: list[str]
+
+
+class BatchResult(NamedTuple):
+    path: str
+    success: bool
+    errors: list[str]
+    output: str
+    duration: float
+
+
+def setup_parser(subparsers):
+    parser = subparsers.add_parser(
+        "batch",
+        exit_on_error=False,
+        help="Run scripts or .tla files in parallel.",
+    )
+    parser.add_argument(
+        "paths",
+        type=str,
+        nargs="+",
+        help="Scripts or .tla files to run. Directories are searched for .tla"
+        " files and for script.txt files, like the ones made by generate_scripts.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes. Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--script",
+        "-s",
+        type=str,
+        default="",
+        help="Script to run on each .tla file, after opening it. {path}, {dir}"
+        " and {stem} are replaced by the path, directory and name of the file.",
+    )
+    parser.add_argument(
+        "--report", "-r", type=str, default="", help="Path to save a JSON report to."
+    )
+    parser.set_defaults(func=batch)
+
+
+def batch(namespace: argparse.Namespace) -> None:
+    """Raises CLICommandFailed if any job fails, so the process exits with an error."""
+    if namespace.jobs < 1:
+        post(Post.DISPLAY_ERROR, "Batch error", "Number of jobs must be at least 1.")
+        raise CLICommandFailed("Invalid number of jobs.")
+
+    tla_commands = read_script(namespace.script) if namespace.script else []
+    jobs = get_jobs(namespace.paths, tla_commands)
+    if not jobs:
+        io.output("No scripts or .tla files found.", Fore.RED)
+        raise CLICommandFailed("No scripts or .tla files found.")
+
+    results = run_jobs(jobs, namespace.jobs)
+    output_report(results)
+    if namespace.report:
+        from tilia.file.export import write_json
+
+        write_json(namespace.report, [result._asdict() for result in results])
+
+    if failed_count := sum(not result.success for result in results):
+        raise CLICommandFailed(f"{failed_count} batch job(s) failed.")
+
+
+def read_script(path: str | Path) -> list[str]:
+    with open(path, "r", encoding="utf-8") as file:
+        return [
+            line
+            for line in file.read().splitlines()
+            if line.strip() and not line.startswith("#")
+        ]
+
+
+def _get_paths(path: Path) -> list[Path]:
+    if not path.is_dir():
+        return [path]
+
+    paths = []
+    for folder, sub_folders, filenames in os.walk(path):
+        sub_folders.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".tla") or filename == "script.txt":
+                paths.append(Path(folder, filename))
+    return paths
+
+
+def _format_command(command: str, path: Path) -> str:
+    values = [str(path), str(path.parent), path.stem]
+    for placeholder, value in zip(SCRIPT_PLACEHOLDERS, values):
+        command = command.replace(placeholder, value)
+    return command
+
+
+def get_jobs(paths: list[str], tla_commands: list[str]) -> list[BatchJob]:
+    """
+    Returns a job per script or .tla file in `paths`.
+    Jobs for .tla files open the file and then run `tla_commands`.
+    """
+    jobs = []
+    for path in paths:
+        for file in _get_paths(Path(path).resolve()):
+            if file.suffix == ".tla":
+                commands = [f'open "{file}"']
+                commands += [_format_command(cmd, file) for cmd in tla_commands]
+            else:
+                commands = [f'script "{file}"']
+            jobs.append(BatchJob(str(file), commands))
+
+    return jobs
+
+
+def run_jobs(jobs: list[BatchJob], max_workers: int) -> list[BatchResult]:
+    """Runs `jobs` in a pool of processes and returns their results in order."""
+    results = {}
+    # workers are spawned so they don't inherit this process' App
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(jobs)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_setup_worker,
+    ) as executor:
+        # keyed by index, as the same path may be given more than once
+        futures = {executor.submit(_run_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:  # worker crashed
+                result = BatchResult(jobs[i].path, False, [repr(exc)], "", 0.0)
+            results[i] = result
+            _output_progress(result, len(results), len(jobs))
+
+    return [results[i] for i in range(len(jobs))]
+
+
+def _output_progress(result: BatchResult, done: int, total: int) -> None:
+    status = "OK" if result.success else "FAILED"
+    color = Fore.GREEN if result.success else Fore.RED
+    io.output(
+        f"[{done}/{total}] {status} {result.path} ({result.duration:.1f}s)", color
+    )
+
+
+def output_report(results: list[BatchResult]) -> None:
+    failed = [result for result in results if not result.success]
+    for result in failed:
+        io.output(f"\nErrors in {result.path}:", Fore.RED)
+        io.output("\n".join(result.errors))
+
+    succeeded = len(results) - len(failed)
+    io.output(
+        f"\nProcessed {len(results)} files: {succeeded} succeeded, {len(failed)} failed."
+    )
+
+
+class _Worker:
+    def __init__(self):
+        from tilia.boot import setup_logic
+        from tilia.media.player.headless import HeadlessPlayer
+        from tilia.ui.cli.ui import CLI
+
+        self.errors = []
+        # output is captured per job, so setup messages are discarded
+        with contextlib.redirect_stdout(_io.StringIO()):
+            self.app = setup_logic(autosaver=False, player=HeadlessPlayer())
+            self.cli = CLI(headless=True)
+            self.app.setup_file()
+
+        listen(self, Post.DISPLAY_ERROR, self.on_display_error)
+
+    def on_display_error(self, _, message: str) -> None:
+        self.errors.append(message)
+
+    def run(self, job: BatchJob) -> BatchResult:
+        self.errors = []
+        failed = False
+        output = _io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(output):
+            for command in job.commands:
+                failed = self._run_command(command, output)
+                if failed or self.errors:
+                    break
+            post(Post.APP_CLEAR)
+            post(Post.APP_SETUP_FILE)
+
+        return BatchResult(
+            job.path,
+            not failed and not self.errors,
+            self.errors,
+            output.getvalue(),
+            time.perf_counter() - start,
+        )
+
+    def _run_command(self, command: str, output: _io.StringIO) -> bool:
+        """
+        Returns True if the command failed. Failures that are not displayed as
+        errors (e.g. arguments rejected by argparse) are added to the errors.
+        """
+        self.cli.exception = None
+        errors_count = len(self.errors)
+        # argparse writes usage messages to stderr
+        stderr = _io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            failed = self.cli.parse_and_run(command)
+        output.write(stderr.getvalue())
+
+        if failed and len(self.errors) == errors_count:
+            message = stderr.getvalue().strip()
+            if not message and isinstance(self.cli.exception, CLICommandFailed):
+                message = str(self.cli.exception)
+            self.errors.append(message or f"Command failed: {command}")
+
+        return failed
+
+
+_worker: _Worker | None = None
+
+
+def _setup_worker() -> None:
+    global _worker
+    _worker = _Worker()
+
+
+def _run_job(job: BatchJob) -> BatchResult:
+    return _worker.run(job)
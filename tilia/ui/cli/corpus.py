@@ -0,0 +1,72 @@
+import argparse
+import sqlite3
+
+from colorama import Fore
+
+from tilia.file.corpus import Corpus
+from tilia.requests import post, Post
+from tilia.ui.cli import io
+
+DEFAULT_DB_PATH = "corpus.sqlite"
+
+
+def setup_parser(subparsers):
+    parser = subparsers.add_parser(
+        "corpus",
+        exit_on_error=False,
+        help="Index .tla files in a database and query them together.",
+    )
+    corpus_subparsers = parser.add_subparsers(dest="corpus_command")
+
+    index_parser = corpus_subparsers.add_parser("index", exit_on_error=False)
+    index_parser.add_argument(
+        "paths",
+        type=str,
+        nargs="+",
+        help=".tla files to index. Directories are searched for .tla files.",
+    )
+    add_db_argument(index_parser)
+    index_parser.set_defaults(func=index)
+
+    query_parser = corpus_subparsers.add_parser("query", exit_on_error=False)
+    query_parser.add_argument(
+        "sql",
+        type=str,
+        help="SQL query. There is a table for files, one for timelines and one"
+        " for each component kind (e.g. hierarchy, marker, beat).",
+    )
+    add_db_argument(query_parser)
+    query_parser.set_defaults(func=query)
+
+
+def add_db_argument(parser):
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=DEFAULT_DB_PATH,
+        help=f"Path to the database. Defaults to {DEFAULT_DB_PATH}.",
+    )
+
+
+def index(namespace: argparse.Namespace) -> None:
+    with Corpus(namespace.db) as corpus:
+        result = corpus.update(namespace.paths)
+
+    for path, error in result.errors:
+        io.output(f"Could not index {path}: {error}", Fore.RED)
+    io.output(
+        f"Indexed {len(result.indexed)} file(s), {len(result.unchanged)} unchanged,"
+        f" {len(result.removed)} removed, {len(result.errors)} failed."
+    )
+
+
+def query(namespace: argparse.Namespace) -> None:
+    with Corpus(namespace.db) as corpus:
+        try:
+            headers, rows = corpus.query(namespace.sql)
+        except sqlite3.Error as err:
+            post(Post.DISPLAY_ERROR, "Corpus query error", str(err))
+            return
+
+    if headers:
+        io.tabulate(headers, rows)
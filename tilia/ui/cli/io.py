@@ -32,6 +32,11 @@ def ask_for_string(prompt: str) -> str:
 
 def ask_yes_or_no(prompt: str) -> bool:
     """
-    Prompts the user for a yes or no answer
-    """
-    return input(prompt + " (y)es/(n)o: ").lower() in ["y", "yes"]
+    Prompts the user for a yes or no answer.
+    Answers no if there is no input to read from, as in batch workers.
+    """
+    try:
+        answer = input(prompt + " (y)es/(n)o: ")
+    except EOFError:
+        return False
+    return answer.lower() in ["y", "yes"]
@@ -6,16 +6,9 @@ import httpx
 import isodate
 
 from tilia.media.player import Player
-from tilia.media.player.qtplayer import QtPlayer
 from tilia.requests import post, Post
 
 
-class CLIVideoPlayer(QtPlayer):
-    # inherits only from QtPlayer to prevent
-    # the creation of a video widget
-    pass
-
-
 class CLIYoutubePlayer(Player):
     MEDIA_TYPE = "youtube"
     INVALID_YOUTUBE_URL = "Invalid YouTube URL: {}"
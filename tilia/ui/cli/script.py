@@ -4,6 +4,7 @@ from typing import Callable
 from colorama import Fore
 
 import tilia.errors
+from tilia.exceptions import CLICommandFailed
 from tilia.ui.cli import io
 
 
@@ -15,6 +16,7 @@ def setup_parser(subparsers, parse_and_run_func: Callable[[str], bool]):
 
 
 def run(parse_and_run_func, namespace):
+    """Raises CLICommandFailed if a command fails. Later commands are not run."""
     with open(namespace.path, "r", encoding=namespace.encoding) as file:
         commands = [
             line
@@ -30,4 +32,4 @@ def run(parse_and_run_func, namespace):
         io.output(cmd, Fore.GREEN)
         error = parse_and_run_func(cmd)
         if error:
-            return
+            raise CLICommandFailed(f"Script command failed: {cmd}")
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from tilia.file.export import CSV_EXPORTABLE_KINDS, write_csv
+from tilia.requests import post, Post
+from tilia.ui.cli import io
+from tilia.ui.cli.timelines.imp import get_timeline_for_import
+
+
+def setup_parser(subparsers):
+    parser = subparsers.add_parser(
+        "export", help="Export timeline components to a .csv file"
+    )
+    named_args = parser.add_argument_group("required named arguments")
+
+    named_args.add_argument("--file", "-f", required=True, help="File to export to")
+
+    target_group = named_args.add_mutually_exclusive_group(required=True)
+    target_group.add_argument(
+        "--target-ordinal", "-o", type=int, help="Target timeline ordinal"
+    )
+    target_group.add_argument(
+        "--target-name", "-n", type=str, help="Target timeline name"
+    )
+
+    parser.add_argument(
+        "--overwrite", action="store_true", help="Overwrite existing file."
+    )
+
+    parser.set_defaults(func=export_timeline)
+
+
+def export_timeline(namespace):
+    tl = get_timeline_for_import(namespace.target_ordinal, namespace.target_name)
+
+    if tl.KIND not in CSV_EXPORTABLE_KINDS:
+        post(
+            Post.DISPLAY_ERROR,
+            "Export error",
+            f"Can't export {tl.KIND.name.lower().replace('_', ' ')}s to .csv.",
+        )
+        return
+
+    path = Path(namespace.file)
+    if path.exists() and not namespace.overwrite:
+        if not io.ask_yes_or_no(f"File {path} already exists. Overwrite?"):
+            return
+
+    write_csv(path, tl)
+    io.output(f"Exported {tl} to {path}.")
@@ -8,8 +8,8 @@ import traceback
 from colorama import Fore
 
 import tilia.constants
-from tilia.exceptions import TiliaExit
-from tilia.media.player.qtplayer import QtPlayer
+from tilia.exceptions import CLICommandFailed, TiliaExit
+from tilia.parsers.score import svg_cache
 from tilia.requests import Get, serve
 from tilia.requests.post import Post, listen, post
 from tilia.ui.cli import (
@@ -25,14 +25,21 @@ from tilia.ui.cli import (
     open,
     export,
     clear,
+    batch,
+    corpus,
 )
 from tilia.ui.cli.io import ask_yes_or_no
-from tilia.ui.cli.player import CLIVideoPlayer, CLIYoutubePlayer
+from tilia.ui.cli.player import CLIYoutubePlayer
 from tilia.constants import VERSION
 
 
 class CLI:
-    def __init__(self):
+    def __init__(self, headless: bool = False):
+        """
+        If `headless` is True, media is never played,
+        so the CLI can run without PyQt.
+        """
+        self.headless = headless
         self.parser = argparse.ArgumentParser(exit_on_error=False)
         self.subparsers = self.parser.add_subparsers(dest="command")
         self.setup_parsers()
@@ -41,6 +48,7 @@ class CLI:
         listen(
             self, Post.DISPLAY_ERROR, self.on_request_to_display_error
         )  # ignores error title
+        listen(self, Post.SCORE_TIMELINE_SVG_CREATE, self.on_score_timeline_svg_create)
 
         serve(self, Get.PLAYER_CLASS, self.get_player_class)
         serve(self, Get.FROM_USER_YES_OR_NO, on_ask_yes_or_no)
@@ -58,6 +66,8 @@ class CLI:
         open.setup_parser(self.subparsers)
         export.setup_parser(self.subparsers)
         clear.setup_parser(self.subparsers)
+        batch.setup_parser(self.subparsers)
+        corpus.setup_parser(self.subparsers)
 
     @staticmethod
     def parse_command(arg_string):
@@ -123,7 +133,7 @@ class CLI:
             post(Post.DISPLAY_ERROR, "Argument error", str(err))
             self.exception = err
             return True
-        except SystemExit as err:
+        except (SystemExit, CLICommandFailed) as err:
             self.exception = err
             return True
         except TiliaExit:
@@ -133,18 +143,31 @@ class CLI:
             post(Post.DISPLAY_ERROR, "CLI error", traceback.format_exc())
             return True
 
+    @staticmethod
+    def on_score_timeline_svg_create(id: int, musicxml: str) -> None:
+        if svg_cache.set_timeline_svg(id, svg_cache.get_key(musicxml)):
+            return
+        io.output("Score rendering is not available in the CLI. Skipping.")
+
     @staticmethod
     def on_request_to_display_error(_, message: str) -> None:
         """Ignores title and prints error message to output"""
         io.output(message, color=Fore.RED)
 
-    @staticmethod
-    def get_player_class(media_type: str):
-        return {
-            "video": CLIVideoPlayer,
-            "audio": QtPlayer,
-            "youtube": CLIYoutubePlayer,
-        }[media_type]
+    def get_player_class(self, media_type: str):
+        if media_type == "youtube":
+            return CLIYoutubePlayer
+
+        if self.headless:
+            from tilia.media.player.headless import HeadlessPlayer
+
+            return HeadlessPlayer
+
+        # QtPlayer is used for video too, to prevent
+        # the creation of a video widget
+        from tilia.media.player.qtplayer import QtPlayer
+
+        return QtPlayer
 
     @staticmethod
     def show_crash_dialog(exc_message) -> None:
@@ -84,8 +84,10 @@ def ask_for_path_to_export(
             filter = "JSON files (*.json)"
         case "img":
             filter = [
-                "JPEG (*.jpg *.jpeg)",
                 "PNG (*.png)",
+                "SVG (*.svg)",
+                "PDF (*.pdf)",
+                "JPEG (*.jpg *.jpeg)",
                 "Portable Pixmap (*.ppm)",
                 "Windows Bitmap (*.bmp)",
                 "X11 Bitmap (*.xbm)",
@@ -12,6 +12,7 @@ class ResizeRect(QDialog):
     def __init__(self, old_width: float, old_height: float):
         super().__init__(get(Get.MAIN_WINDOW))
         self.old_width = old_width
+        self.old_height = old_height
         self.setWindowTitle("Set Image Output Width")
         self.setLayout(QFormLayout())
 
@@ -20,7 +21,11 @@ class ResizeRect(QDialog):
         self.new_width.setValue(old_width)
         self.layout().addRow("Width", self.new_width)
 
-        self.layout().addRow("Height", QLabel(str(old_height)))
+        # height is scaled along with width, so the image is not distorted
+        self.height_label = QLabel()
+        self.on_width_changed(old_width)
+        self.new_width.valueChanged.connect(self.on_width_changed)
+        self.layout().addRow("Height", self.height_label)
 
         button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Reset
@@ -38,6 +43,9 @@ class ResizeRect(QDialog):
         )
         self.layout().addRow(button_box)
 
+    def on_width_changed(self, width: float):
+        self.height_label.setText(str(round(self.old_height * width / self.old_width)))
+
     def reset(self):
         self.blockSignals(True)
         self.new_width.setValue(self.old_width)
@@ -0,0 +1,147 @@
+"""
+Off-screen rendering of the timelines scene to image files.
+
+The scene is painted through its own transform, so the view on screen is
+never zoomed or repositioned. PNG files are painted in horizontal strips and
+written as they are rendered, so the full image is never held in memory.
+SVG and PDF files are painted as vectors.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+
+from PyQt6.QtCore import QMarginsF, QRectF, QSize, QSizeF, Qt
+from PyQt6.QtGui import QImage, QPageSize, QPainter, QPdfWriter
+from PyQt6.QtSvg import QSvgGenerator
+from PyQt6.QtWidgets import QGraphicsScene
+
+MAX_STRIP_BYTES = 64 * 2**20
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class PngWriter:
+    """
+    Writes an 8-bit RGBA PNG row by row,
+    so the image never needs to be in memory at once.
+    """
+
+    def __init__(self, path: str | Path, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.file = open(path, "wb")
+        self.compressor = zlib.compressobj()
+        self.file.write(PNG_SIGNATURE)
+        self._write_chunk(
+            b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def write_rows(self, data: bytes, row_count: int) -> None:
+        """`data` has `row_count` rows of RGBA pixels, without padding."""
+        stride = self.width * 4
+        # every row is prefixed with its filter type, which is 0 (none)
+        raw = b"".join(
+            b"\x00" + data[i * stride : (i + 1) * stride] for i in range(row_count)
+        )
+        if compressed := self.compressor.compress(raw):
+            self._write_chunk(b"IDAT", compressed)
+
+    def close(self) -> None:
+        if self.file.closed:
+            return
+        self._write_chunk(b"IDAT", self.compressor.flush())
+        self._write_chunk(b"IEND", b"")
+        self.file.close()
+
+    def _write_chunk(self, kind: bytes, data: bytes) -> None:
+        self.file.write(struct.pack(">I", len(data)) + kind + data)
+        self.file.write(struct.pack(">I", zlib.crc32(kind + data)))
+
+
+def get_export_size(scene: QGraphicsScene, width: float) -> QSize:
+    rect = scene.sceneRect()
+    return QSize(round(width), round(rect.height() * width / rect.width()))
+
+
+def export_scene(scene: QGraphicsScene, path: str | Path, width: float) -> bool:
+    """
+    Renders `scene` to `path`, scaled to `width`. The file format is given by
+    the extension of `path`. Returns True if the file was written.
+    """
+    size = get_export_size(scene, width)
+    match Path(path).suffix.lower():
+        case ".png":
+            return _export_png(scene, path, size)
+        case ".svg":
+            return _export_svg(scene, path, size)
+        case ".pdf":
+            return _export_pdf(scene, path, size)
+        case _:
+            return _export_image(scene, path, size)
+
+
+def _render(painter: QPainter, scene: QGraphicsScene, size: QSize, top=0):
+    """
+    Renders `scene` scaled to `size`, shifted `top` pixels up. Strips only
+    differ by an integer translation, so they are painted without seams.
+    """
+    target = QRectF(0, -top, size.width(), size.height())
+    scene.render(
+        painter, target, scene.sceneRect(), Qt.AspectRatioMode.IgnoreAspectRatio
+    )
+
+
+def _export_png(scene: QGraphicsScene, path: str | Path, size: QSize) -> bool:
+    strip_height = max(1, min(size.height(), MAX_STRIP_BYTES // (size.width() * 4)))
+    strip = QImage(size.width(), strip_height, QImage.Format.Format_RGBA8888)
+
+    with PngWriter(path, size.width(), size.height()) as writer:
+        for top in range(0, size.height(), strip_height):
+            row_count = min(strip_height, size.height() - top)
+            strip.fill(Qt.GlobalColor.white)
+            painter = QPainter(strip)
+            _render(painter, scene, size, top)
+            painter.end()
+            bits = strip.constBits()
+            writer.write_rows(bits.asstring(strip.sizeInBytes()), row_count)
+
+    return True
+
+
+def _export_svg(scene: QGraphicsScene, path: str | Path, size: QSize) -> bool:
+    generator = QSvgGenerator()
+    generator.setFileName(str(path))
+    generator.setSize(size)
+    generator.setViewBox(QRectF(0, 0, size.width(), size.height()))
+    painter = QPainter(generator)
+    _render(painter, scene, size)
+    return painter.end()
+
+
+def _export_pdf(scene: QGraphicsScene, path: str | Path, size: QSize) -> bool:
+    writer = QPdfWriter(str(path))
+    # at 72 dpi, a pixel is a point
+    writer.setResolution(72)
+    writer.setPageSize(QPageSize(QSizeF(size), QPageSize.Unit.Point))
+    writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+    painter = QPainter(writer)
+    _render(painter, scene, size)
+    return painter.end()
+
+
+def _export_image(scene: QGraphicsScene, path: str | Path, size: QSize) -> bool:
+    # other formats can't be written incrementally by Qt
+    image = QImage(size, QImage.Format.Format_ARGB32)
+    image.fill(Qt.GlobalColor.white)
+    painter = QPainter(image)
+    _render(painter, scene, size)
+    painter.end()
+    return image.save(str(path))
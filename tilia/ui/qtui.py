@@ -8,7 +8,7 @@ from typing import Optional
 
 from PyQt6 import QtGui
 from PyQt6.QtCore import QKeyCombination, Qt, qInstallMessageHandler, QUrl, QtMsgType
-from PyQt6.QtGui import QIcon, QFontDatabase, QDesktopServices, QPainter, QPixmap
+from PyQt6.QtGui import QIcon, QFontDatabase, QDesktopServices
 from PyQt6.QtWidgets import (
     QMainWindow,
     QApplication,
@@ -35,6 +35,7 @@ from .dialog_manager import DialogManager
 from .dialogs.basic import display_error
 from .dialogs.crash import CrashDialog
 from .dialogs.resize_rect import ResizeRect
+from .image_export import export_scene
 from .menubar import TiliaMenuBar
 from tilia.ui.timelines.collection.collection import TimelineUIs
 from .menus import (
@@ -120,29 +121,16 @@ class TiliaMainWindow(QMainWindow):
         super().closeEvent(None)
 
     def on_export(self, save_path: str):
-        widget: QGraphicsScene = self.centralWidget().scene()
-        success, result = ResizeRect.new_size(
-            widget.sceneRect().width(), widget.sceneRect().height()
+        scene: QGraphicsScene = self.centralWidget().scene()
+        success, width = ResizeRect.new_size(
+            scene.sceneRect().width(), scene.sceneRect().height()
         )
         if not success:
             return
 
-        if result != widget.sceneRect().width():
-            margins = 2 * get(Get.LEFT_MARGIN_X)
-            zoom_level = (result - margins) / (widget.sceneRect().width() - margins)
-            post(Post.VIEW_ZOOM_IN, zoom_level)
-        else:
-            zoom_level = 1.0
-
-        image = QPixmap(widget.sceneRect().size().toSize())
-        painter = QPainter(image)
-        widget.render(painter)
-        image.save(save_path)
-        del painter
-        del image
-
-        if zoom_level != 1.0:
-            post(Post.VIEW_ZOOM_OUT, zoom_level)
+        for timeline_ui in get(Get.TIMELINE_UIS):
+            timeline_ui.update_outdated_element_positions()
+        export_scene(scene, save_path, width)
 
 
 class QtUI:
@@ -0,0 +1,43 @@
+"""
+Process-wide cache of text layouts.
+
+Texts are laid out once per font and the x positions after each character are
+stored, so measuring a text or cropping it to a width are lookups.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+
+from PyQt6.QtGui import QFont, QTextLayout
+
+MAX_CACHED_LAYOUTS = 4096
+
+
+def get_prefix_widths(font: QFont, text: str) -> tuple[float, ...]:
+    """Widths of text[:1], text[:2], ..., text[:len(text)] in `font`."""
+    return _get_prefix_widths(font.toString(), text)
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_LAYOUTS)
+def _get_prefix_widths(font_key: str, text: str) -> tuple[float, ...]:
+    font = QFont()
+    font.fromString(font_key)
+    layout = QTextLayout(text, font)
+    layout.beginLayout()
+    line = layout.createLine()
+    layout.endLayout()
+    if not line.isValid():
+        return ()
+    return tuple(line.cursorToX(i + 1)[0] for i in range(len(text)))
+
+
+def get_text_width(font: QFont, text: str) -> float:
+    widths = get_prefix_widths(font, text)
+    return widths[-1] if widths else 0
+
+
+def get_cropped_text(font: QFont, text: str, max_width: float) -> str:
+    """Returns the largest prefix of `text` that fits in `max_width`."""
+    return text[: bisect.bisect_right(get_prefix_widths(font, text), max_width)]
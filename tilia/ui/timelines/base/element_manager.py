@@ -5,6 +5,7 @@ from typing import Any, Callable, TYPE_CHECKING, TypeVar, Generic, Iterable
 
 from PyQt6.QtWidgets import QGraphicsItem
 
+from tilia.timelines.base.attribute_index import AttributeIndex
 from tilia.timelines.component_kinds import ComponentKind
 from tilia.ui.timelines.element_kinds import get_element_class_by_kind
 from tilia.utils import get_tilia_class_string
@@ -23,6 +24,7 @@ class ElementManager(Generic[TE]):
     def __init__(self, element_class: type[TE] | list[type[TE]]):
         self._elements: list[TE] = []
         self.id_to_element = {}
+        self._kind_index = AttributeIndex("kind")
         self.element_classes: TE | list[TE] = (
             element_class if isinstance(element_class, list) else [element_class]
         )
@@ -65,11 +67,13 @@ class ElementManager(Generic[TE]):
     def _add_to_elements_set(self, element: TE) -> None:
         bisect.insort_left(self._elements, element)
         self.id_to_element[element.id] = element
+        self._kind_index.add(element)
 
     def _remove_from_elements_set(self, element: TE) -> None:
         try:
             self._elements.remove(element)
             del self.id_to_element[element.id]
+            self._kind_index.discard(element)
         except ValueError:
             raise ValueError(
                 f"Can't remove element '{element}' from {self}: not in self._elements."
@@ -82,6 +86,8 @@ class ElementManager(Generic[TE]):
         return self._get_element_from_set_by_attribute(self._elements, attr_name, value)
 
     def get_elements_by_attribute(self, attr_name: str, value: Any) -> list[TE]:
+        if attr_name == "kind":
+            return sorted(self._kind_index.get(value))
         return self._get_elements_from_set_by_attribute(
             self._elements, attr_name, value
         )
@@ -186,6 +192,16 @@ class ElementManager(Generic[TE]):
         element.delete()
         self._remove_from_elements_set(element)
 
+    def delete_elements(self, elements: list[TE]):
+        """Deletes `elements` and removes them from the elements list in one pass."""
+        ids = set()
+        for element in elements:
+            element.delete()
+            del self.id_to_element[element.id]
+            self._kind_index.discard(element)
+            ids.add(element.id)
+        self._elements[:] = [e for e in self._elements if e.id not in ids]
+
     @staticmethod
     def get_child_items_from_elements(
         elements: list[TE],
@@ -1,5 +1,7 @@
 from __future__ import annotations
+import bisect
 import functools
+import itertools
 from abc import ABC
 from typing import (
     Any,
@@ -8,7 +10,7 @@ from typing import (
     Optional,
 )
 
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt, QPoint, QTimer
 from PyQt6.QtWidgets import QGraphicsItem
 
 from tilia.timelines.component_kinds import ComponentKind
@@ -19,6 +21,7 @@ from tilia.requests import get, Get
 from tilia.timelines.base.component import TimelineComponent
 from tilia.ui.timelines.base.element_manager import ElementManager
 from tilia.ui.timelines.base.element import TimelineUIElement
+from tilia.ui.timelines.boundary_index import BoundaryIndex
 from tilia.ui.timelines.scene import TimelineScene
 from tilia.ui.timelines.copy_paste import (
     CopyAttributes,
@@ -46,6 +49,10 @@ class TimelineUI(ABC):
     CONTEXT_MENU_CLASS: type[TimelineUIContextMenu] = TimelineUIContextMenu
     ACCEPTS_VERTICAL_ARROWS = False
     ACCEPTS_HORIZONTAL_ARROWS = False
+    BOUNDARY_ATTRS: tuple[str, ...] = ()
+    # if set, elements are repositioned lazily when the timeline width changes
+    POSITION_TIME_ATTRS: tuple[str, ...] = ()
+    POSITION_UPDATE_CHUNK_SIZE = 200
 
     def __init__(
         self,
@@ -62,6 +69,19 @@ class TimelineUI(ABC):
         self.view = view
 
         self.element_manager = element_manager
+        self.boundaries = BoundaryIndex()
+        self._outdated_elements: set[T] = set()
+        # sorted by start time, so the ones in view can be found by bisection
+        self._outdated_by_start: list[T] = []
+        self._outdated_max_duration = 0.0
+        self._position_update_timer = QTimer()
+        self._position_update_timer.setInterval(0)
+        self._position_update_timer.timeout.connect(
+            functools.partial(
+                self.update_outdated_element_positions,
+                self.POSITION_UPDATE_CHUNK_SIZE,
+            )
+        )
 
         self._setup_visibility()
         self._setup_collection_requests()
@@ -144,6 +164,8 @@ class TimelineUI(ABC):
 
     def update_is_visible(self):
         self.view.set_is_visible(self.get_data("is_visible"))
+        if self.get_data("is_visible"):
+            self.collection.change_playback_line_position(self, get(Get.SELECTED_TIME))
         self.collection.update_timeline_uis_position()
         self.collection.update_toolbar_visibility()
 
@@ -159,7 +181,7 @@ class TimelineUI(ABC):
     def set_width(self, width):
         self.scene.set_width(int(width))
         self.view.setFixedWidth(int(width))
-        self.element_manager.update_time_on_elements()
+        self.update_element_positions()
         self.scene.set_playback_line_pos(
             time_x_converter.get_x_by_time(get(Get.SELECTED_TIME))
         )
@@ -169,6 +191,68 @@ class TimelineUI(ABC):
             time_x_converter.get_x_by_time(loop_end),
         )
 
+    def update_element_positions(self):
+        """
+        Elements in view are repositioned right away. The others are
+        repositioned when scrolled into view or, in chunks, when the app is
+        idle. That way, zooming only waits for the elements in view.
+        """
+        if not self.POSITION_TIME_ATTRS or not self.collection.view.isVisible():
+            self.element_manager.update_time_on_elements()
+            return
+
+        self._outdated_elements = set(self.elements)
+        self._outdated_by_start = sorted(self.elements, key=self._get_start_time)
+        self._outdated_max_duration = max(
+            (self._get_end_time(e) - self._get_start_time(e) for e in self.elements),
+            default=0.0,
+        )
+        self.update_visible_element_positions()
+        self._position_update_timer.start()
+
+    def update_visible_element_positions(self):
+        if not self._outdated_elements:
+            return
+
+        start, end = self.collection.get_visible_time_range()
+        # elements in view start at most the longest duration before the view
+        first = bisect.bisect_left(
+            self._outdated_by_start,
+            start - self._outdated_max_duration,
+            key=self._get_start_time,
+        )
+        last = bisect.bisect_right(
+            self._outdated_by_start, end, key=self._get_start_time
+        )
+        for element in self._outdated_by_start[first:last]:
+            if element in self._outdated_elements and self._is_in_time_range(
+                element, start, end
+            ):
+                self._outdated_elements.remove(element)
+                element.update_position()
+
+    def update_outdated_element_positions(self, count: int | None = None):
+        """Updates `count` of the outdated elements, or all of them."""
+        for element in list(itertools.islice(self._outdated_elements, count)):
+            self._outdated_elements.remove(element)
+            element.update_position()
+
+        if not self._outdated_elements:
+            self._outdated_by_start = []
+            self._position_update_timer.stop()
+
+    def _get_start_time(self, element: T) -> float:
+        return min(element.get_data(attr) for attr in self.POSITION_TIME_ATTRS)
+
+    def _get_end_time(self, element: T) -> float:
+        return max(element.get_data(attr) for attr in self.POSITION_TIME_ATTRS)
+
+    def _is_in_time_range(self, element: T, start: float, end: float) -> bool:
+        return (
+            self._get_start_time(element) <= end
+            and self._get_end_time(element) >= start
+        )
+
     def update_ordinal(self):
         self.collection.update_timeline_ui_ordinal()
 
@@ -207,13 +291,18 @@ class TimelineUI(ABC):
     def on_timeline_component_created(
         self, kind: ComponentKind, id: int, get_data, set_data
     ):
-        return self.element_manager.create_element(
+        element = self.element_manager.create_element(
             kind, id, self, self.scene, get_data, set_data
         )
+        self.update_element_boundaries(element)
+        return element
 
     def on_timeline_component_deleted(self, id: int):
         self.delete_element(self.id_to_element[id])
 
+    def on_timeline_components_deleted(self, ids: list[int]):
+        self.delete_elements([self.id_to_element[id] for id in ids])
+
     def update_selection_on_right_click(
         self,
         elements: list[T],
@@ -470,8 +559,29 @@ class TimelineUI(ABC):
                 # can't access component, as it is already deleted
                 pass
 
+        self.boundaries.discard(element.id)
+        self._outdated_elements.discard(element)
         self.element_manager.delete_element(element)
 
+    def delete_elements(self, elements: list[T]):
+        selected = set(self.selected_elements).intersection(elements)
+        for element in selected:
+            # the inspector may show another deleted element while deselecting,
+            # so none of them can receive its edits
+            stop_listening(element, Post.INSPECTOR_FIELD_EDITED)
+
+        for element in selected:
+            try:
+                self.deselect_element(element)
+            except KeyError:
+                # can't access component, as it is already deleted
+                pass
+
+        for element in elements:
+            self.boundaries.discard(element.id)
+        self._outdated_elements.difference_update(elements)
+        self.element_manager.delete_elements(elements)
+
     def validate_copy(self, elements: list[T]) -> None:
         """Can be overwritten by subclsses"""
 
@@ -495,6 +605,7 @@ class TimelineUI(ABC):
         return self.element_manager.belongs_to_selection(item)
 
     def delete(self):
+        self._position_update_timer.stop()
         stop_listening_to_all(self)
         stop_listening_to_all(self.scene)
         self.scene.destroy()
@@ -510,3 +621,14 @@ class TimelineUI(ABC):
 
     def update_element_order(self, element: T):
         self.element_manager.update_element_order(element)
+
+    def update_element_boundaries(self, element: T):
+        if self.BOUNDARY_ATTRS:
+            self.boundaries.set(
+                element.id, [element.get_data(attr) for attr in self.BOUNDARY_ATTRS]
+            )
+
+    def update_boundaries(self):
+        self.boundaries.clear()
+        for element in self:
+            self.update_element_boundaries(element)
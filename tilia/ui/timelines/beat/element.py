@@ -3,7 +3,12 @@ from typing import TYPE_CHECKING, Callable, Any
 
 from PyQt6.QtCore import Qt, QLineF, QPointF
 from PyQt6.QtGui import QPen, QColor, QFont
-from PyQt6.QtWidgets import QGraphicsScene, QGraphicsLineItem, QGraphicsTextItem
+from PyQt6.QtWidgets import (
+    QGraphicsItem,
+    QGraphicsLineItem,
+    QGraphicsScene,
+    QGraphicsTextItem,
+)
 
 from tilia.requests import Post, post, Get, get
 from .context_menu import BeatContextMenu
@@ -248,6 +253,7 @@ class BeatLabel(QGraphicsTextItem):
         text: str,
     ):
         super().__init__()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self._setup_font()
         self.set_text(text)
         self.set_position(x, y)
@@ -271,4 +277,5 @@ class BeatLabel(QGraphicsTextItem):
             self.setVisible(False)
         else:
             self.setVisible(True)
-            self.setPlainText(value)
+            if value != self.toPlainText():
+                self.setPlainText(value)
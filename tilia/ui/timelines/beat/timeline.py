@@ -22,6 +22,8 @@ class BeatTimelineUI(TimelineUI):
     ELEMENT_CLASS = BeatUI
     ACCEPTS_HORIZONTAL_ARROWS = True
     TIMELINE_KIND = TimelineKind.BEAT_TIMELINE
+    BOUNDARY_ATTRS = ("time",)
+    POSITION_TIME_ATTRS = ("time",)
     UPDATE_TRIGGERS = TimelineUI.UPDATE_TRIGGERS + [
         "beat_pattern",
         "measure_numbers",
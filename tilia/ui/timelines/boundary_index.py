@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import bisect
+from typing import Callable, Hashable, Iterable
+
+
+class BoundaryIndex:
+    """
+    Sorted index of the boundary times of a timeline's elements
+    (e.g. beat and marker times, hierarchy starts and ends).
+    Boundaries are stored by the key of the element that owns them,
+    so they can be updated when the element changes. Queries use bisect.
+
+    Query methods accept a `key` (e.g. `time_x_converter.get_x_by_time`)
+    so they can be made with x coordinates instead of times.
+    """
+
+    def __init__(self):
+        self._times: list[float] = []
+        self._key_to_times: dict[Hashable, tuple[float, ...]] = {}
+
+    def __len__(self):
+        return len(self._times)
+
+    def __iter__(self):
+        return iter(self._times)
+
+    def set(self, key: Hashable, times: Iterable[float]) -> None:
+        self.discard(key)
+        times = tuple(times)
+        for time in times:
+            bisect.insort(self._times, time)
+        self._key_to_times[key] = times
+
+    def discard(self, key: Hashable) -> None:
+        for time in self._key_to_times.pop(key, ()):
+            del self._times[bisect.bisect_left(self._times, time)]
+
+    def clear(self) -> None:
+        self._times = []
+        self._key_to_times = {}
+
+    def contains(self, value: float, key: Callable | None = None) -> bool:
+        idx = bisect.bisect_left(self._times, value, key=key)
+        return idx < len(self._times) and self._apply(key, self._times[idx]) == value
+
+    def get_previous(self, value: float, key: Callable | None = None) -> float | None:
+        """Returns the greatest boundary that is smaller than `value`."""
+        idx = bisect.bisect_left(self._times, value, key=key)
+        return self._times[idx - 1] if idx > 0 else None
+
+    def get_next(self, value: float, key: Callable | None = None) -> float | None:
+        """Returns the smallest boundary that is greater than `value`."""
+        idx = bisect.bisect_right(self._times, value, key=key)
+        return self._times[idx] if idx < len(self._times) else None
+
+    def get_nearest(self, value: float, key: Callable | None = None) -> float | None:
+        idx = bisect.bisect_left(self._times, value, key=key)
+        candidates = self._times[max(idx - 1, 0) : idx + 1]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda t: abs(self._apply(key, t) - value))
+
+    @staticmethod
+    def _apply(key: Callable | None, time: float) -> float:
+        return key(time) if key else time
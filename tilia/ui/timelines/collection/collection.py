@@ -114,6 +114,7 @@ class TimelineUIs:
         self.scene = TimelineUIsScene()
         self.view = TimelineUIsView()
         self.view.setScene(self.scene)
+        self.view.horizontalScrollBar().valueChanged.connect(self.on_horizontal_scroll)
         main_window.setCentralWidget(self.view)
 
     def _setup_requests(self):
@@ -122,6 +123,7 @@ class TimelineUIs:
             (Post.TIMELINE_DELETE_DONE, self.on_timeline_deleted),
             (Post.TIMELINE_COMPONENT_CREATED, self.on_timeline_component_created),
             (Post.TIMELINE_COMPONENT_DELETED, self.on_timeline_component_deleted),
+            (Post.TIMELINE_COMPONENTS_DELETED, self.on_timeline_components_deleted),
             (
                 Post.TIMELINE_COMPONENT_SET_DATA_DONE,
                 self.on_timeline_component_set_data_done,
@@ -163,7 +165,8 @@ class TimelineUIs:
             (Post.SELECTION_BOX_SELECT_ITEM, self.on_selection_box_select_item),
             (Post.SELECTION_BOX_DESELECT_ITEM, self.on_selection_box_deselect_item),
             (Post.TIMELINE_WIDTH_SET_DONE, self.on_timeline_width_set_done),
-            (Post.TIMELINES_CROP_DONE, self.on_timelines_crop_done),
+            (Post.TIMELINES_CROP_DONE, self.on_timelines_scale_or_crop_done),
+            (Post.TIMELINES_SCALE_DONE, self.on_timelines_scale_or_crop_done),
             (
                 Post.BEAT_TIMELINE_MEASURE_NUMBER_CHANGE_DONE,
                 self.on_beat_timeline_measure_number_change_done,
@@ -278,6 +281,16 @@ class TimelineUIs:
 
         self.get_timeline_ui(tl_id).on_timeline_component_deleted(component_id)
 
+    def on_timeline_components_deleted(
+        self, _: TlKind, tl_id: int, component_ids: list[int]
+    ):
+        deleted = {(tl_id, id) for id in component_ids}
+        if loop_deleted := (self.loop_elements & deleted) - self.loop_delete_ignore:
+            self.loop_elements -= loop_deleted
+            self._update_loop_elements(clear=len(self.loop_elements) == 0)
+
+        self.get_timeline_ui(tl_id).on_timeline_components_deleted(component_ids)
+
     def on_timeline_component_set_data_done(
         self, timeline_id: int, component_id: int, attr: str, value: Any
     ):
@@ -286,6 +299,8 @@ class TimelineUIs:
         element.update(attr, value)
         if attr in element.tl_component.ORDERING_ATTRS:
             timeline_ui.update_element_order(element)
+        if attr in timeline_ui.BOUNDARY_ATTRS:
+            timeline_ui.update_element_boundaries(element)
         if (timeline_id, component_id) in self.loop_elements and self.loop_time[
             0
         ] != self.loop_time[1]:
@@ -360,7 +375,9 @@ class TimelineUIs:
 
     def set_playback_lines_position(self, time):
         for tl_ui in self:
-            self.change_playback_line_position(tl_ui, time)
+            # hidden timelines are updated when shown
+            if tl_ui.get_data("is_visible"):
+                self.change_playback_line_position(tl_ui, time)
 
     def update_toolbar_visibility(self):
         visible_tl_kinds = {
@@ -378,11 +395,27 @@ class TimelineUIs:
         )
 
     def on_timeline_width_set_done(self, width):
+        # elements are positioned with the converter, which may not have
+        # handled the new width yet
+        time_x_converter.on_playback_area_set_width(get(Get.PLAYBACK_AREA_WIDTH))
         self.scene.setSceneRect(0, 0, width, self.get_scene_height())
 
         for tlui in self:
             tlui.set_width(width)
 
+    def on_horizontal_scroll(self, _):
+        for tlui in self:
+            tlui.update_visible_element_positions()
+
+    def get_visible_time_range(self) -> tuple[float, float]:
+        """Time range in view, with half a view of margin on each side."""
+        left, right = self.view.current_viewport_x.values()
+        margin = (right - left) / 2
+        return (
+            time_x_converter.get_time_by_x(left - margin),
+            time_x_converter.get_time_by_x(right + margin),
+        )
+
     def update_timeline_ui_ordinal(self):
         self.update_timeline_uis_position()
 
@@ -1095,7 +1128,14 @@ class TimelineUIs:
 
         self._auto_scroll(reason, time)
 
-        if not self.is_dragging:
+        if self.is_dragging:
+            return
+
+        if reason == MediaTimeChangeReason.PLAYBACK:
+            # playback times are interpolated by the player, so they are smooth
+            self.set_playback_lines_position(time)
+            self.selected_time = time
+        else:
             __set_time(time)
 
     def set_is_dragging(self, is_dragging: bool) -> None:
@@ -1123,10 +1163,58 @@ class TimelineUIs:
 
         timeline_ui.scene.set_playback_line_pos(time_x_converter.get_x_by_time(time))
 
-    def on_timelines_crop_done(self):
+    def on_timelines_scale_or_crop_done(self):
         for tlui in self:
+            tlui.update_boundaries()
             self.update_timeline_times(tlui)
 
+    def _get_boundary_indexes(self, kinds: list[TimelineKind] | None = None):
+        return [
+            tlui.boundaries
+            for tlui in self
+            if tlui.BOUNDARY_ATTRS
+            and tlui.get_data("is_visible")
+            and (kinds is None or tlui.TIMELINE_KIND in kinds)
+        ]
+
+    def get_previous_boundary_time(
+        self, time: float, kinds: list[TimelineKind] | None = None
+    ) -> float | None:
+        """
+        Returns the greatest boundary (e.g. beat, marker or hierarchy
+        start or end) in visible timelines of `kinds` that is smaller than `time`.
+        """
+        times = [
+            t
+            for index in self._get_boundary_indexes(kinds)
+            if (t := index.get_previous(time)) is not None
+        ]
+        return max(times, default=None)
+
+    def get_next_boundary_time(
+        self, time: float, kinds: list[TimelineKind] | None = None
+    ) -> float | None:
+        """
+        Returns the smallest boundary (e.g. beat, marker or hierarchy
+        start or end) in visible timelines of `kinds` that is greater than `time`.
+        """
+        times = [
+            t
+            for index in self._get_boundary_indexes(kinds)
+            if (t := index.get_next(time)) is not None
+        ]
+        return min(times, default=None)
+
+    def get_nearest_boundary_time(
+        self, time: float, kinds: list[TimelineKind] | None = None
+    ) -> float | None:
+        times = [
+            t
+            for index in self._get_boundary_indexes(kinds)
+            if (t := index.get_nearest(time)) is not None
+        ]
+        return min(times, key=lambda t: abs(t - time), default=None)
+
     def deselect_all_elements_in_timeline_uis(self, excluding: TimelineUI):
         for timeline_ui in self:
             if timeline_ui == excluding:
@@ -7,6 +7,10 @@ def noop(*_, **__):
     pass
 
 
+def no_snap(x: int) -> int:
+    return x
+
+
 class DragManager:
     def __init__(
         self,
@@ -15,12 +19,14 @@ class DragManager:
         before_each=noop,
         after_each=noop,
         on_release=noop,
+        snap=no_snap,
     ):
         self.get_min_x = get_min_x
         self.get_max_x = get_max_x
         self.before_each = before_each
         self.after_each = after_each
         self.on_release = on_release
+        self.snap = snap
         self._setup_requests()
 
     def _setup_requests(self):
@@ -34,7 +40,7 @@ class DragManager:
 
     def on_mouse_drag(self, x: int, _: int):  # ignores the y coordinate
         self.before_each()
-        dragged_to = minmax(x, self.get_min_x(), self.get_max_x())
+        dragged_to = minmax(self.snap(x), self.get_min_x(), self.get_max_x())
         self.after_each(dragged_to)
 
     def on_mouse_release(self):
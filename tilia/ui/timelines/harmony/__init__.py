@@ -1,4 +1,20 @@
-from .elements.harmony import HarmonyUI
-from .elements.mode import ModeUI
-from .toolbar import HarmonyTimelineToolbar
-from .timeline import HarmonyTimelineUI
+def __getattr__(name):
+    # imported on demand, so harmony constants can be
+    # used without PyQt (e.g. by the CLI)
+    if name == "HarmonyUI":
+        from .elements.harmony import HarmonyUI
+
+        return HarmonyUI
+    elif name == "ModeUI":
+        from .elements.mode import ModeUI
+
+        return ModeUI
+    elif name == "HarmonyTimelineToolbar":
+        from .toolbar import HarmonyTimelineToolbar
+
+        return HarmonyTimelineToolbar
+    elif name == "HarmonyTimelineUI":
+        from .timeline import HarmonyTimelineUI
+
+        return HarmonyTimelineUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@ import functools
 import math
 
 from tilia.requests import get, Get, post, Post
+from tilia.timelines.timeline_kinds import TimelineKind
 from tilia.ui.coords import time_x_converter
 from tilia.ui.timelines.drag import DragManager
 from tilia.ui.timelines.hierarchy.handles import (
@@ -12,6 +13,7 @@ from tilia.ui.timelines.hierarchy.extremity import Extremity
 
 MIN_DRAG_GAP = 4
 DRAG_PROXIMITY_LIMIT = 4
+SNAP_DISTANCE = 5
 
 
 def start_drag(
@@ -29,9 +31,22 @@ def start_drag(
         before_each=functools.partial(before_each_drag, hierarchy_ui),
         after_each=get_after_each_drag_func(hierarchy_ui, extremity),
         on_release=functools.partial(on_drag_end, hierarchy_ui),
+        snap=functools.partial(snap_to_beat, hierarchy_ui),
     )
 
 
+def snap_to_beat(hierarchy_ui, x: int) -> int:
+    """Returns the x of the nearest beat, if it is within SNAP_DISTANCE of `x`."""
+    beat_time = hierarchy_ui.timeline_ui.collection.get_nearest_boundary_time(
+        time_x_converter.get_time_by_x(x), [TimelineKind.BEAT_TIMELINE]
+    )
+    if beat_time is None:
+        return x
+
+    beat_x = time_x_converter.get_x_by_time(beat_time)
+    return beat_x if abs(beat_x - x) <= SNAP_DISTANCE else x
+
+
 def get_after_each_drag_func(hierarchy_ui, extremity):
     if extremity in [Extremity.START, Extremity.END]:
         return functools.partial(after_each_body_handle_drag, hierarchy_ui, extremity)
@@ -124,6 +139,5 @@ def on_drag_end(hierarchy_ui):
         post(Post.ELEMENT_DRAG_END)
         hierarchy_ui.dragged = False
         if not hierarchy_ui.is_selected():
-            hierarchy_ui.pre_start_handle.setVisible(False)
-            hierarchy_ui.post_end_handle.setVisible(False)
+            hierarchy_ui.delete_frame_handles()
         hierarchy_ui.drag_extremity = None
@@ -3,8 +3,9 @@ from __future__ import annotations
 from typing import Literal
 
 from PyQt6.QtCore import Qt, QRectF, QPointF
-from PyQt6.QtGui import QColor, QPen, QFont, QFontMetrics, QPixmap
+from PyQt6.QtGui import QColor, QPen, QFont, QPixmap
 from PyQt6.QtWidgets import (
+    QGraphicsItem,
     QGraphicsPixmapItem,
     QGraphicsRectItem,
     QGraphicsTextItem,
@@ -19,6 +20,7 @@ from ..cursors import CursorMixIn
 from ...color import get_tinted_color, get_untinted_color
 from ...consts import TINT_FACTOR_ON_SELECTION
 from ...coords import time_x_converter
+from ...text_layout import get_cropped_text
 from ...windows.inspect import HIDE_FIELD, InspectRowKind
 
 import tilia.ui.format
@@ -91,21 +93,22 @@ class HierarchyUI(TimelineUIElement):
         "color",
     ]
     CONTEXT_MENU_CLASS = HierarchyContextMenu
-    FONT_METRICS = QFontMetrics(QFont("Arial", 10))
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.previous_width = 0
 
-        self.label_substrings_widths: list[int] = []
+        # decorations are only created when they are shown, so that
+        # unselected units add as few items to the scene as possible
+        self.comments_icon: HierarchyCommentsIcon | None = None
+        self.loop_icon: HierarchyLoopIcon | None = None
+        self.frame_handles: dict[Extremity, HierarchyFrameHandle] = {}
 
         self._setup_body()
         self._setup_label()
-        self._setup_comments_icon()
-        self._setup_loop_icon()
+        self.update_comments()
         self._setup_body_handles()
-        self._setup_frame_handles()
 
         self.dragged = False
         self.drag_extremity = None
@@ -127,6 +130,14 @@ class HierarchyUI(TimelineUIElement):
     def has_post_end(self):
         return self.get_data("post_end") != self.get_data("end")
 
+    @property
+    def pre_start_handle(self) -> HierarchyFrameHandle:
+        return self.get_frame_handle(Extremity.PRE_START)
+
+    @property
+    def post_end_handle(self) -> HierarchyFrameHandle:
+        return self.get_frame_handle(Extremity.POST_END)
+
     @property
     def pre_start_x(self):
         return time_x_converter.get_x_by_time(self.get_data("pre_start"))
@@ -173,13 +184,7 @@ class HierarchyUI(TimelineUIElement):
         if not label:
             return ""
 
-        max_width = end_x - start_x
-
-        for i, width in enumerate(self.label_substrings_widths):
-            if width > max_width:
-                return label[:i]
-
-        return label
+        return get_cropped_text(HierarchyLabel.get_font(), label, end_x - start_x)
 
     @property
     def full_name(self) -> str:
@@ -199,29 +204,14 @@ class HierarchyUI(TimelineUIElement):
         return full_name
 
     def child_items(self):
-        return [
-            self.body,
-            self.label,
-            self.comments_icon,
-            self.loop_icon,
-            self.start_handle,
-            self.end_handle,
-            self.pre_start_handle,
-            self.pre_start_handle.vertical_line,
-            self.pre_start_handle.horizontal_line,
-            self.post_end_handle,
-            self.post_end_handle.vertical_line,
-            self.post_end_handle.horizontal_line,
-        ]
+        items = [self.body, self.label, self.start_handle, self.end_handle]
+        for icon in [self.comments_icon, self.loop_icon]:
+            if icon:
+                items.append(icon)
+        for handle in self.frame_handles.values():
+            items += [handle, handle.vertical_line, handle.horizontal_line]
 
-    def update_label_substrings_widths(self, value):
-        """
-        Calculates and stores width of substrings of 'value'
-        """
-        font_metrics = QFontMetrics(QFont("Arial", 10))
-        self.label_substrings_widths = [
-            font_metrics.horizontalAdvance(value[: i + 1]) for i in range(len(value))
-        ]
+        return items
 
     def update(self, attr: str, value):
         if attr not in self.UPDATE_TRIGGERS:
@@ -237,7 +227,11 @@ class HierarchyUI(TimelineUIElement):
         self.body.set_fill(self.ui_color)
 
     def update_comments(self):
-        self.comments_icon.setVisible(bool(self.get_data("comments")))
+        if self.get_data("comments") and not self.comments_icon:
+            self._setup_comments_icon()
+        elif not self.get_data("comments") and self.comments_icon:
+            self.scene.removeItem(self.comments_icon)
+            self.comments_icon = None
 
     def update_label(self, start_x=None, end_x=None, level=None, height=None):
         # if called from update_position,
@@ -248,9 +242,6 @@ class HierarchyUI(TimelineUIElement):
         height = height or self.timeline_ui.get_data("height")
 
         new_label = self.get_data("label")
-        if new_label != self.label.toPlainText():
-            self.update_label_substrings_widths(new_label)
-
         self.label.set_text(self.get_cropped_label(start_x, end_x, new_label))
         self.update_label_position(level, height, start_x, end_x)
 
@@ -265,22 +256,24 @@ class HierarchyUI(TimelineUIElement):
         self.update_position()
 
     def update_pre_start(self):
-        self.update_frame_handle_position(
-            Extremity.PRE_START,
-            self.get_data("level"),
-            self.timeline_ui.get_data("height"),
-            self.start_x,
-        )
+        if Extremity.PRE_START in self.frame_handles:
+            self.update_frame_handle_position(
+                Extremity.PRE_START,
+                self.get_data("level"),
+                self.timeline_ui.get_data("height"),
+                self.start_x,
+            )
         if self.is_selected():
             self.update_frame_handle_visibility(Extremity.PRE_START)
 
     def update_post_end(self):
-        self.update_frame_handle_position(
-            Extremity.POST_END,
-            self.get_data("level"),
-            self.timeline_ui.get_data("height"),
-            self.end_x,
-        )
+        if Extremity.POST_END in self.frame_handles:
+            self.update_frame_handle_position(
+                Extremity.POST_END,
+                self.get_data("level"),
+                self.timeline_ui.get_data("height"),
+                self.end_x,
+            )
         if self.is_selected():
             self.update_frame_handle_visibility(Extremity.POST_END)
 
@@ -307,10 +300,12 @@ class HierarchyUI(TimelineUIElement):
         )
 
     def update_comments_icon_position(self, level, height, end_x):
-        self.comments_icon.set_position(end_x, level, height)
+        if self.comments_icon:
+            self.comments_icon.set_position(end_x, level, height)
 
     def update_loop_icon_position(self, level, height, start_x):
-        self.loop_icon.set_position(start_x, height, level)
+        if self.loop_icon:
+            self.loop_icon.set_position(start_x, height, level)
 
     def update_label_position(self, level, height, start_x, end_x):
         self.label.set_position(
@@ -330,35 +325,39 @@ class HierarchyUI(TimelineUIElement):
             )
 
     def update_frame_handles_position(self, level, height, start_x, end_x):
-        self.update_frame_handle_position(Extremity.PRE_START, level, height, start_x)
-        self.update_frame_handle_position(Extremity.POST_END, level, height, end_x)
+        if Extremity.PRE_START in self.frame_handles:
+            self.update_frame_handle_position(
+                Extremity.PRE_START, level, height, start_x
+            )
+        if Extremity.POST_END in self.frame_handles:
+            self.update_frame_handle_position(Extremity.POST_END, level, height, end_x)
 
     def update_frame_handle_position(self, extremity: Extremity, level, height, body_x):
         if extremity == Extremity.PRE_START:
-            self.pre_start_handle.set_position(
-                body_x, self.pre_start_x, self.frame_handle_y(level, height)
-            )
+            frame_x = self.pre_start_x
         elif extremity == Extremity.POST_END:
-            self.post_end_handle.set_position(
-                body_x, self.post_end_x, self.frame_handle_y(level, height)
-            )
+            frame_x = self.post_end_x
         else:
             raise ValueError("Unrecognized extremity")
 
+        self.frame_handles[extremity].set_position(
+            body_x, frame_x, self.frame_handle_y(level, height)
+        )
+
     def update_frame_handles_visibility(self):
         self.update_frame_handle_visibility(Extremity.PRE_START)
         self.update_frame_handle_visibility(Extremity.POST_END)
 
     def update_frame_handle_visibility(self, extremity: Extremity):
-        handle, exists = {
-            Extremity.PRE_START: (self.pre_start_handle, self.has_pre_start),
-            Extremity.POST_END: (self.post_end_handle, self.has_post_end),
+        exists = {
+            Extremity.PRE_START: self.has_pre_start,
+            Extremity.POST_END: self.has_post_end,
         }[extremity]
 
-        if not handle.isVisible() and exists:
-            handle.setVisible(True)
-        elif handle.isVisible() and not exists:
-            handle.setVisible(False)
+        if exists:
+            self.get_frame_handle(extremity).setVisible(True)
+        elif handle := self.frame_handles.pop(extremity, None):
+            self.scene.removeItem(handle)
 
     def _setup_body(self):
         self.body = HierarchyBody(
@@ -371,7 +370,6 @@ class HierarchyUI(TimelineUIElement):
         self.scene.addItem(self.body)
 
     def _setup_label(self):
-        self.update_label_substrings_widths(self.get_data("label"))
         self.label = HierarchyLabel(
             (self.start_x + self.end_x) / 2,
             self.timeline_ui.get_data("height"),
@@ -385,14 +383,12 @@ class HierarchyUI(TimelineUIElement):
             self.end_x, self.timeline_ui.get_data("height"), self.get_data("level")
         )
         self.scene.addItem(self.comments_icon)
-        self.comments_icon.setVisible(bool(self.get_data("comments")))
 
     def _setup_loop_icon(self):
         self.loop_icon = HierarchyLoopIcon(
             self.start_x, self.timeline_ui.get_data("height"), self.get_data("level")
         )
         self.scene.addItem(self.loop_icon)
-        self.loop_icon.setVisible(False)
 
     def _setup_body_handles(self):
         """If there are already markers at start or end position,
@@ -408,27 +404,41 @@ class HierarchyUI(TimelineUIElement):
             self.end_handle = self._setup_handle(Extremity.END)
             self.scene.addItem(self.end_handle)
 
-    def _setup_frame_handles(self):
+    def get_frame_handle(self, extremity: Extremity) -> HierarchyFrameHandle:
+        """Returns the frame handle for `extremity`, creating it if needed."""
+        if extremity not in self.frame_handles:
+            self.frame_handles[extremity] = self._setup_frame_handle(extremity)
+        return self.frame_handles[extremity]
+
+    def _setup_frame_handle(self, extremity: Extremity) -> HierarchyFrameHandle:
         y = self.frame_handle_y(
             self.get_data("level"), self.timeline_ui.get_data("height")
         )
-        self.pre_start_handle = HierarchyFrameHandle(self.start_x, self.pre_start_x, y)
-        self.scene.addItem(self.pre_start_handle)
+        if extremity == Extremity.PRE_START:
+            handle = HierarchyFrameHandle(self.start_x, self.pre_start_x, y)
+        elif extremity == Extremity.POST_END:
+            handle = HierarchyFrameHandle(self.end_x, self.post_end_x, y)
+        else:
+            raise ValueError("Unrecognized extremity")
+        self.scene.addItem(handle)
+        return handle
 
-        self.post_end_handle = HierarchyFrameHandle(self.end_x, self.post_end_x, y)
-        self.scene.addItem(self.post_end_handle)
+    def delete_frame_handles(self) -> None:
+        for handle in self.frame_handles.values():
+            self.scene.removeItem(handle)
+        self.frame_handles = {}
 
     def extremity_to_handle(
         self, extremity: Extremity
     ) -> HierarchyBodyHandle | HierarchyFrameHandle:
-        try:
-            return {
-                Extremity.START: self.start_handle,
-                Extremity.END: self.end_handle,
-                Extremity.PRE_START: self.pre_start_handle,
-                Extremity.POST_END: self.post_end_handle,
-            }[extremity]
-        except KeyError:
+        # frame handles are created when accessed, so only the requested one is
+        if extremity == Extremity.START:
+            return self.start_handle
+        elif extremity == Extremity.END:
+            return self.end_handle
+        elif extremity in (Extremity.PRE_START, Extremity.POST_END):
+            return self.get_frame_handle(extremity)
+        else:
             raise ValueError("Unrecognized extremity")
 
     @staticmethod
@@ -448,8 +458,7 @@ class HierarchyUI(TimelineUIElement):
             return {
                 self.start_handle: Extremity.START,
                 self.end_handle: Extremity.END,
-                self.pre_start_handle: Extremity.PRE_START,
-                self.post_end_handle: Extremity.POST_END,
+                **{h: extremity for extremity, h in self.frame_handles.items()},
             }[handle]
         except KeyError:
             raise ValueError(f"{handle} if not a handle of {self}")
@@ -473,15 +482,16 @@ class HierarchyUI(TimelineUIElement):
         )
 
     def selection_triggers(self):
-        return self.body, self.label, self.comments_icon
+        triggers = [self.body, self.label]
+        if self.comments_icon:
+            triggers.append(self.comments_icon)
+
+        return triggers
 
     def left_click_triggers(self):
-        triggers = [
-            self.start_handle,
-            self.end_handle,
-            self.pre_start_handle.vertical_line,
-            self.post_end_handle.vertical_line,
-        ]
+        triggers = [self.start_handle, self.end_handle]
+        for handle in self.frame_handles.values():
+            triggers.append(handle.vertical_line)
 
         return triggers
 
@@ -491,7 +501,7 @@ class HierarchyUI(TimelineUIElement):
         start_drag(self, item)
 
     def double_left_click_triggers(self):
-        return [self.body, self.comments_icon, self.label] + self.left_click_triggers()
+        return self.selection_triggers() + self.left_click_triggers()
 
     def on_double_left_click(self, _) -> None:
         if self.drag_manager:
@@ -500,7 +510,7 @@ class HierarchyUI(TimelineUIElement):
         post(Post.PLAYER_SEEK, self.seek_time)
 
     def right_click_triggers(self):
-        return self.body, self.label, self.comments_icon
+        return self.selection_triggers()
 
     def on_select(self) -> None:
         self.body.on_select()
@@ -511,14 +521,12 @@ class HierarchyUI(TimelineUIElement):
 
         if selected_descendants := self.selected_descendants():
             for ui in selected_descendants:
-                ui.pre_start_handle.setVisible(False)
-                ui.post_end_handle.setVisible(False)
+                ui.delete_frame_handles()
         post(Post.HIERARCHY_SELECTED)
 
     def on_deselect(self) -> None:
         self.body.on_deselect()
-        self.pre_start_handle.setVisible(False)
-        self.post_end_handle.setVisible(False)
+        self.delete_frame_handles()
         post(Post.HIERARCHY_DESELECTED)
 
     def selected_ascendants(self) -> list[HierarchyUI]:
@@ -558,7 +566,11 @@ class HierarchyUI(TimelineUIElement):
                 self.scene.removeItem(handle)
 
     def on_loop_set(self, is_looping: bool) -> None:
-        self.loop_icon.setVisible(is_looping)
+        if is_looping and not self.loop_icon:
+            self._setup_loop_icon()
+        elif not is_looping and self.loop_icon:
+            self.scene.removeItem(self.loop_icon)
+            self.loop_icon = None
 
     @property
     def start_and_end_formatted(self) -> str:
@@ -683,13 +695,18 @@ class HierarchyBody(CursorMixIn, QGraphicsRectItem):
 class HierarchyLabel(CursorMixIn, QGraphicsTextItem):
     def __init__(self, x: float, tl_height: int, level: int, text: str):
         super().__init__(cursor_shape=Qt.CursorShape.PointingHandCursor)
+        # text layout is costly, so it is only redone when the text changes
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setup_font()
         self.set_text(text)
         self.set_position(x, tl_height, level)
 
+    @staticmethod
+    def get_font():
+        return QFont("Arial", 10)
+
     def setup_font(self):
-        font = QFont("Arial", 10)
-        self.setFont(font)
+        self.setFont(self.get_font())
         self.setDefaultTextColor(QColor("black"))
 
     def get_point(self, x: float, tl_height, level):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from tilia.requests import get, Get, Post, listen
+from tilia.ui.coords import time_x_converter
 from tilia.ui.timelines.base.timeline import (
     TimelineUI,
 )
@@ -25,6 +26,8 @@ class HierarchyTimelineUI(TimelineUI):
     TIMELINE_KIND = TimelineKind.HIERARCHY_TIMELINE
     ACCEPTS_HORIZONTAL_ARROWS = True
     ACCEPTS_VERTICAL_ARROWS = True
+    BOUNDARY_ATTRS = ("start", "end")
+    POSITION_TIME_ATTRS = ("pre_start", "post_end")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -51,6 +54,9 @@ class HierarchyTimelineUI(TimelineUI):
         )
 
     def get_handle_by_x(self, x: float):
+        if not self.boundaries.contains(x, key=time_x_converter.get_x_by_time):
+            return
+
         def starts_or_ends_at_time(ui: HierarchyUI) -> bool:
             return ui.start_x == x or ui.end_x == x
 
@@ -79,33 +85,16 @@ class HierarchyTimelineUI(TimelineUI):
         return self.element_manager.get_elements_by_condition(is_using_handle)
 
     def get_previous_handle_x_by_x(self, x: float) -> None | int:
-        all_marker_xs = self.get_all_elements_boundaries()
-        earlier_marker_xs = [x_ for x_ in all_marker_xs if x_ < x]
-
-        if earlier_marker_xs:
-            return max(earlier_marker_xs)
-        else:
-            return None
+        time = self.boundaries.get_previous(x, key=time_x_converter.get_x_by_time)
+        return time_x_converter.get_x_by_time(time) if time is not None else None
 
     def get_next_handle_x_by_x(self, x: float) -> None | int:
-        all_marker_xs = self.get_all_elements_boundaries()
-        later_marker_xs = [x_ for x_ in all_marker_xs if x_ > x]
-
-        if later_marker_xs:
-            return min(later_marker_xs)
-        else:
-            return None
+        time = self.boundaries.get_next(x, key=time_x_converter.get_x_by_time)
+        return time_x_converter.get_x_by_time(time) if time is not None else None
 
     def get_all_elements_boundaries(self) -> set[int]:
         """Returns all the start_x and end_x values for hierarchy ui's in timeline."""
-        earlier_boundaries = self.element_manager.get_existing_values_for_attribute(
-            "start_x"
-        )
-        later_boundaries = self.element_manager.get_existing_values_for_attribute(
-            "end_x"
-        )
-
-        return earlier_boundaries.union(later_boundaries)
+        return {time_x_converter.get_x_by_time(time) for time in self.boundaries}
 
     def paste_single_into_selected_elements(self, paste_data: list[dict]):
         for element in self.element_manager.get_selected_elements():
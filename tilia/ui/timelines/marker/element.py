@@ -211,6 +211,7 @@ class MarkerLabel(QGraphicsTextItem):
         text: str,
     ):
         super().__init__()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self._setup_font()
         self.set_text(text)
         self.set_position(x, y)
@@ -227,4 +228,5 @@ class MarkerLabel(QGraphicsTextItem):
         self.setPos(self.get_point(x, y))
 
     def set_text(self, value: str):
-        self.setPlainText(value)
+        if value != self.toPlainText():
+            self.setPlainText(value)
@@ -28,6 +28,8 @@ class MarkerTimelineUI(TimelineUI):
     CONTEXT_MENU_CLASS = MarkerTimelineUIContextMenu
 
     TIMELINE_KIND = TimelineKind.MARKER_TIMELINE
+    BOUNDARY_ATTRS = ("time",)
+    POSITION_TIME_ATTRS = ("time",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
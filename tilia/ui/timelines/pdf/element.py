@@ -6,7 +6,6 @@ from PyQt6.QtGui import (
     QColor,
     QFont,
     QPixmap,
-    QFontMetrics,
 )
 from PyQt6.QtWidgets import (
     QGraphicsItem,
@@ -23,6 +22,7 @@ from ..cursors import CursorMixIn
 from ..drag import DragManager
 from ...format import format_media_time
 from ...coords import time_x_converter
+from ...text_layout import get_text_width
 from tilia.ui.timelines.base.element import TimelineUIElement
 from ...windows.inspect import InspectRowKind
 
@@ -209,8 +209,7 @@ class PdfMarkerLabel(QGraphicsTextItem):
         fits = False
         self.set_font(self.DEFAULT_FONT_SIZE)
         while not fits:
-            font_metrics = QFontMetrics(self.font())
-            width = font_metrics.horizontalAdvance(value)
+            width = get_text_width(self.font(), value)
             if width > self.MAX_TEXT_WIDTH:
                 self.set_font(self.font().pointSize() - 1)
             else:
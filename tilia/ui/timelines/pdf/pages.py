@@ -0,0 +1,146 @@
+"""
+Cached rendering of PDF pages.
+
+Pages are rendered to pixmaps at the current view scale on a worker thread.
+Rendered pages are cached and evicted in least recently used order once
+they take more than MAX_CACHE_BYTES, so the timeline can prefetch the pages
+of upcoming markers and page turns only have to blit a pixmap.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Iterable
+
+from PyQt6.QtCore import QObject, QPointF, QRectF, QSize, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPixmap
+from PyQt6.QtPdf import QPdfDocument
+from PyQt6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class PdfPageCache(QObject):
+    page_ready = pyqtSignal(int)
+    _page_rendered = pyqtSignal(tuple, QImage)
+
+    def __init__(self, document: QPdfDocument, parent: QObject | None = None):
+        super().__init__(parent)
+        self.document = document
+        self.pages: OrderedDict[tuple[int, float, int], QPixmap] = OrderedDict()
+        self.pending = set()
+        self.generation = 0
+        self.scale = None
+        self.size_in_bytes = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._page_rendered.connect(self._on_page_rendered)
+
+    def load(self) -> None:
+        """Discards rendered pages. Must be called when the document changes."""
+        self._pool.clear()
+        self.generation += 1
+        self.pages.clear()
+        self.pending.clear()
+        self.size_in_bytes = 0
+
+    def set_scale(self, scale: float) -> None:
+        if scale == self.scale:
+            return
+        # pages queued for the previous scale won't be shown anymore
+        self._pool.clear()
+        self.pending.clear()
+        self.scale = scale
+
+    def get(self, page: int) -> QPixmap | None:
+        """
+        Returns `page` at the current scale, if it is cached.
+        Otherwise, queues it for rendering and returns None.
+        """
+        key = (self.generation, self.scale, page)
+        if (pixmap := self.pages.get(key)) is not None:
+            self.pages.move_to_end(key)
+            return pixmap
+
+        self._request(key)
+        return None
+
+    def prefetch(self, pages: Iterable[int]) -> None:
+        """Queues `pages` for rendering, if they are not cached yet."""
+        if self.scale is None:
+            # view was never painted, so we don't know the scale to render at
+            return
+
+        for page in pages:
+            if not 0 <= page < self.document.pageCount():
+                continue
+            key = (self.generation, self.scale, page)
+            if key in self.pages:
+                self.pages.move_to_end(key)
+            else:
+                self._request(key)
+
+    def _request(self, key: tuple[int, float, int]) -> None:
+        if key in self.pending:
+            return
+
+        self.pending.add(key)
+        _, scale, page = key
+        size = (self.document.pagePointSize(page) * scale).toSize()
+        self._pool.start(lambda: self._render(key, size))
+
+    def _render(self, key: tuple[int, float, int], size: QSize) -> None:
+        if key[0] != self.generation:
+            return
+        self._page_rendered.emit(key, self.document.render(key[2], size))
+
+    def _on_page_rendered(self, key: tuple[int, float, int], image: QImage):
+        self.pending.discard(key)
+        if key[0] != self.generation or image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        self.pages[key] = pixmap
+        self.size_in_bytes += get_size_in_bytes(pixmap)
+        while self.size_in_bytes > MAX_CACHE_BYTES and len(self.pages) > 1:
+            _, evicted = self.pages.popitem(last=False)
+            self.size_in_bytes -= get_size_in_bytes(evicted)
+
+        self.page_ready.emit(key[2])
+
+    def stop(self) -> None:
+        self._pool.clear()
+        self._pool.waitForDone()
+
+
+def get_size_in_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+class PdfPageItem(QGraphicsItem):
+    """Draws a page from the page cache. Scene coordinates are in points."""
+
+    def __init__(self, page: int, cache: PdfPageCache):
+        super().__init__()
+        self.page = page
+        self.cache = cache
+        self.bounds = QRectF(QPointF(0, 0), cache.document.pagePointSize(page))
+
+    def boundingRect(self) -> QRectF:
+        return self.bounds
+
+    def paint(self, painter, option, widget=None) -> None:
+        scale = round(
+            QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+                painter.worldTransform()
+            ),
+            3,
+        )
+        if scale <= 0:
+            return
+        self.cache.set_scale(scale)
+
+        if (pixmap := self.cache.get(self.page)) is not None:
+            painter.drawPixmap(self.bounds, pixmap, QRectF(pixmap.rect()))
+        else:
+            painter.fillRect(self.bounds, QColor("white"))
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import bisect
 import copy
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QPointF
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
 from PyQt6.QtPdf import QPdfDocument
-from PyQt6.QtPdfWidgets import QPdfView
+from PyQt6.QtWidgets import QGraphicsScene, QGraphicsView
 
 import tilia.errors
 from tilia.media.player.base import MediaTimeChangeReason
@@ -24,6 +26,7 @@ from tilia.ui.timelines.copy_paste import (
 )
 from tilia.ui.timelines.pdf.context_menu import PdfTimelineUIContextMenu
 from tilia.ui.timelines.pdf.element import PdfMarkerUI
+from tilia.ui.timelines.pdf.pages import PdfPageCache, PdfPageItem
 from tilia.ui.timelines.pdf.request_handlers import PdfMarkerUIRequestHandler
 from tilia.ui.timelines.pdf.toolbar import PdfTimelineToolbar
 from tilia.ui.windows.view_window import ViewWindow
@@ -42,6 +45,8 @@ class PdfTimelineUI(TimelineUI):
     ACCEPTS_HORIZONTAL_ARROWS = True
 
     TIMELINE_KIND = TimelineKind.PDF_TIMELINE
+    PREFETCH_COUNT = 2
+    POSITION_TIME_ATTRS = ("time",)
 
     def __init__(
         self,
@@ -76,6 +81,7 @@ class PdfTimelineUI(TimelineUI):
         if not self.timeline.get_data("is_pdf_valid"):
             self._handle_invalid_pdf()
         self.pdf_document.load(self.get_data("path"))
+        self.pdf_view.update_pages()
         self.pdf_view.update_window(
             int(self.pdf_document.pagePointSize(0).height()),
             int(self.pdf_document.pagePointSize(0).width()),
@@ -83,8 +89,7 @@ class PdfTimelineUI(TimelineUI):
 
     def _setup_pdf_document(self):
         self.pdf_document = QPdfDocument(None)
-        self.pdf_view = QPdfWindow(self.get_data("name"))
-        self.pdf_view.setDocument(self.pdf_document)
+        self.pdf_view = PdfWindow(self.get_data("name"), self.pdf_document)
 
     def update_name(self):
         name = self.get_data("name")
@@ -93,7 +98,7 @@ class PdfTimelineUI(TimelineUI):
 
     @property
     def current_page(self):
-        return self.pdf_view.pageNavigator().currentPage() + 1  # 1-based
+        return self.pdf_view.current_page + 1  # 1-based
 
     @property
     def page_total(self):
@@ -123,6 +128,10 @@ class PdfTimelineUI(TimelineUI):
         super().on_timeline_component_deleted(id)
         self.update_displayed_page(get(Get.MEDIA_CURRENT_TIME))
 
+    def on_timeline_components_deleted(self, ids: list[int]):
+        super().on_timeline_components_deleted(ids)
+        self.update_displayed_page(get(Get.MEDIA_CURRENT_TIME))
+
     def _deselect_all_but_last(self):
         if len(self.selected_elements) > 1:
             for element in self.selected_elements[:-1]:
@@ -216,18 +225,101 @@ class PdfTimelineUI(TimelineUI):
         if target_page == 0:
             # No markers are present
             target_page = 1
-        if self.pdf_view.pageNavigator().currentPage() != target_page - 1:
-            self.pdf_view.pageNavigator().jump(target_page - 1, QPointF(0, 0), 0)
+        if self.pdf_view.current_page != target_page - 1:
+            self.pdf_view.jump(target_page - 1)
+
+        # pages are 0-based in the document
+        self.pdf_view.page_cache.prefetch(
+            page - 1
+            for page in self.timeline.get_next_page_numbers(time, self.PREFETCH_COUNT)
+        )
 
     def delete(self):
         super().delete()
+        self.pdf_view.page_cache.stop()
         self.pdf_view.deleteLater()
 
 
-class QPdfWindow(ViewWindow, QPdfView):
-    def __init__(self, name: str):
+class PdfWindow(ViewWindow, QGraphicsView):
+    """
+    Displays the pages of a PDF document, one below the other.
+    Pages are drawn from a PdfPageCache and are scaled to fit the window width.
+    """
+
+    PAGE_SPACING = 6  # in points
+
+    def __init__(self, name: str, document: QPdfDocument):
         super().__init__("TiLiA PDF Viewer", None, menu_title=name)
-        self.setPageMode(QPdfView.PageMode.MultiPage)
+        self.document = document
+        self.page_cache = PdfPageCache(document, self)
+        self.page_cache.page_ready.connect(self.on_page_ready)
+        self.page_items: list[PdfPageItem] = []
+        self.page_tops: list[float] = []
+        self.current_page = 0  # 0-based
+
+        self.setScene(QGraphicsScene(self))
+        self.setBackgroundBrush(QColor("gray"))
+        self.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().valueChanged.connect(self.on_scroll)
+
+    def update_pages(self):
+        # scrolling while pages are replaced would change the current page
+        current_page = self.current_page
+        self.page_cache.load()
+        self.page_items = []
+        self.page_tops = []
+        self.scene().clear()
+
+        y = 0
+        for page in range(self.document.pageCount()):
+            item = PdfPageItem(page, self.page_cache)
+            item.setY(y)
+            self.scene().addItem(item)
+            self.page_items.append(item)
+            self.page_tops.append(y)
+            y += item.boundingRect().height() + self.PAGE_SPACING
+
+        self.scene().setSceneRect(self.scene().itemsBoundingRect())
+        self.fit_to_width()
+        self.jump(min(current_page, max(len(self.page_items) - 1, 0)))
+
+    def fit_to_width(self):
+        width = self.scene().sceneRect().width()
+        if not width:
+            return
+
+        scale = self.viewport().width() / width
+        self.resetTransform()
+        self.scale(scale, scale)
+
+    def jump(self, page: int):
+        self.current_page = page
+        if page < len(self.page_items):
+            self.verticalScrollBar().setValue(
+                self.verticalScrollBar().value()
+                + self.mapFromScene(self.page_items[page].pos()).y()
+            )
+
+    def on_scroll(self):
+        """Sets the current page to the one at the top of the window."""
+        if not self.page_tops:
+            return
+        # the spacing above a page counts as part of it, so rounding the
+        # scroll position when jumping doesn't select the previous page
+        top = self.mapToScene(0, 0).y() + self.PAGE_SPACING / 2
+        self.current_page = max(bisect.bisect_right(self.page_tops, top) - 1, 0)
+
+    def on_page_ready(self, page: int):
+        if page < len(self.page_items):
+            self.page_items[page].update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.scene():  # the window is shown before the scene is set
+            current_page = self.current_page
+            self.fit_to_width()
+            self.jump(current_page)
 
     def update_window(self, width: int, height: int):
         self.resize(width, height)
@@ -1,5 +1,5 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QGraphicsScene, QGraphicsRectItem
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsRectItem
 from PyQt6.QtGui import QColor, QPen, QBrush, QFont, QFontMetrics
 
 from tilia.settings import settings
@@ -35,6 +35,7 @@ class TimelineScene(QGraphicsScene):
         self.text = self.addText(self._get_elided_text(text), self.font)
         self.text.setDefaultTextColor(QColor("black"))
         self.text.setPos(*self.text_pos)
+        self.text.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
     def _get_elided_text(self, text: str):
         return QFontMetrics(self.font).elidedText(
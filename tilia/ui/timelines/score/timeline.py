@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import math
 from typing import Callable, Any, Iterable
 
@@ -9,7 +10,9 @@ from PyQt6.QtWidgets import QGraphicsRectItem
 
 from tilia.dirs import IMG_DIR
 import tilia.errors
-from tilia.exceptions import GetComponentDataError, NoReplyToRequest
+from tilia.exceptions import NoReplyToRequest
+from tilia.parsers.score import svg_cache
+from tilia.parsers.score.musicxml_to_svg import musicxml_to_svg
 from tilia.requests import Get, get, listen, Post, post
 from tilia.timelines.component_kinds import ComponentKind
 from tilia.timelines.timeline_kinds import TimelineKind
@@ -42,6 +45,15 @@ from tilia.ui.windows.svg_viewer import SvgViewer
 
 
 class ScoreTimelineUI(TimelineUI):
+    # Symbols are kept in per-staff lists sorted by time. Symbols of
+    # these kinds that share a staff and a time are displayed side by
+    # side, in this order.
+    STAFF_SYMBOL_KINDS = [
+        ComponentKind.CLEF,
+        ComponentKind.KEY_SIGNATURE,
+        ComponentKind.TIME_SIGNATURE,
+    ]
+
     TOOLBAR_CLASS = ScoreTimelineToolbar
     ACCEPTS_HORIZONTAL_ARROWS = True
 
@@ -62,7 +74,7 @@ class ScoreTimelineUI(TimelineUI):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.UPDATE_TRIGGERS = self.UPDATE_TRIGGERS + ["svg_data"]
+        self.UPDATE_TRIGGERS = self.UPDATE_TRIGGERS + ["svg_data", "svg_hash"]
         listen(
             self,
             Post.SETTINGS_UPDATED,
@@ -71,6 +83,8 @@ class ScoreTimelineUI(TimelineUI):
         listen(self, Post.PLAYER_CURRENT_TIME_CHANGED, self.on_audio_time_change)
         listen(self, Post.TIMELINE_WIDTH_SET_DONE, self.on_timeline_width_set_done)
 
+        self.svg_cache_key = None
+
         self._setup_pixmaps()
         self._reset_caches()
         self.update_height()
@@ -86,6 +100,7 @@ class ScoreTimelineUI(TimelineUI):
             Post.SCORE_TIMELINE_CLEAR_DONE,
             self.on_score_timeline_clear_done,
         )
+        listen(self, Post.SCORE_TIMELINE_SVG_CREATE, self.on_score_timeline_svg_create)
 
     def _setup_pixmaps(self):
         self.pixmaps = {
@@ -208,19 +223,63 @@ class ScoreTimelineUI(TimelineUI):
             # ComponentKind.CLEF, ComponentKind.KEY_SIGNATURE ComponentKind.TIME_SIGNATURE
             self.staffs_with_symbol.add(element.get_data("staff_index"))
 
-        try:
-            time = element.get_data("time")
-            staff_index = element.get_data("staff_index")
-        except GetComponentDataError:
+        if kind not in self.STAFF_SYMBOL_KINDS:
             return
-        if overlapping_components := self._get_overlap(staff_index, time, kind):
-            self._add_to_overlapping_elements(overlapping_components)
+
+        time = element.get_data("time")
+        staff_index = element.get_data("staff_index")
+        self._add_to_staff_symbols(element, kind, staff_index)
+        if overlapping_components := self._get_overlap(staff_index, time):
+            self.overlapping_elements[(staff_index, time)] = overlapping_components
             self._offset_overlapping_elements(overlapping_components)
 
-        if kind == ComponentKind.CLEF:
-            # Clefs need to be frequently found by time,
-            # so we cache them here
-            self.clef_time_cache = self.get_clef_time_cache()
+    def _add_to_staff_symbols(self, element, kind: ComponentKind, staff_index: int):
+        symbols = self.staff_symbols.setdefault(kind, {}).setdefault(staff_index, [])
+        bisect.insort_right(symbols, element, key=lambda e: e.get_data("time"))
+
+    def delete_element(self, element):
+        self._remove_from_staff_symbols([element])
+        super().delete_element(element)
+
+    def delete_elements(self, elements):
+        self._remove_from_staff_symbols(elements)
+        super().delete_elements(elements)
+
+    def _remove_from_staff_symbols(self, elements) -> None:
+        # the elements' components may already be deleted, so their data can't be read
+        deleted = set(elements)
+        for staff_to_symbols in self.staff_symbols.values():
+            for symbols in staff_to_symbols.values():
+                if not deleted.isdisjoint(symbols):
+                    symbols[:] = [s for s in symbols if s not in deleted]
+
+        for key, group in list(self.overlapping_elements.items()):
+            if deleted.isdisjoint(group):
+                continue
+            remaining = tuple(e for e in group if e not in deleted)
+            if len(remaining) > 1:
+                self.overlapping_elements[key] = remaining
+                self._offset_overlapping_elements(remaining)
+            else:
+                del self.overlapping_elements[key]
+                for element in remaining:
+                    element.x_offset = None
+
+    def _get_staff_symbols_at(
+        self, kind: ComponentKind, staff_index: int, time: float
+    ) -> list[TimelineUIElementWithCollision]:
+        symbols = self.staff_symbols.get(kind, {}).get(staff_index, [])
+        start = bisect.bisect_left(symbols, time, key=lambda e: e.get_data("time"))
+        end = bisect.bisect_right(symbols, time, key=lambda e: e.get_data("time"))
+        return symbols[start:end]
+
+    def get_staff_symbol_by_time(
+        self, kind: ComponentKind, time: float, staff_index: int
+    ) -> TimelineUIElementWithCollision | None:
+        """Returns the last symbol of `kind` in staff that is at or before `time`."""
+        symbols = self.staff_symbols.get(kind, {}).get(staff_index, [])
+        idx = bisect.bisect_right(symbols, time, key=lambda e: e.get_data("time"))
+        return symbols[idx - 1] if idx > 0 else None
 
     def _update_staff_extreme_notes(self, staff_index: int, note: NoteUI) -> None:
         pitch = note.get_data("pitch")
@@ -266,56 +325,18 @@ class ScoreTimelineUI(TimelineUI):
 
         self.staff_heights = staff_heights
 
-    def get_clef_time_cache(self) -> dict[int, dict[tuple[int, int], ClefUI]]:
-        cache = {}
-        all_clefs = self.element_manager.get_elements_by_attribute(
-            "kind", ComponentKind.CLEF
-        )
-        for idx in set([clef.get_data("staff_index") for clef in all_clefs]):
-            clefs_in_staff = [
-                clef for clef in all_clefs if clef.get_data("staff_index") == idx
-            ]
-            cache[idx] = {}
-            prev_clef = clefs_in_staff[0]
-            start_time = prev_clef.get_data("time")
-            for clef in clefs_in_staff[1:]:
-                time = clef.get_data("time")
-                cache[idx][(start_time, time)] = prev_clef
-                start_time = time
-                prev_clef = clef
-
-            cache[idx][(start_time, get(Get.MEDIA_DURATION))] = clefs_in_staff[-1]
-        return cache
-
     def get_clef_by_time(self, time: float, staff_index: int) -> ClefUI | None:
-        if staff_index not in self.clef_time_cache:
+        if time >= get(Get.MEDIA_DURATION):
             return None
-        for start, end in self.clef_time_cache[staff_index].keys():
-            if start <= time < end:
-                return self.clef_time_cache[staff_index][(start, end)]
+        return self.get_staff_symbol_by_time(ComponentKind.CLEF, time, staff_index)
 
     def _get_overlap(
-        self, staff_index: float, time: float, kind: ComponentKind
+        self, staff_index: float, time: float
     ) -> tuple[TimelineUIElementWithCollision]:
-        # Elements will be displayed in the order below
-        overlapping_kinds = [
-            ComponentKind.CLEF,
-            ComponentKind.KEY_SIGNATURE,
-            ComponentKind.TIME_SIGNATURE,
-        ]
-
-        if kind not in overlapping_kinds:
-            return tuple()
-
-        overlapping = [
-            c
-            for c in self
-            if c.kind in overlapping_kinds
-            and c.get_data("time") == time
-            and c.get_data("staff_index") == staff_index
-        ]
         overlapping = tuple(
-            sorted(overlapping, key=lambda c: overlapping_kinds.index(c.kind))
+            symbol
+            for kind in self.STAFF_SYMBOL_KINDS
+            for symbol in self._get_staff_symbols_at(kind, staff_index, time)
         )
         return overlapping if len(overlapping) > 1 else tuple()
 
@@ -341,18 +362,8 @@ class ScoreTimelineUI(TimelineUI):
         for elm in elements:
             elm.x_offset = component_to_offset[elm]
 
-    def _add_to_overlapping_elements(
-        self, group: tuple[TimelineUIElementWithCollision]
-    ):
-        for existing_group in self.overlapping_elements.copy():
-            if any(element in existing_group for element in group):
-                self.overlapping_elements.remove(existing_group)
-                break
-
-        self.overlapping_elements.add(group)
-
     def update_overlapping_elements_offsets(self):
-        for group in self.overlapping_elements:
+        for group in self.overlapping_elements.values():
             self._offset_overlapping_elements(group)
 
     def get_staff_bounding_steps(
@@ -402,7 +413,9 @@ class ScoreTimelineUI(TimelineUI):
         self.update_overlapping_elements_offsets()
 
     def _reset_caches(self):
-        self.clef_time_cache: dict[int, dict[tuple[int, int], ClefUI]] = {}
+        self.staff_symbols: dict[
+            ComponentKind, dict[int, list[TimelineUIElementWithCollision]]
+        ] = {}
         self.staff_cache: dict[int, StaffUI] = {}
         self.staff_y_cache: dict[int, tuple[float, float]] = {}
         self.staff_heights: dict[int, int] = {}
@@ -410,7 +423,10 @@ class ScoreTimelineUI(TimelineUI):
         self.first_bar_line: BarLineUI | None = None
         self.last_bar_line: BarLineUI | None = None
         self._measure_count = 0  # assumes measures can't be deleted
-        self.overlapping_elements = set()
+        # groups of symbols displayed side by side, by (staff index, time)
+        self.overlapping_elements: dict[
+            tuple[int, float], tuple[TimelineUIElementWithCollision, ...]
+        ] = {}
         self.staff_numbers: list[int] = []
         self.staffs_with_symbol = set()
 
@@ -420,6 +436,18 @@ class ScoreTimelineUI(TimelineUI):
         self._reset_caches()
         self.reset_svg()
 
+    def on_score_timeline_svg_create(self, id: int, musicxml: str):
+        if id != self.id:
+            return
+
+        key = svg_cache.get_key(musicxml)
+        if svg_cache.set_timeline_svg(self.id, key):
+            return
+
+        self.svg_cache_key = key
+        self.svg_converter = musicxml_to_svg(self.id)
+        self.svg_converter.to_svg(musicxml)
+
     def on_score_timeline_components_deserialized(self, id: int):
         if id != self.id:
             return
@@ -464,7 +492,8 @@ class ScoreTimelineUI(TimelineUI):
         return (x1 - x0) / self._measure_count
 
     def on_audio_time_change(self, time: float, _) -> None:
-        if self.svg_view.is_svg_loaded:
+        # the viewer scrolls to the selected time when shown
+        if self.svg_view.is_svg_loaded and self.svg_view.isVisible():
             self.svg_view.scroll_to_time(time, False)
 
     def _setup_svg_view(self) -> None:
@@ -482,6 +511,16 @@ class ScoreTimelineUI(TimelineUI):
 
     def update_svg_data(self) -> None:
         self.svg_view.load_svg_data(self.timeline.svg_data)
+        if self.svg_cache_key and self.svg_view.is_svg_loaded:
+            svg_cache.store(
+                self.svg_cache_key,
+                self.timeline.svg_data,
+                self.timeline.get_data("viewer_beat_x"),
+            )
+            self.svg_cache_key = None
+
+    def update_svg_hash(self) -> None:
+        self.update_svg_data()
 
     def reset_svg(self):
         self.svg_view.deleteLater()
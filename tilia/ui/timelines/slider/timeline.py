@@ -160,7 +160,7 @@ class SliderTimelineUI(TimelineUI):
         self.dragging = False
         post(Post.SLIDER_DRAG_END)
 
-    def on_audio_time_change(self, time: float, _: MediaTimeChangeReason) -> None:
+    def on_audio_time_change(self, time: float, reason: MediaTimeChangeReason) -> None:
         def __get_x():
             return self.trough.x() + self.trough_radius
 
@@ -169,7 +169,14 @@ class SliderTimelineUI(TimelineUI):
             self.x = x
             self.set_trough_position()
 
-        if not self.dragging:
+        if self.dragging:
+            return
+
+        if reason == MediaTimeChangeReason.PLAYBACK:
+            # playback times are interpolated by the player, so they are smooth
+            self.x = time_x_converter.get_x_by_time(time)
+            self.set_trough_position()
+        else:
             __set_x(time_x_converter.get_x_by_time(time))
 
     def get_ui_for_component(
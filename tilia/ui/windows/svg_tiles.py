@@ -0,0 +1,180 @@
+"""
+Tiled rasterization of the score SVG.
+
+The score is rendered into fixed-size tiles at the current view scale on a
+worker thread. Rendered tiles are cached as pixmaps and evicted in least
+recently used order, so repaints only have to blit the exposed tiles.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from math import ceil, floor
+
+from PyQt6.QtCore import QObject, QPointF, QRectF, QSizeF, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+TILE_SIZE = 512  # in device pixels
+MAX_TILE_COUNT = 96
+
+
+def get_tile_rect(scale: float, col: int, row: int) -> QRectF:
+    """Rect covered by a tile, in scene coordinates."""
+    size = TILE_SIZE / scale
+    return QRectF(col * size, row * size, size, size)
+
+
+class _TileRenderer:
+    """
+    Renders tiles on the worker thread. QSvgRenderer is not thread-safe,
+    so the worker parses its own copy of the SVG, once per loaded score.
+    """
+
+    def __init__(self):
+        self.renderer = None
+        self.generation = -1
+
+    def render(self, generation: int, data: bytes, scale: float, col: int, row: int):
+        if generation != self.generation:
+            self.renderer = QSvgRenderer(data)
+            self.generation = generation
+
+        image = QImage(TILE_SIZE, TILE_SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(0)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.translate(-col * TILE_SIZE, -row * TILE_SIZE)
+        painter.scale(scale, scale)
+        self.renderer.render(
+            painter, QRectF(QPointF(0, 0), QSizeF(self.renderer.defaultSize()))
+        )
+        painter.end()
+        return image
+
+
+class SvgTileCache(QObject):
+    tile_ready = pyqtSignal(QRectF)
+    _tile_rendered = pyqtSignal(tuple, QImage)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self.tiles: OrderedDict[tuple[int, float, int, int], QPixmap] = OrderedDict()
+        self.pending = set()
+        self.generation = 0
+        self.data = b""
+        self.scale = None
+        self._renderer = _TileRenderer()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)  # keep the worker's parsed SVG around
+        self._tile_rendered.connect(self._on_tile_rendered)
+
+    def load(self, data: bytes) -> None:
+        self._pool.clear()
+        self.generation += 1
+        self.data = data
+        self.tiles.clear()
+        self.pending.clear()
+
+    def set_scale(self, scale: float) -> None:
+        if scale == self.scale:
+            return
+        # tiles queued for the previous scale won't be shown anymore
+        self._pool.clear()
+        self.pending.clear()
+        self.scale = scale
+
+    def get(self, col: int, row: int) -> QPixmap | None:
+        """
+        Returns the tile at the current scale, if it is cached.
+        Otherwise, queues it for rendering and returns None.
+        """
+        key = (self.generation, self.scale, col, row)
+        if (pixmap := self.tiles.get(key)) is not None:
+            self.tiles.move_to_end(key)
+            return pixmap
+
+        if key not in self.pending:
+            self.pending.add(key)
+            data = self.data
+            self._pool.start(lambda: self._render(key, data))
+        return None
+
+    def get_fallbacks(self, rect: QRectF) -> list[tuple[QRectF, QPixmap]]:
+        """Cached tiles of other scales that intersect `rect`."""
+        return [
+            (tile_rect, pixmap)
+            for (generation, scale, col, row), pixmap in self.tiles.items()
+            if generation == self.generation
+            and scale != self.scale
+            and (tile_rect := get_tile_rect(scale, col, row)).intersects(rect)
+        ]
+
+    def _render(self, key: tuple[int, float, int, int], data: bytes) -> None:
+        generation, scale, col, row = key
+        if generation != self.generation:
+            return
+        self._tile_rendered.emit(
+            key, self._renderer.render(generation, data, scale, col, row)
+        )
+
+    def _on_tile_rendered(self, key: tuple[int, float, int, int], image: QImage):
+        self.pending.discard(key)
+        if key[0] != self.generation:
+            return
+
+        self.tiles[key] = QPixmap.fromImage(image)
+        while len(self.tiles) > MAX_TILE_COUNT:
+            self.tiles.popitem(last=False)
+
+        self.tile_ready.emit(get_tile_rect(*key[1:]))
+
+    def stop(self) -> None:
+        self._pool.clear()
+        self._pool.waitForDone()
+
+
+class SvgTileItem(QGraphicsItem):
+    """Draws the score from the tile cache, covering the area of the whole SVG."""
+
+    def __init__(self, renderer: QSvgRenderer, cache: SvgTileCache):
+        super().__init__()
+        self.bounds = QRectF(QPointF(0, 0), QSizeF(renderer.defaultSize()))
+        self.cache = cache
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def boundingRect(self) -> QRectF:
+        return self.bounds
+
+    def paint(self, painter, option, widget=None) -> None:
+        scale = round(
+            QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+                painter.worldTransform()
+            ),
+            3,
+        )
+        if scale <= 0:
+            return
+        self.cache.set_scale(scale)
+
+        exposed = option.exposedRect.intersected(self.bounds)
+        size = TILE_SIZE / scale
+        for col in range(floor(exposed.left() / size), ceil(exposed.right() / size)):
+            for row in range(
+                floor(exposed.top() / size), ceil(exposed.bottom() / size)
+            ):
+                if (pixmap := self.cache.get(col, row)) is not None:
+                    painter.drawPixmap(
+                        get_tile_rect(scale, col, row), pixmap, QRectF(pixmap.rect())
+                    )
+                else:
+                    self._paint_fallbacks(painter, get_tile_rect(scale, col, row))
+
+    def _paint_fallbacks(self, painter: QPainter, rect: QRectF) -> None:
+        painter.save()
+        painter.setClipRect(rect)
+        for tile_rect, pixmap in self.cache.get_fallbacks(rect):
+            painter.drawPixmap(tile_rect, pixmap, QRectF(pixmap.rect()))
+        painter.restore()
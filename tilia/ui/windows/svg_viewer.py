@@ -1,4 +1,3 @@
-# TODO: QThreads
 from __future__ import annotations
 
 from lxml import etree
@@ -10,13 +9,14 @@ from PyQt6.QtCore import (
     Qt,
     QKeyCombination,
     QPointF,
+    QRectF,
 )
-from PyQt6.QtGui import QFont
-from PyQt6.QtSvgWidgets import QGraphicsSvgItem
+from PyQt6.QtGui import QColor, QFont, QPen
 from PyQt6.QtWidgets import (
     QFrame,
     QGraphicsView,
     QGraphicsItem,
+    QGraphicsRectItem,
     QGraphicsScene,
     QGraphicsSimpleTextItem,
     QHBoxLayout,
@@ -29,11 +29,13 @@ from PyQt6.QtSvg import QSvgRenderer
 from tilia.ui.actions import TiliaAction, get_qaction
 
 from tilia.ui.smooth_scroll import smooth, setup_smooth
+from tilia.ui.windows.svg_tiles import SvgTileCache, SvgTileItem
 from tilia.ui.windows.view_window import ViewDockWidget
 from tilia.timelines.component_kinds import ComponentKind
 from tilia.requests import (
     get,
     Get,
+    listen,
     post,
     Post,
     serve,
@@ -54,6 +56,29 @@ class SvgViewer(ViewDockWidget):
 
         self.__setup_score_viewer()
         serve(self, Get.SCORE_VIEWER, self.get_viewer)
+        self._setup_time_lookup_invalidation()
+
+    def _setup_time_lookup_invalidation(self) -> None:
+        for post_, callback in [
+            (Post.TIMELINE_CREATE_DONE, self._invalidate_time_lookup),
+            (Post.TIMELINE_DELETE_DONE, self._invalidate_time_lookup),
+            (Post.TIMELINE_SET_DATA_DONE, self._on_timeline_set_data_done),
+            (Post.TIMELINES_SCALE_DONE, self._invalidate_time_lookup),
+            (Post.TIMELINES_CROP_DONE, self._invalidate_time_lookup),
+            (Post.TIMELINE_COMPONENT_CREATED, self._on_timeline_component_changed),
+            (Post.TIMELINE_COMPONENT_DELETED, self._on_timeline_component_changed),
+            (Post.TIMELINE_COMPONENTS_DELETED, self._on_timeline_component_changed),
+            (Post.TIMELINE_COMPONENT_SET_DATA_DONE, self._on_beat_timeline_changed),
+            (
+                Post.BEAT_TIMELINE_COMPONENTS_DESERIALIZED,
+                self._on_beat_timeline_changed,
+            ),
+            (
+                Post.BEAT_TIMELINE_MEASURE_NUMBER_CHANGE_DONE,
+                self._on_beat_timeline_changed,
+            ),
+        ]:
+            listen(self, post_, callback)
 
     def get_viewer(self, tl_id: int):
         if tl_id == self.timeline_id:
@@ -87,6 +112,9 @@ class SvgViewer(ViewDockWidget):
 
         self.score_root = ""
         self.score_renderer = QSvgRenderer()
+        self.tile_cache = SvgTileCache(self)
+        self.tile_cache.tile_ready.connect(self._on_tile_ready)
+        self.score_tiles = None
         self.tla_annotations = {}
         self.next_tla_id = 0
         self.drag_pos = QPointF()
@@ -94,6 +122,11 @@ class SvgViewer(ViewDockWidget):
         self.is_svg_loaded = False
         self.visible_times = [0, 0]
         self.beat_x_position = {}
+        self._beats = []
+        self._beat_xs = []
+        self._times = None
+        self._time_fractions = []
+        self._beat_timeline_id = None
         self.cur_t_x = 0.0
         self._update_scroll_margins()
 
@@ -132,25 +165,24 @@ class SvgViewer(ViewDockWidget):
                 )
                 return
             else:
-                self.beat_x_position = {
-                    float(beat): float(x) for beat, x in beat_x_pos.items()
-                }
+                self._set_beat_x_position(beat_x_pos)
             self.timeline.save_svg_data(str(etree.tostring(self.score_root), "utf-8"))
         else:
-            self.beat_x_position = {float(beat): float(x) for beat, x in x_pos.items()}
+            self._set_beat_x_position(x_pos)
 
         self.setParent(get(Get.MAIN_WINDOW))
-        self.score_renderer.load(bytearray(etree.tostring(self.score_root)))
+        svg_bytes = etree.tostring(self.score_root)
+        self.score_renderer.load(svg_bytes)
+        self.tile_cache.load(svg_bytes)
         self.is_svg_loaded = True
 
         for item in self.scene.items():
-            if isinstance(item, SvgStaveNote) or isinstance(item, QGraphicsSvgItem):
+            if isinstance(item, SvgStaveNote) or isinstance(item, SvgTileItem):
                 self.scene.removeItem(item)
 
-        bg = QGraphicsSvgItem()
-        bg.setZValue(0)
-        bg.setSharedRenderer(self.score_renderer)
-        self.scene.addItem(bg)
+        self.score_tiles = SvgTileItem(self.score_renderer, self.tile_cache)
+        self.score_tiles.setZValue(0)
+        self.scene.addItem(self.score_tiles)
         self.create_stavenotes(self.score_root)
 
         if not self.isVisible() and not self.is_hidden:
@@ -200,16 +232,20 @@ class SvgViewer(ViewDockWidget):
             else:
                 id = element.attrib.get("id")
                 stavenote = SvgStaveNote(
-                    self.score_renderer, id, self._get_closest_time
+                    self.score_renderer.boundsOnElement(id), self._get_closest_time
                 )
                 self.scene.addItem(stavenote)
                 stavenote.seek_x = x_pos[
                     bisect(x_pos, stavenote.sceneBoundingRect().right()) - 1
                 ]
 
-        x_pos = list(self.beat_x_position.values())
+        x_pos = self._beat_xs
         process(root)
 
+    def _on_tile_ready(self, rect: QRectF) -> None:
+        if self.score_tiles:
+            self.score_tiles.update(rect)
+
     def _get_drag_actions(self) -> dict[str, Callable[[QPointF], None]]:
         def _start_drag(start_pos: QPointF) -> None:
             self.filter_selection(SvgTlaAnnotation)
@@ -377,48 +413,72 @@ class SvgViewer(ViewDockWidget):
             self.save_tla_annotation(item)
         post(Post.APP_RECORD_STATE, "score annotation")
 
+    def _set_beat_x_position(self, beat_x_position: dict) -> None:
+        self.beat_x_position = dict(
+            sorted((float(beat), float(x)) for beat, x in beat_x_position.items())
+        )
+        self._beats = list(self.beat_x_position.keys())
+        self._beat_xs = list(self.beat_x_position.values())
+
+    def _invalidate_time_lookup(self, *_) -> None:
+        self._times = None
+
+    def _on_beat_timeline_changed(self, tl_id: int, *_) -> None:
+        if tl_id == self._beat_timeline_id:
+            self._invalidate_time_lookup()
+
+    def _on_timeline_set_data_done(self, tl_id: int, attr: str, _) -> None:
+        # ordinals decide which beat timeline is used
+        if attr == "ordinal":
+            self._invalidate_time_lookup()
+        elif attr == "beat_pattern":
+            self._on_beat_timeline_changed(tl_id)
+
+    def _on_timeline_component_changed(self, _, tl_id: int, *__) -> None:
+        self._on_beat_timeline_changed(tl_id)
+
+    def _update_time_lookup(self) -> None:
+        beat_tl = get(
+            Get.TIMELINE_COLLECTION
+        ).get_beat_timeline_for_measure_calculation()
+        self._beat_timeline_id = beat_tl.id
+        self._times = list(beat_tl.time_to_metric_fraction.keys())
+        self._time_fractions = list(beat_tl.time_to_metric_fraction.values())
+
+    def _get_beat_from_scene_x(self, x: float) -> float:
+        beats, x_pos = self._beats, self._beat_xs
+        idx = bisect(x_pos, x)
+        if idx == 0 and len(beats) == 0:
+            b0 = 0
+            b1 = 1
+            x0 = self.scene.sceneRect().left()
+            x1 = self.scene.sceneRect().right()
+        elif idx == 0:
+            b0 = 0
+            b1 = beats[0]
+            x0 = self.scene.sceneRect().left()
+            x1 = x_pos[0]
+        elif idx == len(beats):
+            b0 = beats[idx - 1]
+            b1 = round(-(-b0 // 1))
+            x0 = x_pos[idx - 1]
+            x1 = self.scene.sceneRect().right()
+        else:
+            b0 = beats[idx - 1]
+            b1 = beats[idx]
+            x0 = x_pos[idx - 1]
+            x1 = x_pos[idx]
+
+        if x == x0:
+            return b0
+        return b0 + (b1 - b0) * (x - x0) / (x1 - x0)
+
     def _get_time_from_scene_x(self, xs: dict[int, float]) -> dict[int, list[float]]:
         output = {}
         beat_pos = {}
-        beats, x_pos = list(self.beat_x_position.keys()), list(
-            self.beat_x_position.values()
-        )
         for key, x in xs.items():
-            x = round(x, 3)
-            if x in x_pos:
-                idx = x_pos.index(x)
-                beat_pos[key] = ((b := beats[idx]) // 1, b % 1)
-                continue
-
-            idx = bisect(x_pos, x)
-            if idx == 0 and len(beats) == 0:
-                b0 = 0
-                b1 = 1
-                x0 = self.scene.sceneRect().left()
-                x1 = self.scene.sceneRect().right()
-            elif idx == 0:
-                b0 = 0
-                b1 = beats[0]
-                x0 = self.scene.sceneRect().left()
-                x1 = x_pos[0]
-            elif idx == len(beats):
-                b0 = beats[idx - 1]
-                b1 = round(-(-b0 // 1))
-                x0 = x_pos[idx - 1]
-                x1 = self.scene.sceneRect().right()
-            else:
-                b0 = beats[idx - 1]
-                b1 = beats[idx]
-                x0 = x_pos[idx - 1]
-                x1 = x_pos[idx]
-
-            beat = b0 + (b1 - b0) * (x - x0) / (x1 - x0)
+            beat = self._get_beat_from_scene_x(round(x, 3))
             beat_pos[key] = (beat // 1, beat % 1)
-            self.beat_x_position[beat] = x
-
-            self.beat_x_position = {
-                k: self.beat_x_position[k] for k in sorted(self.beat_x_position.keys())
-            }
 
         beat_tl = get(
             Get.TIMELINE_COLLECTION
@@ -435,16 +495,24 @@ class SvgViewer(ViewDockWidget):
 
         return output
 
+    def _get_metric_fraction_from_time(self, time: float) -> float:
+        if self._times is None:
+            self._update_time_lookup()
+        times, fractions = self._times, self._time_fractions
+        idx = bisect(times, time)
+        if idx == 0:
+            if len(times):
+                return fractions[0]
+            return 0
+        if idx == len(times) or fractions[idx] < fractions[idx - 1]:
+            return fractions[idx - 1]
+        return (time - times[idx - 1]) / (times[idx] - times[idx - 1]) * (
+            fractions[idx] - fractions[idx - 1]
+        ) + fractions[idx - 1]
+
     def _get_scene_x_from_time(self, time: float) -> float:
-        beat_tl = get(
-            Get.TIMELINE_COLLECTION
-        ).get_beat_timeline_for_measure_calculation()
-        beat = beat_tl.get_metric_fraction_by_time(time)
-        if x := self.beat_x_position.get(beat):
-            return x
-        beats, x_pos = list(self.beat_x_position.keys()), list(
-            self.beat_x_position.values()
-        )
+        beat = self._get_metric_fraction_from_time(time)
+        beats, x_pos = self._beats, self._beat_xs
         idx = bisect(beats, beat)
         if idx == 0:
             return x_pos[0]
@@ -499,6 +567,7 @@ class SvgViewer(ViewDockWidget):
         self.scroll_offset = self.scroll_margin * 4
 
     def deleteLater(self):
+        self.tile_cache.stop()
         super().deleteLater()
         stop_serving_all(self)
         stop_listening_to_all(self)
@@ -666,30 +735,28 @@ class SvgGraphicsView(QGraphicsView):
             self.update_measure_tracker(start_time, end_time)
 
 
-class SvgStaveNote(QGraphicsSvgItem):
+class SvgStaveNote(QGraphicsRectItem):
+    SELECTED_COLOR = QColor(255, 0, 0, 96)
+
     def __init__(
         self,
-        renderer: QSvgRenderer,
-        id: str,
+        bounds: QRectF,
         get_time: Callable[
             [float], tuple[tuple[float, float], None | tuple[float, float]]
         ],
     ) -> None:
-        super().__init__()
-        self.setSharedRenderer(renderer)
-        self.setElementId(id)
+        super().__init__(0, 0, bounds.width(), bounds.height())
         self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
-        self.setPos(renderer.boundsOnElement(id).topLeft())
+        self.setPen(QPen(Qt.PenStyle.NoPen))
+        self.setPos(bounds.topLeft())
         self.setZValue(1)
         self.seek_x = 0.0
         self.get_time = get_time
 
     def paint(self, painter, option, widget) -> None:
-        super().paint(painter, option, widget)
+        # the note itself is drawn by the score tiles
         if self.isSelected():
-            painter.setRenderHint(painter.RenderHint.Antialiasing, True)
-            painter.setCompositionMode(painter.CompositionMode.CompositionMode_SourceIn)
-            painter.fillRect(self.boundingRect(), Qt.GlobalColor.red)
+            painter.fillRect(self.rect(), self.SELECTED_COLOR)
 
     def mouseDoubleClickEvent(self, event) -> None:
         t0, t1 = self.get_time(self.seek_x)